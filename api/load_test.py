@@ -0,0 +1,206 @@
+"""
+VoiceCraft API Load Test - Concurrent generations on a single worker
+
+This module handles:
+- Serving the API in-process on one uvicorn worker with the stub LLM provider
+- Firing concurrent content requests while probing /health
+- Comparing the workflow pool with a baseline route that runs the workflow
+  on the event loop (how every handler used to work)
+
+Usage:
+    python api/load_test.py --requests 16 --latency 0.5
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+import httpx
+import uvicorn
+from fastapi import FastAPI
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from api import server
+from core.workflow_automation import ContentWorkflow
+
+
+BASELINE_PATH = "/_load_test/inline"
+PROFILE_NAME = "Load Test"
+
+
+# The served app: the baseline route in front of the API, which itself stays untouched
+app = FastAPI()
+
+
+@app.post(BASELINE_PATH, include_in_schema=False)
+async def inline_content(request: server.ContentRequest):
+    """Baseline: the synchronous workflow runs on the event loop"""
+    workflow = ContentWorkflow(request.profile_name or PROFILE_NAME)
+    result = workflow.process_input(input_text=request.input_text, auto_yes=True)
+    return {"success": True, "content": result.get("final_content", "")}
+
+
+app.mount("/", server.app)
+
+
+@contextlib.contextmanager
+def stub_environment(latency: float) -> Iterator[Path]:
+    """Offline stub LLM, no cache, and a scratch working directory for outputs"""
+    overrides = {
+        "VOICECRAFT_LLM_PROVIDER": "stub",
+        "VOICECRAFT_STUB_LATENCY": str(latency),
+        "VOICECRAFT_LLM_CACHE": "0",
+    }
+    saved = {key: os.environ.get(key) for key in list(overrides) + ["VOICECRAFT_DRIFT_DIR"]}
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ.update(overrides, VOICECRAFT_DRIFT_DIR=str(Path(tmp) / "drift"))
+        os.chdir(tmp)
+        # Humanizer prompt of the (profile-less) load test voice
+        prompt_path = Path("data/outputs/load-test-ai-humanizer-prompt.md")
+        prompt_path.parent.mkdir(parents=True)
+        prompt_path.write_text("Rewrite the text so it reads naturally.")
+        try:
+            yield Path(tmp)
+        finally:
+            os.chdir(cwd)
+            for key, value in saved.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+
+
+@contextlib.contextmanager
+def running_server() -> Iterator[str]:
+    """Serve the API and the baseline route on one uvicorn worker in a background thread"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    config = uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning")
+    uvicorn_server = uvicorn.Server(config)
+    thread = threading.Thread(target=uvicorn_server.run, daemon=True)
+    thread.start()
+    while not uvicorn_server.started:
+        if not thread.is_alive():
+            raise RuntimeError("API server failed to start")
+        time.sleep(0.01)
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        uvicorn_server.should_exit = True
+        thread.join()
+
+
+async def run_phase(base_url: str, path: str, requests: int, probe_interval: float = 0.05) -> Dict:
+    """
+    Send concurrent content requests to path while probing /health
+
+    Returns:
+        {"path", "requests", "errors", "wall_time", "request_mean", "request_max",
+         "health_probes", "health_p50", "health_max"} (times in seconds)
+    """
+    request_times = []
+    health_times = []
+    errors = 0
+    done = asyncio.Event()
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=600) as client:
+        async def generate(i):
+            nonlocal errors
+            start = time.perf_counter()
+            response = await client.post(path, json={
+                "input_text": f"Load test topic {i}: why focus beats hustle",
+                "profile_name": PROFILE_NAME
+            })
+            request_times.append(time.perf_counter() - start)
+            if response.status_code != 200:
+                errors += 1
+
+        async def probe():
+            while not done.is_set():
+                start = time.perf_counter()
+                await client.get("/health")
+                health_times.append(time.perf_counter() - start)
+                await asyncio.sleep(probe_interval)
+
+        prober = asyncio.create_task(probe())
+        start = time.perf_counter()
+        await asyncio.gather(*(generate(i) for i in range(requests)))
+        wall_time = time.perf_counter() - start
+        done.set()
+        await prober
+
+    return {
+        "path": path,
+        "requests": requests,
+        "errors": errors,
+        "wall_time": round(wall_time, 3),
+        "request_mean": round(statistics.mean(request_times), 3),
+        "request_max": round(max(request_times), 3),
+        "health_probes": len(health_times),
+        "health_p50": round(statistics.median(health_times), 3),
+        "health_max": round(max(health_times), 3)
+    }
+
+
+def run_load_test(requests: int = 16, latency: float = 0.5, workers: Optional[int] = None) -> Dict:
+    """
+    Compare the inline baseline with the workflow pool on one worker
+
+    Args:
+        requests: Concurrent content requests per phase
+        latency: Simulated seconds per LLM call
+        workers: Workflow pool size (default: VOICECRAFT_WORKFLOW_WORKERS)
+
+    Returns:
+        {"baseline": phase report, "pooled": phase report, "speedup": wall time ratio}
+    """
+    if workers:
+        server.WORKFLOW_WORKERS = workers
+
+    # Workflows print progress; keep the report readable
+    with stub_environment(latency), contextlib.redirect_stdout(io.StringIO()):
+        with running_server() as base_url:
+            baseline = asyncio.run(run_phase(base_url, BASELINE_PATH, requests))
+            pooled = asyncio.run(run_phase(base_url, "/api/v1/content", requests))
+
+    return {
+        "baseline": baseline,
+        "pooled": pooled,
+        "speedup": round(baseline["wall_time"] / pooled["wall_time"], 1)
+    }
+
+
+def print_report(report: Dict):
+    print(f"{'':10} {'wall':>8} {'req mean':>9} {'req max':>8} {'health p50':>11} {'health max':>11} {'probes':>7} {'errors':>7}")
+    for name in ("baseline", "pooled"):
+        phase = report[name]
+        print(
+            f"{name:10} {phase['wall_time']:>7}s {phase['request_mean']:>8}s {phase['request_max']:>7}s "
+            f"{phase['health_p50']:>10}s {phase['health_max']:>10}s {phase['health_probes']:>7} {phase['errors']:>7}"
+        )
+    print(f"\nThroughput: {report['speedup']}x the inline baseline")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test the API with the stub LLM provider")
+    parser.add_argument("--requests", type=int, default=16, help="Concurrent content requests")
+    parser.add_argument("--latency", type=float, default=0.5, help="Simulated seconds per LLM call")
+    parser.add_argument("--workers", type=int, help="Workflow pool size")
+    args = parser.parse_args()
+
+    print(f"🚦 {args.requests} concurrent generations, {args.latency}s per LLM call, one worker\n")
+    print_report(run_load_test(args.requests, args.latency, args.workers))
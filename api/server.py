@@ -13,12 +13,19 @@ The real value: Input from anywhere → World-class content → Auto-published
 
 import os
 import json
+import asyncio
+import threading
+import weakref
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Optional, Dict, List
 from datetime import datetime
 
-from fastapi import FastAPI, HTTPException, Header
+from fastapi import FastAPI, HTTPException, Header, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
 
@@ -30,7 +37,17 @@ if env_path.exists():
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from core.workflow_automation import ContentWorkflow, quick_content
+from core.workflow_pool import get_workflow_pool
+from core.batch_runner import BatchRunner, parse_batch
+from core.job_queue import JobQueue, get_job_queue
+from core.voice_profiler import MissingStyleMetrics
+from core.idempotency import (
+    IdempotencyConflict, IdempotencyInProgress, InflightRequests, get_idempotency_store, request_fingerprint
+)
+
+
+# Upper bound of analysis processes a verify request may ask for (also capped by CPU count)
+VERIFY_MAX_WORKERS = int(os.getenv('VOICECRAFT_VERIFY_MAX_WORKERS', '8'))
 
 
 # API Models
@@ -52,6 +69,8 @@ class WebhookRequest(BaseModel):
     event: str = Field(..., description="Event type: 'content_request', 'voice_note', 'idea'")
     data: Dict = Field(..., description="Event data")
     source: Optional[str] = Field(None, description="Source system (e.g., 'mobile_app', 'zapier')")
+    wait: bool = Field(True, description="Wait for the content; if false, answer with a job id right away")
+    callback_url: Optional[str] = Field(None, description="URL that receives the finished job (when wait is false)")
 
 
 class VoiceNoteRequest(BaseModel):
@@ -63,17 +82,289 @@ class VoiceNoteRequest(BaseModel):
     publish_config: Optional[Dict] = Field(None, description="Publishing configuration")
 
 
+class ContentJobRequest(ContentRequest):
+    """Background content generation request"""
+    callback_url: Optional[str] = Field(None, description="URL that receives the finished job as a JSON POST")
+
+
+class VoiceNoteJobRequest(VoiceNoteRequest):
+    """Background voice note request"""
+    callback_url: Optional[str] = Field(None, description="URL that receives the finished job as a JSON POST")
+
+
 class QuickContentRequest(BaseModel):
     """Quick content request (minimal input)"""
     input_text: str = Field(..., description="Topic or input text")
     profile_name: Optional[str] = Field(None, description="Voice profile name")
 
 
+class VerifyBatchRequest(BaseModel):
+    """Batch voice verification request"""
+    contents: List[str] = Field(..., description="Drafts to score against the profile")
+    workers: Optional[int] = Field(1, ge=1, le=VERIFY_MAX_WORKERS, description="Analysis worker processes")
+
+
+# Workflows are synchronous (LLM calls, file writes, publishing HTTP calls), so
+# they run in a bounded thread pool and the event loop keeps serving requests
+WORKFLOW_WORKERS = int(os.getenv('VOICECRAFT_WORKFLOW_WORKERS', '8'))
+WORKFLOW_QUEUE = int(os.getenv('VOICECRAFT_WORKFLOW_QUEUE', '64'))
+BATCH_MAX_ITEMS = int(os.getenv('VOICECRAFT_BATCH_MAX_ITEMS', '500'))
+
+_workflow_executor = None
+_workflow_pending = 0
+_workflow_lock = threading.Lock()
+
+
+def _get_workflow_executor() -> ThreadPoolExecutor:
+    """Get the worker's workflow thread pool"""
+    global _workflow_executor
+    if _workflow_executor is None:
+        _workflow_executor = ThreadPoolExecutor(max_workers=WORKFLOW_WORKERS, thread_name_prefix="workflow")
+    return _workflow_executor
+
+
+def _reserve_workflow_slots(count: int = 1):
+    """
+    Claim capacity in the workflow pool
+    
+    At most WORKFLOW_WORKERS workflows run at once and WORKFLOW_QUEUE more may
+    wait; beyond that the request is rejected with 503 so callers back off.
+    """
+    global _workflow_pending
+    with _workflow_lock:
+        if _workflow_pending + count > WORKFLOW_WORKERS + WORKFLOW_QUEUE:
+            raise HTTPException(status_code=503, detail="Too many workflows in progress", headers={"Retry-After": "5"})
+        _workflow_pending += count
+
+
+def _release_workflow_slots(count: int = 1):
+    global _workflow_pending
+    with _workflow_lock:
+        _workflow_pending -= count
+
+
+class ReservedSlots(Executor):
+    """
+    Workflow pool slots reserved for a batch, handed back as its items finish
+    
+    Items submitted here run in the workflow pool on the reserved slots.
+    After close(), slots without a running item are freed at once and the
+    others as their items finish, so an abandoned batch keeps no capacity.
+    """
+    
+    def __init__(self, count: int):
+        _reserve_workflow_slots(count)     # 503 when the pool can't take them
+        self.held = count
+        self.running = 0
+        self.closed = False
+        self._lock = threading.Lock()
+    
+    def submit(self, fn: Callable, /, *args, **kwargs) -> Future:
+        with self._lock:
+            self.running += 1
+        try:
+            future = _get_workflow_executor().submit(fn, *args, **kwargs)
+        except BaseException:
+            self._item_done(None)
+            raise
+        future.add_done_callback(self._item_done)
+        return future
+    
+    def close(self):
+        """Free the slots of the batch (safe to call more than once)"""
+        with self._lock:
+            if self.closed:
+                return
+            self.closed = True
+            free = max(0, self.held - self.running)
+            self.held -= free
+        _release_workflow_slots(free)
+    
+    def _item_done(self, future):
+        with self._lock:
+            self.running -= 1
+            free = 1 if self.closed and self.held > self.running else 0
+            self.held -= free
+        if free:
+            _release_workflow_slots(free)
+
+
+def _submit_workflow(func: Callable) -> Future:
+    """Reserve a slot and run func in the workflow pool; the slot is freed when func finishes"""
+    _reserve_workflow_slots()
+    try:
+        future = _get_workflow_executor().submit(func)
+    except BaseException:
+        _release_workflow_slots()
+        raise
+    future.add_done_callback(lambda _: _release_workflow_slots())
+    return future
+
+
+async def run_workflow(func: Callable, *args, **kwargs) -> Any:
+    """
+    Run a blocking call in the workflow pool without blocking the event loop
+    
+    Rejected with 503 when the pool and its queue are full. A call keeps its
+    slot until it finishes, even if the client disconnects.
+    """
+    return await asyncio.wrap_future(_submit_workflow(partial(func, *args, **kwargs)))
+
+
+def stream_workflow(iterate: Callable[[], Iterator]) -> AsyncIterator:
+    """
+    Run a blocking generator in the workflow pool, yielding its items on the event loop
+    
+    The slot is reserved right away (503 when the pool is full) and held
+    while the generator runs. If the client goes away, the generator is
+    closed after its next item.
+    
+    Args:
+        iterate: Creates the generator (called in the pool thread)
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    finished = object()
+    stop = threading.Event()
+    
+    def produce():
+        items = iterate()
+        try:
+            for item in items:
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+                if stop.is_set():
+                    break
+        finally:
+            if hasattr(items, "close"):
+                items.close()
+            loop.call_soon_threadsafe(queue.put_nowait, finished)
+    
+    future = _submit_workflow(produce)
+    
+    async def items():
+        try:
+            while True:
+                item = await queue.get()
+                if item is finished:
+                    break
+                yield item
+            await asyncio.wrap_future(future)
+        finally:
+            stop.set()
+    
+    return items()
+
+
+def workflow_stats() -> Dict:
+    """Running and queued workflows of this worker"""
+    pending = _workflow_pending
+    return {
+        "workers": WORKFLOW_WORKERS,
+        "running": min(pending, WORKFLOW_WORKERS),
+        "queued": max(pending - WORKFLOW_WORKERS, 0),
+        "max_queued": WORKFLOW_QUEUE,
+        "pool": get_workflow_pool().stats(),
+        "deduplication": {**_inflight_requests.stats(), "idempotency": get_idempotency_store().stats()}
+    }
+
+
+# Retries, redeliveries and double-taps of the same request share one execution
+_inflight_requests = InflightRequests()
+
+# How long a request waits for the same Idempotency-Key running elsewhere before 409
+IDEMPOTENCY_WAIT = float(os.getenv('VOICECRAFT_IDEMPOTENCY_WAIT', '30'))
+
+
+async def deduplicated(
+    endpoint: str,
+    payload: Dict,
+    idempotency_key: Optional[str],
+    call: Callable[[], Awaitable],
+    status_code: int = 200
+) -> Any:
+    """
+    Run a request once, however often it is sent
+    
+    Identical requests (same endpoint and payload) in flight share one
+    execution and its result. With an Idempotency-Key, the key is reserved
+    in the shared store before the request runs: a duplicate in any worker
+    process waits up to VOICECRAFT_IDEMPOTENCY_WAIT seconds for the response
+    and gets 409 after that. A successful response is stored and replayed
+    for VOICECRAFT_IDEMPOTENCY_TTL seconds; on errors the reservation is
+    dropped, so retrying a failed request with the same key runs it again.
+    
+    Args:
+        endpoint: Name of the endpoint (part of the fingerprint)
+        payload: Everything that determines the response (with defaults resolved)
+        idempotency_key: Client-chosen key from the Idempotency-Key header
+        call: Produces the response (a dict or a JSONResponse)
+        status_code: Status of a plain dict response
+    """
+    fingerprint = request_fingerprint(endpoint, payload)
+    if not idempotency_key:
+        return _own_response(await _inflight_requests.run(fingerprint, call))
+    
+    # Store calls may wait on SQLite locks held by other workers: keep them off the event loop
+    store = await asyncio.to_thread(get_idempotency_store)
+    deadline = asyncio.get_running_loop().time() + IDEMPOTENCY_WAIT
+    while True:
+        try:
+            stored = await asyncio.to_thread(store.reserve, idempotency_key, fingerprint)
+            break
+        except IdempotencyConflict as e:
+            raise HTTPException(status_code=422, detail=str(e))
+        except IdempotencyInProgress as e:
+            if asyncio.get_running_loop().time() >= deadline:
+                raise HTTPException(status_code=409, detail=str(e), headers={"Retry-After": "5"})
+            await asyncio.sleep(0.2)
+    if stored is not None:
+        return JSONResponse(
+            status_code=stored["status"], content=stored["response"], headers={"Idempotent-Replayed": "true"}
+        )
+    
+    async def run_and_store():
+        try:
+            response = await _inflight_requests.run(fingerprint, call)
+        except BaseException:
+            await asyncio.to_thread(store.release, idempotency_key, fingerprint)
+            raise
+        if isinstance(response, JSONResponse):
+            await asyncio.to_thread(store.put, idempotency_key, fingerprint, response.status_code, json.loads(response.body))
+        else:
+            await asyncio.to_thread(store.put, idempotency_key, fingerprint, status_code, response)
+        return response
+    
+    # Shielded: the key is stored (or released) even if this client goes away
+    return _own_response(await asyncio.shield(asyncio.ensure_future(run_and_store())))
+
+
+def _own_response(response: Any) -> Any:
+    """Each caller gets its own copy of a shared JSONResponse"""
+    if isinstance(response, JSONResponse):
+        return JSONResponse(status_code=response.status_code, content=json.loads(response.body))
+    return response
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Resume background jobs interrupted by the last shutdown
+    _jobs().start()
+    yield
+    # Running jobs that don't finish are requeued on the next start
+    _jobs().shutdown(wait=False)
+    # Let in-flight workflows finish, drop queued ones
+    global _workflow_executor
+    if _workflow_executor is not None:
+        _workflow_executor.shutdown(wait=True, cancel_futures=True)
+        _workflow_executor = None
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="VoiceCraft API",
     description="AI-powered content generation with Style Fusion Technology",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS middleware for mobile/web access
@@ -96,9 +387,11 @@ async def root():
         "version": "1.0.0",
         "endpoints": {
             "content": "/api/v1/content",
+            "batch": "/api/v1/content/batch",
             "quick": "/api/v1/quick",
             "voice-note": "/api/v1/voice-note",
-            "webhook": "/api/v1/webhook"
+            "webhook": "/api/v1/webhook",
+            "jobs": "/api/v1/jobs"
         }
     }
 
@@ -106,12 +399,14 @@ async def root():
 @app.get("/health")
 async def health():
     """Health check endpoint"""
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    # The stats read the idempotency store, which may be waiting on another worker's SQLite lock
+    workflows = await asyncio.to_thread(workflow_stats)
+    return {"status": "healthy", "timestamp": datetime.now().isoformat(), "workflows": workflows}
 
 
 # Main content generation endpoint
 @app.post("/api/v1/content")
-async def create_content(request: ContentRequest):
+async def create_content(request: ContentRequest, idempotency_key: Optional[str] = Header(None)):
     """
     Generate content from any input type
     
@@ -122,54 +417,216 @@ async def create_content(request: ContentRequest):
     - WhatsApp: Formatted chat export
     
     Auto-detects input type and output format if not specified.
+    Send an Idempotency-Key header to make retries safe.
     """
     try:
-        # Get profile name (from request, env, or default)
-        profile_name = request.profile_name or os.getenv('VOICECRAFT_PROFILE', 'Max Bernstein')
-        
-        # Initialize workflow
-        workflow = ContentWorkflow(profile_name)
-        
-        # Convert style_influences from List[Dict] to List[tuple] if provided
-        style_influences = None
-        if request.style_influences:
-            style_influences = [
-                (inf['name'], inf['weight']) 
-                for inf in request.style_influences
-            ]
-        
-        # Process input
-        result = workflow.process_input(
-            input_text=request.input_text,
-            input_type=request.input_type,
-            output_format=request.output_format,
-            target_length=request.target_length,
-            style_influences=style_influences,
-            auto_humanize=request.auto_humanize,
-            auto_publish=request.auto_publish,
-            publish_config=request.publish_config,
-            auto_yes=True  # Skip prompts in API mode
+        return await deduplicated(
+            "content", _with_profile(request.model_dump()), idempotency_key,
+            lambda: run_workflow(_run_content, request)
         )
-        
-        return {
-            "success": True,
-            "content": result.get("final_content", ""),
-            "metadata": {
-                "input_type": result.get("input_type"),
-                "output_format": result.get("output_format"),
-                "output_path": str(result.get("output_path", "")),
-                "publish_result": result.get("publish_result"),
-                "timestamp": result.get("timestamp")
-            }
-        }
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _run_content(request: ContentRequest, on_step=None) -> Dict:
+    """Run the content workflow for a request (blocking) and build the response"""
+    # Get profile name (from request, env, or default)
+    profile_name = request.profile_name or os.getenv('VOICECRAFT_PROFILE', 'Max Bernstein')
+    
+    # Convert style_influences from List[Dict] to List[tuple] if provided
+    style_influences = None
+    if request.style_influences:
+        style_influences = [
+            (inf['name'], inf['weight']) 
+            for inf in request.style_influences
+        ]
+    
+    # Warmed per-profile workflow, shared across requests
+    workflow = get_workflow_pool().get(profile_name)
+    result = workflow.process_input(
+        input_text=request.input_text,
+        input_type=request.input_type,
+        output_format=request.output_format,
+        target_length=request.target_length,
+        style_influences=style_influences,
+        auto_humanize=request.auto_humanize,
+        auto_publish=request.auto_publish,
+        publish_config=request.publish_config,
+        auto_yes=True,  # Skip prompts in API mode
+        on_step=on_step
+    )
+    return _content_response(result)
+
+
+def _with_profile(payload: Dict) -> Dict:
+    """Request payload with the effective profile name (for fingerprints)"""
+    return {**payload, "profile_name": payload.get("profile_name") or os.getenv('VOICECRAFT_PROFILE', 'Max Bernstein')}
+
+
+def _content_response(result: Dict) -> Dict:
+    """API response of a finished content workflow"""
+    return {
+        "success": True,
+        "content": result.get("final_content", ""),
+        "metadata": {
+            "input_type": result.get("input_type"),
+            "output_format": result.get("output_format"),
+            "output_path": str(result.get("output_path", "")),
+            "publish_result": result.get("publish_result"),
+            "timestamp": result.get("timestamp")
+        }
+    }
+
+
+def _run_voice_note(request: VoiceNoteRequest, on_step=None) -> Dict:
+    """Run the voice note workflow for a request (blocking) and build the response"""
+    profile_name = request.profile_name or os.getenv('VOICECRAFT_PROFILE', 'Max Bernstein')
+    
+    workflow = get_workflow_pool().get(profile_name)
+    result = workflow.process_input(
+        input_text=request.transcript,
+        input_type="voice_note",
+        output_format=request.output_format,
+        auto_humanize=True,
+        auto_publish=request.auto_publish,
+        publish_config=request.publish_config,
+        auto_yes=True,
+        on_step=on_step
+    )
+    
+    return {
+        "success": True,
+        "content": result.get("final_content", ""),
+        "metadata": {
+            "output_format": result.get("output_format"),
+            "output_path": str(result.get("output_path", "")),
+            "publish_result": result.get("publish_result"),
+            "timestamp": result.get("timestamp")
+        }
+    }
+
+
+def _sse_event(event: str, data: Dict) -> str:
+    """Format one Server-Sent Event"""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+# Streaming content generation (Server-Sent Events)
+@app.post("/api/v1/content/stream")
+async def create_content_stream(request: ContentRequest):
+    """
+    Generate content, streaming text as it is written
+    
+    Same request body as /api/v1/content. The response is text/event-stream:
+    
+    - start: detected input type and output format
+    - chunk: {"text": "..."} as the model writes (many)
+    - generated: the complete draft and its metadata
+    - complete: humanized final content and metadata, after saving/publishing
+    - error: {"detail": "..."} if any stage fails
+    """
+    profile_name = request.profile_name or os.getenv('VOICECRAFT_PROFILE', 'Max Bernstein')
+    
+    style_influences = None
+    if request.style_influences:
+        style_influences = [
+            (inf['name'], inf['weight']) 
+            for inf in request.style_influences
+        ]
+    
+    def events():
+        # Runs in the workflow pool (see stream_workflow), off the event loop
+        try:
+            workflow = get_workflow_pool().get(profile_name)
+            for event in workflow.process_input_stream(
+                input_text=request.input_text,
+                input_type=request.input_type,
+                output_format=request.output_format,
+                target_length=request.target_length,
+                style_influences=style_influences,
+                auto_humanize=request.auto_humanize,
+                auto_publish=request.auto_publish,
+                publish_config=request.publish_config
+            ):
+                if event["event"] == "complete":
+                    yield _sse_event("complete", _content_response(event["data"]))
+                else:
+                    yield _sse_event(event["event"], event["data"])
+        except Exception as e:
+            yield _sse_event("error", {"success": False, "detail": str(e)})
+    
+    return StreamingResponse(
+        stream_workflow(events),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+# Bulk content generation (NDJSON stream of results)
+@app.post("/api/v1/content/batch")
+async def create_content_batch(request: Request, workers: int = 4, profile_name: Optional[str] = None):
+    """
+    Generate content for many inputs in one call
+    
+    Body (by Content-Type):
+    - application/json: {"items": [{"input_text": "...", "output_format": "linkedin"}, ...]}
+    - application/x-ndjson: one item (object or plain string) per line
+    - text/csv: header row with input_text (or topic) plus optional columns
+    
+    Identical inputs run once. Up to `workers` items (capped at the workflow
+    pool size) run at once, in the shared workflow pool; 503 when it can't
+    take that many. The response is application/x-ndjson: one "result" line
+    per unique input as it finishes, then a "summary" line with throughput
+    and failures.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    body = (await request.body()).decode("utf-8")
+    try:
+        if content_type == "text/csv":
+            items = parse_batch(body, "csv")
+        elif content_type in ("application/x-ndjson", "application/jsonl", "text/plain"):
+            items = parse_batch(body, "jsonl")
+        else:
+            payload = json.loads(body or "{}")
+            lines = "\n".join(json.dumps(item) for item in payload.get("items", []))
+            items = parse_batch(lines, "jsonl")
+    except (ValueError, AttributeError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    if not items:
+        raise HTTPException(status_code=400, detail="No inputs in the batch")
+    if len(items) > BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=413, detail=f"Batch too large: {len(items)} items (max {BATCH_MAX_ITEMS})")
+    
+    workers = min(max(workers, 1), WORKFLOW_WORKERS, len(items))
+    slots = ReservedSlots(workers)
+    runner = BatchRunner(
+        workers=workers,
+        default_profile=profile_name or os.getenv('VOICECRAFT_PROFILE', 'Max Bernstein'),
+        executor=slots
+    )
+    
+    def lines():
+        # Sync generator: Starlette iterates it in a worker thread, off the event loop;
+        # the items themselves run in the workflow pool, on the reserved slots
+        try:
+            for event in runner.run(items):
+                yield json.dumps(event, default=str) + "\n"
+        finally:
+            slots.close()
+    
+    body = lines()
+    # A body that never starts (client gone before the response) never runs its finally
+    weakref.finalize(body, slots.close)
+    return StreamingResponse(body, media_type="application/x-ndjson")
+
+
 # Quick content endpoint (ultra-low friction)
 @app.post("/api/v1/quick")
-async def quick_content_endpoint(request: QuickContentRequest):
+async def quick_content_endpoint(request: QuickContentRequest, idempotency_key: Optional[str] = Header(None)):
     """
     Quick content generation - minimal input, maximum automation
     
@@ -179,64 +636,55 @@ async def quick_content_endpoint(request: QuickContentRequest):
     try:
         profile_name = request.profile_name or os.getenv('VOICECRAFT_PROFILE', 'Max Bernstein')
         
-        # Use quick_content for maximum automation
-        content = quick_content(
-            input_text=request.input_text,
-            profile_name=profile_name,
-            auto_yes=True
-        )
+        async def quick():
+            # Auto-detect everything and humanize for maximum automation
+            result = await run_workflow(
+                lambda: get_workflow_pool().get(profile_name).process_input(
+                    input_text=request.input_text,
+                    auto_yes=True
+                )
+            )
+            return {
+                "success": True,
+                "content": result["final_content"],
+                "timestamp": datetime.now().isoformat()
+            }
         
-        return {
-            "success": True,
-            "content": content,
-            "timestamp": datetime.now().isoformat()
-        }
+        return await deduplicated("quick", _with_profile(request.model_dump()), idempotency_key, quick)
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 # Voice note endpoint
 @app.post("/api/v1/voice-note")
-async def process_voice_note(request: VoiceNoteRequest):
+async def process_voice_note(request: VoiceNoteRequest, idempotency_key: Optional[str] = Header(None)):
     """
     Process voice note transcript into content
     
     Optimized for voice note inputs with automatic cleanup and formatting.
     """
     try:
-        profile_name = request.profile_name or os.getenv('VOICECRAFT_PROFILE', 'Max Bernstein')
-        
-        workflow = ContentWorkflow(profile_name)
-        
-        result = workflow.process_input(
-            input_text=request.transcript,
-            input_type="voice_note",
-            output_format=request.output_format,
-            auto_humanize=True,
-            auto_publish=request.auto_publish,
-            publish_config=request.publish_config,
-            auto_yes=True
+        return await deduplicated(
+            "voice_note", _with_profile(request.model_dump()), idempotency_key,
+            lambda: run_workflow(_run_voice_note, request)
         )
-        
-        return {
-            "success": True,
-            "content": result.get("final_content", ""),
-            "metadata": {
-                "output_format": result.get("output_format"),
-                "output_path": str(result.get("output_path", "")),
-                "publish_result": result.get("publish_result"),
-                "timestamp": result.get("timestamp")
-            }
-        }
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 # Webhook endpoint for external integrations
 @app.post("/api/v1/webhook")
-async def webhook(request: WebhookRequest, x_api_key: Optional[str] = Header(None)):
+async def webhook(
+    request: WebhookRequest,
+    x_api_key: Optional[str] = Header(None),
+    idempotency_key: Optional[str] = Header(None)
+):
     """
     Webhook endpoint for external integrations
     
@@ -247,66 +695,167 @@ async def webhook(request: WebhookRequest, x_api_key: Optional[str] = Header(Non
     - Mobile apps
     
     Requires API key in header: X-API-Key
+    
+    Redeliveries are safe: send an Idempotency-Key header (e.g. the Zap's
+    delivery id) and the same event is only processed once.
     """
     # TODO: Add API key validation
     # if x_api_key != os.getenv('VOICECRAFT_API_KEY'):
     #     raise HTTPException(status_code=401, detail="Invalid API key")
     
     try:
-        event_type = request.event
-        data = request.data
-        
-        profile_name = data.get('profile_name') or os.getenv('VOICECRAFT_PROFILE', 'Max Bernstein')
-        workflow = ContentWorkflow(profile_name)
-        
-        # Handle different event types
+        profile_name = request.data.get('profile_name') or os.getenv('VOICECRAFT_PROFILE', 'Max Bernstein')
+        payload = {**request.model_dump(exclude={"source"}), "profile_name": profile_name}
+        return await deduplicated("webhook", payload, idempotency_key, lambda: _handle_webhook(request, profile_name))
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+async def _handle_webhook(request: WebhookRequest, profile_name: str):
+    """Process one webhook event"""
+    event_type = request.event
+    data = request.data
+    
+    # Answer right away with a job id (e.g. Zapier/Make.com time out after ~30s)
+    if not request.wait:
         if event_type == "content_request":
-            input_text = data.get('input_text', '')
-            result = workflow.process_input(
-                input_text=input_text,
-                input_type=data.get('input_type'),
-                output_format=data.get('output_format'),
-                auto_humanize=True,
-                auto_publish=data.get('auto_publish', False),
-                publish_config=data.get('publish_config'),
-                auto_yes=True
-            )
-            
-            return {
-                "success": True,
-                "event": event_type,
-                "result": {
-                    "content": result.get("final_content", ""),
-                    "output_path": str(result.get("output_path", "")),
-                    "publish_result": result.get("publish_result")
-                }
-            }
-        
+            job = _jobs().submit("content", {
+                "input_text": data.get('input_text', ''),
+                "profile_name": profile_name,
+                "input_type": data.get('input_type'),
+                "output_format": data.get('output_format'),
+                "auto_publish": data.get('auto_publish', False),
+                "publish_config": data.get('publish_config')
+            }, callback_url=request.callback_url)
         elif event_type == "voice_note":
-            transcript = data.get('transcript', '')
-            result = workflow.process_input(
-                input_text=transcript,
-                input_type="voice_note",
-                auto_humanize=True,
-                auto_publish=data.get('auto_publish', False),
-                publish_config=data.get('publish_config'),
-                auto_yes=True
-            )
-            
-            return {
-                "success": True,
-                "event": event_type,
-                "result": {
-                    "content": result.get("final_content", ""),
-                    "output_path": str(result.get("output_path", ""))
-                }
-            }
-        
+            job = _jobs().submit("voice_note", {
+                "transcript": data.get('transcript', ''),
+                "profile_name": profile_name,
+                "auto_publish": data.get('auto_publish', False),
+                "publish_config": data.get('publish_config')
+            }, callback_url=request.callback_url)
         else:
             raise HTTPException(status_code=400, detail=f"Unknown event type: {event_type}")
+        return JSONResponse(status_code=202, content={"success": True, "event": event_type, **_job_accepted(job)})
     
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    def process_input(**kwargs):
+        return get_workflow_pool().get(profile_name).process_input(**kwargs)
+    
+    # Handle different event types
+    if event_type == "content_request":
+        input_text = data.get('input_text', '')
+        result = await run_workflow(
+            process_input,
+            input_text=input_text,
+            input_type=data.get('input_type'),
+            output_format=data.get('output_format'),
+            auto_humanize=True,
+            auto_publish=data.get('auto_publish', False),
+            publish_config=data.get('publish_config'),
+            auto_yes=True
+        )
+        
+        return {
+            "success": True,
+            "event": event_type,
+            "result": {
+                "content": result.get("final_content", ""),
+                "output_path": str(result.get("output_path", "")),
+                "publish_result": result.get("publish_result")
+            }
+        }
+    
+    elif event_type == "voice_note":
+        transcript = data.get('transcript', '')
+        result = await run_workflow(
+            process_input,
+            input_text=transcript,
+            input_type="voice_note",
+            auto_humanize=True,
+            auto_publish=data.get('auto_publish', False),
+            publish_config=data.get('publish_config'),
+            auto_yes=True
+        )
+        
+        return {
+            "success": True,
+            "event": event_type,
+            "result": {
+                "content": result.get("final_content", ""),
+                "output_path": str(result.get("output_path", ""))
+            }
+        }
+    
+    else:
+        raise HTTPException(status_code=400, detail=f"Unknown event type: {event_type}")
+
+
+def _jobs() -> JobQueue:
+    """The worker's job queue with the API's job kinds registered"""
+    queue = get_job_queue()
+    if "content" not in queue.handlers:
+        queue.register("content", lambda params, report: _run_content(ContentRequest(**params), report))
+        queue.register("voice_note", lambda params, report: _run_voice_note(VoiceNoteRequest(**params), report))
+    return queue
+
+
+def _job_accepted(job: Dict) -> Dict:
+    return {"job_id": job["id"], "status": job["status"], "status_url": f"/api/v1/jobs/{job['id']}"}
+
+
+# Background jobs (submit, then poll or receive a callback)
+@app.post("/api/v1/jobs", status_code=202)
+async def submit_content_job(request: ContentJobRequest, idempotency_key: Optional[str] = Header(None)):
+    """
+    Queue content generation and return a job id immediately
+    
+    Same body as /api/v1/content plus an optional callback_url, which
+    receives the finished job (status, steps, result or error) as a JSON POST.
+    Poll /api/v1/jobs/{job_id} for status and step-level progress.
+    Resubmitting with the same Idempotency-Key returns the original job.
+    """
+    async def submit():
+        params = request.model_dump(exclude={"callback_url"})
+        job = _jobs().submit("content", params, callback_url=request.callback_url)
+        return {"success": True, **_job_accepted(job)}
+    
+    return await deduplicated("jobs", _with_profile(request.model_dump()), idempotency_key, submit, status_code=202)
+
+
+@app.post("/api/v1/jobs/voice-note", status_code=202)
+async def submit_voice_note_job(request: VoiceNoteJobRequest, idempotency_key: Optional[str] = Header(None)):
+    """Queue voice note processing and return a job id immediately"""
+    async def submit():
+        params = request.model_dump(exclude={"callback_url"})
+        job = _jobs().submit("voice_note", params, callback_url=request.callback_url)
+        return {"success": True, **_job_accepted(job)}
+    
+    return await deduplicated(
+        "jobs/voice_note", _with_profile(request.model_dump()), idempotency_key, submit, status_code=202
+    )
+
+
+@app.get("/api/v1/jobs")
+async def list_jobs(status: Optional[str] = None, limit: int = 50):
+    """Most recent jobs (optionally only one status: queued, running, succeeded, failed)"""
+    queue = _jobs()
+    return {
+        "success": True,
+        "jobs": queue.list(status=status, limit=limit),
+        "counts": queue.stats()
+    }
+
+
+@app.get("/api/v1/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Job status, step-level progress, and the result once it succeeded"""
+    job = _jobs().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return {"success": True, "job": job}
 
 
 # List available profiles
@@ -316,18 +865,93 @@ async def list_profiles():
     try:
         from core.voice_profiler import VoiceProfiler
         
-        profiler = VoiceProfiler()
-        profiles = profiler.list_profiles()
+        profiles = await run_workflow(lambda: VoiceProfiler().list_profiles())
         
         return {
             "success": True,
             "profiles": profiles
         }
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Score many drafts against one voice
+@app.post("/api/v1/profiles/{name}/verify")
+async def verify_drafts(name: str, request: VerifyBatchRequest):
+    """Verify a batch of drafts against a voice profile"""
+    try:
+        from core.voice_profiler import VoiceProfiler
+        
+        # Analysis starts processes; never more than this host has CPUs
+        workers = min(request.workers or 1, os.cpu_count() or 1)
+        report = await run_workflow(
+            lambda: VoiceProfiler().verify_batch(name, request.contents, workers=workers)
+        )
+        
+        return {
+            "success": True,
+            "profile": name,
+            **report
+        }
+    
+    except HTTPException:
+        raise
+    except MissingStyleMetrics as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# Voice drift of generated content
+@app.get("/api/v1/profiles/{name}/drift")
+async def profile_drift(name: str):
+    """Rolling drift statistics of content generated in a voice"""
+    try:
+        from core.drift_monitor import get_drift_monitor
+        
+        return {
+            "success": True,
+            "drift": await run_workflow(get_drift_monitor().report, name)
+        }
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# LLM gateway and response cache statistics
+@app.get("/api/v1/llm/stats")
+async def llm_stats():
+    """Per-provider call counts and LLM response cache hit rate of this worker"""
+    from core.llm_gateway import get_llm_gateway
+    from core.llm_cache import get_llm_cache
+    
+    cache = get_llm_cache()
+    return {
+        "success": True,
+        "providers": get_llm_gateway().stats(),
+        "cache": cache.stats() if cache else None
+    }
+
+
+# Profile cache statistics
+@app.get("/api/v1/profiles/cache")
+async def profile_cache_stats():
+    """Hit/miss statistics of this worker's profile cache"""
+    from core.profile_cache import get_profile_cache
+    
+    return {
+        "success": True,
+        "cache": get_profile_cache().stats()
+    }
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -66,8 +66,12 @@ def profile():
 @click.option("--samples", required=True, help="Path to sample files (glob pattern)")
 @click.option("--description", help="Profile description")
 @click.option("--tags", help="Comma-separated tags")
+@click.option("--workers", default=1, help="Analysis worker processes (default: 1)")
+@click.option("--power-words", help="Comma-separated domain power words to add to the lexicon")
+@click.option("--urgency-words", help="Comma-separated domain urgency words to add to the lexicon")
+@click.option("--confidence-words", help="Comma-separated domain confidence words to add to the lexicon")
 @click.pass_context
-def create_profile(ctx, name, samples, description, tags):
+def create_profile(ctx, name, samples, description, tags, workers, power_words, urgency_words, confidence_words):
     """Create a new voice profile from content samples"""
     console.print(f"\n[bold cyan]Creating voice profile for: {name}[/bold cyan]\n")
     
@@ -79,36 +83,50 @@ def create_profile(ctx, name, samples, description, tags):
     
     console.print(f"Found {len(sample_files)} sample file(s)")
     
-    # Read content
-    content_samples = []
+    profiler = VoiceProfiler()
+    tag_list = tags.split(",") if tags else None
+    lexicons = {
+        category: words.split(",")
+        for category, words in (
+            ("power_words", power_words),
+            ("urgency_words", urgency_words),
+            ("confidence_words", confidence_words)
+        )
+        if words
+    }
+    
+    # Stream samples into the analyzer one file at a time (bounded memory)
     with Progress() as progress:
-        task = progress.add_task("[cyan]Reading samples...", total=len(sample_files))
+        task = progress.add_task("[cyan]Analyzing samples...", total=len(sample_files))
         
-        for file_path in sample_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    content_samples.append(content)
+        def read_samples():
+            for file_path in sample_files:
+                try:
+                    with open(file_path, 'r', encoding='utf-8') as f:
+                        content = f.read()
+                except Exception as e:
+                    console.print(f"[yellow]Warning: Could not read {file_path}: {e}[/yellow]")
+                    continue
+                finally:
                     progress.update(task, advance=1)
-            except Exception as e:
-                console.print(f"[yellow]Warning: Could not read {file_path}: {e}[/yellow]")
+                yield content
+        
+        try:
+            profile = profiler.create_profile(
+                name=name,
+                content_samples=read_samples(),
+                description=description,
+                tags=tag_list,
+                workers=workers,
+                lexicons=lexicons
+            )
+        except ValueError:
+            profile = None
     
-    if not content_samples:
+    if not profile:
         console.print("[red]No valid content found[/red]")
         return
     
-    # Create profile
-    profiler = VoiceProfiler()
-    tag_list = tags.split(",") if tags else None
-    
-    with console.status("[bold green]Analyzing writing style..."):
-        profile = profiler.create_profile(
-            name=name,
-            content_samples=content_samples,
-            description=description,
-            tags=tag_list
-        )
-    
     # Display results
     console.print("\n[bold green]✓ Profile created successfully![/bold green]\n")
     
@@ -173,6 +191,180 @@ def show_profile(name):
     console.print(Panel(json.dumps(profile, indent=2), title="Complete Profile"))
 
 
+@profile.command("delete")
+@click.argument("name")
+@click.pass_context
+def delete_profile(ctx, name):
+    """Delete a voice profile"""
+    if not ctx.obj.get('yes') and not click.confirm(f"Delete voice profile '{name}'?"):
+        return
+    
+    profiler = VoiceProfiler()
+    if profiler.delete_profile(name):
+        console.print(f"[green]✓ Deleted profile '{name}'[/green]")
+    else:
+        console.print(f"[red]Profile '{name}' not found[/red]")
+
+
+@profile.command("nearest")
+@click.option("--input", "input_file", help="Text file to match against stored voices")
+@click.option("--profile", "profile_name", help="Find voices closest to this profile instead")
+@click.option("--top", default=5, help="Number of voices to show")
+def nearest_profiles(input_file, profile_name, top):
+    """Find the stored voices closest to a draft or profile"""
+    profiler = VoiceProfiler()
+    
+    try:
+        if profile_name:
+            results = profiler.nearest_to_profile(profile_name, k=top)
+        elif input_file:
+            with open(input_file, 'r', encoding='utf-8') as f:
+                results = profiler.nearest_voices(f.read(), k=top)
+        else:
+            console.print("[red]Provide --input or --profile[/red]")
+            return
+    except (OSError, ValueError) as e:
+        console.print(f"[red]{e}[/red]")
+        return
+    
+    if not results:
+        console.print("[yellow]No other voice profiles to compare against[/yellow]")
+        return
+    
+    table = Table(title="Nearest Voices")
+    table.add_column("Name", style="cyan")
+    table.add_column("Similarity", style="green")
+    table.add_column("Sentence", style="white")
+    table.add_column("Vocabulary", style="white")
+    table.add_column("Rhetoric", style="white")
+    table.add_column("Tone", style="white")
+    
+    for result in results:
+        details = result["details"]
+        table.add_row(
+            result["name"],
+            f"{result['similarity'] * 100:.1f}%",
+            f"{details['sentence_structure'] * 100:.0f}%",
+            f"{details['vocabulary'] * 100:.0f}%",
+            f"{details['rhetorical_devices'] * 100:.0f}%",
+            f"{details['emotional_tone'] * 100:.0f}%"
+        )
+    
+    console.print("\n")
+    console.print(table)
+    console.print("\n")
+
+
+@profile.command("verify")
+@click.option("--profile", "profile_name", required=True, help="Voice profile to verify against")
+@click.option("--inputs", required=True, help="Draft files to verify (glob pattern)")
+@click.option("--workers", default=1, help="Analysis worker processes (default: 1)")
+@click.option("--output", help="Write the scores as JSON to this file")
+def verify_drafts(profile_name, inputs, workers, output):
+    """Score many drafts against one voice profile"""
+    from glob import glob
+    
+    draft_files = sorted(glob(inputs))
+    if not draft_files:
+        console.print(f"[red]No files found matching: {inputs}[/red]")
+        return
+    
+    drafts = []
+    for draft_file in draft_files:
+        with open(draft_file, 'r', encoding='utf-8') as f:
+            drafts.append(f.read())
+    
+    profiler = VoiceProfiler()
+    
+    with console.status(f"[bold green]Verifying {len(drafts)} drafts..."):
+        try:
+            report = profiler.verify_batch(profile_name, drafts, workers=workers)
+        except ValueError as e:
+            console.print(f"[red]{e}[/red]")
+            return
+    
+    table = Table(title=f"Voice Match: {profile_name}")
+    table.add_column("Draft", style="cyan")
+    table.add_column("Match", style="green")
+    table.add_column("Sentence", style="white")
+    table.add_column("Vocabulary", style="white")
+    table.add_column("Rhetoric", style="white")
+    table.add_column("Tone", style="white")
+    
+    for draft_file, result in zip(draft_files, report["results"]):
+        details = result["details"]
+        score_style = "green" if result["matches_voice"] else "yellow"
+        table.add_row(
+            Path(draft_file).name,
+            f"[{score_style}]{result['match_score']:.1f}%[/{score_style}]",
+            f"{details['sentence_structure']:.0f}%",
+            f"{details['vocabulary']:.0f}%",
+            f"{details['rhetorical_devices']:.0f}%",
+            f"{details['emotional_tone']:.0f}%"
+        )
+    
+    summary = report["summary"]
+    console.print("\n")
+    console.print(table)
+    console.print(
+        f"\n{summary['passing']}/{summary['count']} drafts match "
+        f"(mean {summary['mean_score']}%, min {summary['min_score']}%, max {summary['max_score']}%)\n"
+    )
+    
+    if output:
+        output_path = Path(output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        report["files"] = draft_files
+        with open(output_path, 'w') as f:
+            json.dump(report, f, indent=2)
+        console.print(f"[dim]Saved to: {output}[/dim]\n")
+
+
+@profile.command("drift")
+@click.argument("name")
+@click.option("--all", "show_all", is_flag=True, help="Show every feature, not only drifting ones")
+def profile_drift(name, show_all):
+    """Report whether generated content is drifting from a voice"""
+    from core.drift_monitor import get_drift_monitor
+    
+    report = get_drift_monitor().report(name)
+    
+    if not report["records"]:
+        console.print(f"[yellow]No generated content recorded for '{name}' yet[/yellow]")
+        return
+    
+    status = "[red]drifting[/red]" if report["drifting"] else "[green]stable[/green]"
+    console.print(f"\n[bold cyan]{name}[/bold cyan]: {status}")
+    console.print(
+        f"[dim]{report['records']} outputs from {report['first_recorded'][:10]} "
+        f"to {report['last_recorded'][:10]}[/dim]\n"
+    )
+    
+    features = report["features"] if show_all else [f for f in report["features"] if f["drifting"]]
+    if not features:
+        console.print("[green]No feature has drifted significantly[/green]\n")
+        return
+    
+    table = Table(title="Voice Drift")
+    table.add_column("Feature", style="cyan")
+    table.add_column("Long-run Mean", style="white")
+    table.add_column("Recent Mean", style="white")
+    table.add_column("z", style="white")
+    table.add_column("Drift", style="white")
+    
+    for feature in features:
+        table.add_row(
+            feature["feature"],
+            f"{feature['mean']:.3f} ± {feature['std']:.3f}",
+            f"{feature['recent_mean']:.3f}",
+            f"{feature['z_score']:+.1f}",
+            "[red]yes[/red]" if feature["drifting"] else "no"
+        )
+    
+    console.print(table)
+    console.print("\n")
+
+
 @cli.group()
 def generate():
     """Generate content with style fusion"""
@@ -322,7 +514,7 @@ def generate_article(profile, topic, influences, length, output, model):
     # Initialize generator
     generator = ContentGenerator(default_model=model)
     
-    if not generator.openai_client and not generator.anthropic_client:
+    if not generator.available():
         console.print("[red]No AI API keys found![/red]")
         console.print("[yellow]Set OPENAI_API_KEY or ANTHROPIC_API_KEY environment variable[/yellow]")
         return
@@ -507,15 +699,23 @@ def workflow_create(input_text, profile, input_type, output_format, length, no_h
         console.print(f"[red]Error: {e}[/red]")
         return
     
-    with console.status("[bold green]Processing..."):
-        result = workflow.process_input(
-            input_text=input_text,
-            input_type=input_type,
-            output_format=output_format,
-            target_length=length,
-            auto_humanize=not no_humanize,
-            auto_publish=False
-        )
+    from core.workflow_runs import new_run_id
+    run_id = new_run_id()
+    try:
+        with console.status("[bold green]Processing..."):
+            result = workflow.process_input(
+                input_text=input_text,
+                input_type=input_type,
+                output_format=output_format,
+                target_length=length,
+                auto_humanize=not no_humanize,
+                auto_publish=False,
+                run_id=run_id
+            )
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        console.print(f"[dim]Completed steps are saved. Resume with: voicecraft workflow resume {run_id}[/dim]\n")
+        return
     
     console.print("\n[bold green]✅ Content created![/bold green]\n")
     console.print(Panel(result["final_content"], title="Generated Content", border_style="green"))
@@ -546,6 +746,147 @@ def workflow_quick(topic, profile):
     console.print()
 
 
+@workflow.command("batch")
+@click.argument("input_file")
+@click.option("--profile", default="Max Bernstein", help="Voice profile for items without profile_name")
+@click.option("--workers", default=4, help="Items generated at once (default: 4)")
+@click.option("--rate-limit", "rate_limits", multiple=True, help="Requests per minute per provider, e.g. anthropic=50")
+@click.option("--output", help="Write results as NDJSON to this file (default: data/outputs/batch/<timestamp>.ndjson)")
+def workflow_batch(input_file, profile, workers, rate_limits, output):
+    """Generate content for every topic in a JSONL or CSV file"""
+    from datetime import datetime
+    from core.batch_runner import BatchRunner, load_batch
+    from core.llm_gateway import get_llm_gateway
+    
+    try:
+        items = load_batch(input_file)
+    except (OSError, ValueError) as e:
+        console.print(f"[red]Error: {e}[/red]")
+        return
+    if not items:
+        console.print(f"[yellow]No inputs in {input_file}[/yellow]")
+        return
+    
+    gateway = get_llm_gateway()
+    for rate_limit in rate_limits:
+        provider, _, per_minute = rate_limit.partition("=")
+        if provider not in gateway.providers or not per_minute:
+            console.print(f"[red]Invalid --rate-limit: {rate_limit} (use provider=requests_per_minute)[/red]")
+            return
+        gateway.set_rate_limit(provider, float(per_minute))
+    
+    output_path = Path(output or f"./data/outputs/batch/{datetime.now().strftime('%Y%m%d_%H%M%S')}.ndjson")
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    console.print(f"\n[bold cyan]📦 Batch: {len(items)} inputs, {workers} workers[/bold cyan]\n")
+    
+    runner = BatchRunner(workers=workers, default_profile=profile)
+    with open(output_path, 'w') as f, Progress(console=console) as progress:
+        task = progress.add_task("Generating...", total=len({json.dumps(item, sort_keys=True) for item in items}))
+        for event in runner.run(items):
+            # Results are written as they finish, so a partial run keeps what it produced
+            f.write(json.dumps(event, default=str) + "\n")
+            f.flush()
+            if event["event"] == "result":
+                progress.advance(task)
+                mark = "[green]✓[/green]" if event["status"] == "succeeded" else f"[red]✗ {event['error']}[/red]"
+                progress.console.print(f"{mark} {event['input_text'][:70]} [dim]({event['elapsed']}s)[/dim]")
+            else:
+                summary = event
+    
+    table = Table(title="Batch Summary")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", style="white")
+    table.add_row("Inputs", f"{summary['items']} ({summary['duplicates']} duplicates skipped)")
+    table.add_row("Succeeded", f"[green]{summary['succeeded']}[/green]")
+    table.add_row("Failed", f"[red]{summary['failed']}[/red]" if summary['failed'] else "0")
+    table.add_row("Wall time", f"{summary['wall_time']}s")
+    table.add_row("Throughput", f"{summary['items_per_minute']} items/min")
+    if summary["latency"]:
+        latency = summary["latency"]
+        table.add_row("Latency", f"mean {latency['mean']}s, p50 {latency['p50']}s, p95 {latency['p95']}s")
+    for name, counts in summary["providers"].items():
+        table.add_row(f"LLM: {name}", ", ".join(f"{field} {count}" for field, count in counts.items()))
+    
+    console.print("\n")
+    console.print(table)
+    for error in summary["errors"]:
+        console.print(f"[red]{error['count']}× {error['error']}[/red]")
+    console.print(f"\n[dim]Results: {output_path}[/dim]\n")
+
+
+@workflow.command("runs")
+@click.option("--status", type=click.Choice(["running", "complete", "failed", "interrupted"]), help="Only runs with this status")
+@click.option("--limit", default=20, help="Maximum runs shown (default: 20)")
+def workflow_runs(status, limit):
+    """List recent workflow runs and the steps they completed"""
+    from core.workflow_runs import get_run_journal
+    
+    runs = get_run_journal().list(status=status, limit=limit)
+    if not runs:
+        console.print("[yellow]No workflow runs found[/yellow]")
+        return
+    
+    colors = {"complete": "green", "failed": "red", "interrupted": "yellow", "running": "cyan"}
+    table = Table(title="Workflow Runs")
+    table.add_column("Run", style="cyan")
+    table.add_column("Status")
+    table.add_column("Profile", style="white")
+    table.add_column("Input", style="white")
+    table.add_column("Completed steps", style="dim")
+    for run in runs:
+        color = colors.get(run["status"], "white")
+        table.add_row(
+            run["run_id"],
+            f"[{color}]{run['status']}[/{color}]",
+            run["profile_name"],
+            run["params"]["input_text"][:40],
+            ", ".join(run["steps"])
+        )
+    console.print(table)
+    for run in runs:
+        if run["status"] in ("failed", "interrupted") and run.get("error"):
+            console.print(f"[red]{run['run_id']}: {run['error']}[/red]")
+
+
+@workflow.command("resume")
+@click.argument("run_id")
+@click.option("--output", help="Also save the final content to this file")
+def workflow_resume(run_id, output):
+    """Resume a failed or interrupted run from its last completed step"""
+    from core.workflow_runs import get_run_journal, resume_run
+    
+    run = get_run_journal().get(run_id)
+    if run is None:
+        console.print(f"[red]Run not found: {run_id}[/red]")
+        return
+    if run["status"] == "running":
+        console.print(f"[yellow]Run {run_id} is still running in another process[/yellow]")
+        return
+    
+    done = ", ".join(run["steps"]) or "none"
+    console.print(f"\n[bold cyan]🔁 Resuming {run_id}[/bold cyan] [dim](completed: {done})[/dim]\n")
+    
+    try:
+        with console.status("[bold green]Processing..."):
+            result = resume_run(run_id)
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        console.print(f"[dim]Progress is saved. Resume again with: voicecraft workflow resume {run_id}[/dim]\n")
+        return
+    
+    for step in result["steps"]:
+        mark = {"complete": "[green]✓[/green]", "restored": "[dim]↺[/dim]"}.get(step["status"], "[yellow]–[/yellow]")
+        console.print(f"{mark} {step['step']} [dim]{step['status']}[/dim]")
+    console.print(Panel(result["final_content"], title="Generated Content", border_style="green"))
+    console.print(f"\n[dim]Saved to: {result['output_path']}[/dim]\n")
+    
+    if output:
+        with open(output, 'w') as f:
+            f.write(result["final_content"])
+        console.print(f"[dim]Also saved to: {output}[/dim]\n")
+
+
 @cli.command()
 def examples():
     """Show usage examples"""
@@ -601,6 +942,17 @@ def examples():
      --input "./ai-draft.md" \\
      --output "./humanized.md" \\
      --analysis  # Show what changed
+
+[yellow]9. Generate a whole topic list (JSONL or CSV):[/yellow]
+   voicecraft workflow batch topics.csv \\
+     --profile "Max Bernstein" \\
+     --workers 8 \\
+     --rate-limit anthropic=50 \\
+     --output "./output/batch.ndjson"
+
+[yellow]10. Resume a failed workflow without regenerating:[/yellow]
+   voicecraft workflow runs --status failed
+   voicecraft workflow resume 20250101-093000-1a2b3c
 """
     console.print(Panel(examples_text, title="Examples", border_style="cyan"))
 
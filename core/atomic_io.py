@@ -0,0 +1,139 @@
+"""
+Atomic IO - Crash-safe writes and cross-process file locks
+
+This module handles:
+- Writing files atomically (temp file + fsync + rename) so readers never see partial data
+- Advisory, reentrant per-path locks shared by threads and processes
+"""
+
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Union
+
+try:
+    import fcntl
+except ImportError:
+    # No advisory locks on this platform; locks only serialize threads
+    fcntl = None
+
+
+def _target_mode(path: Path) -> int:
+    """Permission bits for a rewrite of path: the existing file's, else 0666 minus the umask"""
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        pass
+    with _umask_guard:
+        # The umask can only be read by setting it
+        umask = os.umask(0)
+        os.umask(umask)
+    return 0o666 & ~umask
+
+
+_umask_guard = threading.Lock()
+
+
+def atomic_write(path: Union[str, Path], data: bytes):
+    """
+    Replace a file's contents atomically
+
+    The data goes to a temp file in the same directory, is fsynced, then
+    renamed over the target. Readers see either the old or the new file,
+    never a truncated one. The file keeps the target's permissions (new
+    files get the umask's default, as with open()).
+
+    Args:
+        path: Destination path
+        data: Complete new file contents
+    """
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}-", suffix=".tmp")
+    try:
+        # mkstemp creates 0600 files; os.replace would carry that over to the target
+        if hasattr(os, "fchmod"):
+            os.fchmod(fd, _target_mode(path))
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+    # Persist the rename itself (best effort; not supported everywhere)
+    try:
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+class _PathLock:
+    """Thread lock plus flock on a lock file, reentrant within a thread"""
+
+    def __init__(self, lock_path: Path):
+        self.lock_path = lock_path
+        self.thread_lock = threading.RLock()
+        self.depth = 0
+        self.fd = None
+
+    def acquire(self):
+        self.thread_lock.acquire()
+        if self.depth == 0 and fcntl is not None:
+            try:
+                self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+                self.fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+                fcntl.flock(self.fd, fcntl.LOCK_EX)
+            except BaseException:
+                if self.fd is not None:
+                    os.close(self.fd)
+                    self.fd = None
+                self.thread_lock.release()
+                raise
+        self.depth += 1
+
+    def release(self):
+        self.depth -= 1
+        if self.depth == 0 and self.fd is not None:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+            os.close(self.fd)
+            self.fd = None
+        self.thread_lock.release()
+
+
+_locks: Dict[str, _PathLock] = {}
+_locks_guard = threading.Lock()
+
+
+@contextmanager
+def file_lock(lock_path: Union[str, Path]):
+    """
+    Hold an exclusive advisory lock on lock_path
+
+    Serializes writers across threads and processes (on a shared volume that
+    supports flock). Re-entering from the same thread does not deadlock.
+    Readers that never take the lock are not blocked.
+    """
+    key = os.path.abspath(lock_path)
+    with _locks_guard:
+        lock = _locks.get(key)
+        if lock is None:
+            lock = _locks[key] = _PathLock(Path(key))
+
+    lock.acquire()
+    try:
+        yield
+    finally:
+        lock.release()
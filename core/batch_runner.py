@@ -0,0 +1,256 @@
+"""
+Batch Runner - Bulk content generation from topic lists
+
+This module handles:
+- Reading batch inputs from JSONL or CSV (one content request per line/row)
+- Running identical inputs only once
+- Scheduling items across a bounded worker pool (LLM calls stay within the
+  gateway's per-provider concurrency and rate limits)
+- Streaming per-item results as they finish, then a throughput and failure summary
+"""
+
+import csv
+import io
+import json
+import os
+import statistics
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+from .llm_gateway import get_llm_gateway
+
+
+# Fields of a batch item (same meaning as the workflow's process_input arguments)
+BATCH_FIELDS = (
+    "input_text", "profile_name", "input_type", "output_format",
+    "target_length", "auto_humanize", "style_influences"
+)
+
+DEFAULT_WORKERS = 4
+
+
+def parse_batch(text: str, format: str = "jsonl") -> List[Dict]:
+    """
+    Parse batch inputs
+
+    Args:
+        text: JSONL (objects or plain strings, one per line) or CSV with a
+              header row; "topic" is accepted as an alias of "input_text"
+        format: "jsonl" or "csv"
+
+    Returns:
+        Items with the known BATCH_FIELDS (empty CSV cells are dropped)
+    """
+    if format == "csv":
+        rows = [
+            {key.strip(): value.strip() for key, value in row.items() if key and value and value.strip()}
+            for row in csv.DictReader(io.StringIO(text))
+        ]
+    elif format == "jsonl":
+        rows = []
+        for number, line in enumerate(text.splitlines(), 1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                raise ValueError(f"Line {number}: invalid JSON ({e})")
+            rows.append({"input_text": row} if isinstance(row, str) else row)
+    else:
+        raise ValueError(f"Unsupported batch format: {format}")
+
+    items = []
+    for number, row in enumerate(rows, 1):
+        if not isinstance(row, dict):
+            raise ValueError(f"Item {number}: expected an object or a string")
+        if "topic" in row and "input_text" not in row:
+            row["input_text"] = row.pop("topic")
+        if not str(row.get("input_text", "")).strip():
+            raise ValueError(f"Item {number}: input_text is required")
+        item = {key: row[key] for key in BATCH_FIELDS if row.get(key) is not None}
+        item["input_text"] = str(item["input_text"]).strip()
+        if "target_length" in item:
+            item["target_length"] = int(item["target_length"])
+        if isinstance(item.get("auto_humanize"), str):
+            item["auto_humanize"] = item["auto_humanize"].lower() not in ("0", "false", "no")
+        if isinstance(item.get("style_influences"), str):
+            # CSV form: "Alex Hormozi:30,Seth Godin:20"
+            item["style_influences"] = [
+                {"name": name.strip(), "weight": float(weight)}
+                for name, weight in (pair.rsplit(":", 1) for pair in item["style_influences"].split(",") if pair.strip())
+            ]
+        items.append(item)
+    return items
+
+
+def load_batch(path: Union[str, Path]) -> List[Dict]:
+    """Read batch inputs from a .jsonl/.ndjson or .csv file"""
+    path = Path(path)
+    format = "csv" if path.suffix.lower() == ".csv" else "jsonl"
+    with open(path, 'r', encoding='utf-8') as f:
+        return parse_batch(f.read(), format)
+
+
+def run_workflow_item(item: Dict, default_profile: str) -> Dict:
+    """Generate one batch item with the profile's pooled workflow"""
+    from .workflow_pool import get_workflow_pool
+
+    options = {key: value for key, value in item.items() if key not in ("profile_name", "style_influences")}
+    if item.get("style_influences"):
+        options["style_influences"] = [(inf["name"], inf["weight"]) for inf in item["style_influences"]]
+    workflow = get_workflow_pool().get(item.get("profile_name") or default_profile)
+    result = workflow.process_input(**options, auto_publish=False, auto_yes=True)
+    return {
+        "content": result.get("final_content", ""),
+        "input_type": result.get("input_type"),
+        "output_format": result.get("output_format"),
+        "output_path": str(result.get("output_path", ""))
+    }
+
+
+class BatchRunner:
+    """Run many content requests concurrently and report as they finish"""
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_WORKERS,
+        default_profile: Optional[str] = None,
+        run_item: Optional[Callable[[Dict], Dict]] = None,
+        executor: Optional[Executor] = None
+    ):
+        """
+        Args:
+            workers: Items generated at once
+            default_profile: Profile of items without profile_name
+                             (default: VOICECRAFT_PROFILE or "Max Bernstein")
+            run_item: Generates one item (default: the pooled content workflow)
+            executor: Shared pool to run items in (default: a pool of its own);
+                      the batch still keeps at most `workers` items in it
+        """
+        self.workers = max(1, workers)
+        self.executor = executor
+        self.default_profile = default_profile or os.getenv('VOICECRAFT_PROFILE', 'Max Bernstein')
+        self.run_item = run_item or (lambda item: run_workflow_item(item, self.default_profile))
+
+    def run(self, items: List[Dict]) -> Iterator[Dict]:
+        """
+        Generate every unique item, yielding events as they happen
+
+        Yields:
+            {"event": "result", "index", "indexes", "input_text", "status",
+             "elapsed", "content"/"error", ...}   once per unique item, in
+             completion order ("indexes" lists every identical input)
+            {"event": "summary", ...}             once, at the end (see _summary)
+        """
+        unique: Dict[str, List[int]] = {}
+        for index, item in enumerate(items):
+            unique.setdefault(json.dumps(item, sort_keys=True), []).append(index)
+
+        gateway = get_llm_gateway()
+        providers_before = gateway.stats()
+        started = time.perf_counter()
+        results = []
+
+        executor = self.executor or ThreadPoolExecutor(
+            max_workers=min(self.workers, max(1, len(unique))), thread_name_prefix="batch"
+        )
+        queued = iter(unique.values())
+        pending = {}
+        try:
+            while True:
+                # Submit as items finish, so a shared pool never holds more than `workers` of ours
+                while len(pending) < self.workers:
+                    indexes = next(queued, None)
+                    if indexes is None:
+                        break
+                    pending[executor.submit(self._run_one, items[indexes[0]])] = indexes
+                if not pending:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    indexes = pending.pop(future)
+                    result = {
+                        "event": "result",
+                        "index": indexes[0],
+                        "indexes": indexes,
+                        "input_text": items[indexes[0]]["input_text"],
+                        **future.result()
+                    }
+                    results.append(result)
+                    yield result
+        finally:
+            # Stops queued items if the consumer goes away mid-batch
+            for future in pending:
+                future.cancel()
+            if self.executor is None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        yield self._summary(items, results, time.perf_counter() - started, providers_before, gateway.stats())
+
+    def _run_one(self, item: Dict) -> Dict:
+        start = time.perf_counter()
+        try:
+            result = {"status": "succeeded", **self.run_item(item)}
+        except Exception as e:
+            result = {"status": "failed", "error": str(e)}
+        result["elapsed"] = round(time.perf_counter() - start, 3)
+        return result
+
+    def _summary(
+        self,
+        items: List[Dict],
+        results: List[Dict],
+        wall_time: float,
+        providers_before: Dict,
+        providers_after: Dict
+    ) -> Dict[str, Any]:
+        """Throughput, latency and failure summary of a finished batch"""
+        failed = [result for result in results if result["status"] == "failed"]
+        latencies = sorted(result["elapsed"] for result in results)
+        errors: Dict[str, int] = {}
+        for result in failed:
+            errors[result["error"]] = errors.get(result["error"], 0) + 1
+
+        providers = {}
+        for name, after in providers_after.items():
+            before = providers_before.get(name, {})
+            delta = {field: after[field] - before.get(field, 0) for field in ("calls", "retries", "failures", "throttled")}
+            if any(delta.values()):
+                providers[name] = delta
+
+        return {
+            "event": "summary",
+            "items": len(items),
+            "unique": len(results),
+            "duplicates": len(items) - len(results),
+            "succeeded": len(results) - len(failed),
+            "failed": len(failed),
+            "wall_time": round(wall_time, 3),
+            "items_per_minute": round(len(results) / wall_time * 60, 1) if wall_time > 0 else None,
+            "latency": {
+                "mean": round(statistics.mean(latencies), 3),
+                "p50": latencies[len(latencies) // 2],
+                "p95": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+                "max": latencies[-1]
+            } if latencies else None,
+            "errors": [
+                {"error": error, "count": count}
+                for error, count in sorted(errors.items(), key=lambda entry: -entry[1])
+            ],
+            "providers": providers
+        }
+
+
+if __name__ == "__main__":
+    # Example: a small batch with one duplicate and one failure, no LLM needed
+    def fake_item(item):
+        time.sleep(0.1)
+        if "fail" in item["input_text"]:
+            raise RuntimeError("model unavailable")
+        return {"content": item["input_text"].upper()}
+
+    batch = parse_batch('"Why focus beats hustle"\n"Hiring your first salesperson"\n"Why focus beats hustle"\n"please fail"')
+    for event in BatchRunner(workers=2, run_item=fake_item).run(batch):
+        print(json.dumps(event))
@@ -9,20 +9,17 @@ This module handles:
 """
 
 import os
+import threading
 from typing import Dict, List, Optional, Literal, Any
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 import json
 
-try:
-    from openai import OpenAI
-    from anthropic import Anthropic
-except ImportError:
-    print("Warning: AI libraries not installed. Install with: pip install openai anthropic")
-    OpenAI = None
-    Anthropic = None
-
+from .llm_gateway import get_llm_gateway
 from .style_blender import StyleBlender
 from .voice_profiler import VoiceProfiler
+from .drift_monitor import get_drift_monitor
+from .style_vectors import vector_from_dict
 
 # Import prompt assembler for modular prompts
 try:
@@ -51,6 +48,13 @@ except ImportError:
 
 ContentFormat = Literal["article", "linkedin", "twitter", "faq", "email"]
 
+# Formats generated at once by generate_multi_format (the gateway's
+# per-provider limit still applies on top)
+MULTI_FORMAT_CONCURRENCY = int(os.getenv("VOICECRAFT_MULTI_FORMAT_CONCURRENCY", "4"))
+
+# System prompt for providers other than Anthropic (Claude gets the prompt alone)
+GENERIC_SYSTEM_PROMPT = "You are an expert content writer who can adapt to any writing style."
+
 
 @dataclass
 class GenerationConfig:
@@ -71,6 +75,27 @@ class GenerationConfig:
     platforms: Optional[List[str]] = None  # List of platforms to optimize for
 
 
+class GenerationStream:
+    """Iterator over generated text chunks; result is set once it is exhausted"""
+    
+    def __init__(self, chunks, finish):
+        self._chunks = chunks
+        self._finish = finish
+        self._parts = []
+        self.result = None
+    
+    def __iter__(self):
+        for chunk in self._chunks:
+            self._parts.append(chunk)
+            yield chunk
+        self.result = self._finish("".join(self._parts).strip())
+    
+    @property
+    def text(self) -> str:
+        """Text received so far"""
+        return "".join(self._parts)
+
+
 class ContentGenerator:
     """Generate content with AI using blended styles"""
     
@@ -78,27 +103,44 @@ class ContentGenerator:
         self,
         openai_api_key: Optional[str] = None,
         anthropic_api_key: Optional[str] = None,
-        default_model: str = "claude-haiku-4-5-20251001"  # Claude 4.5 Haiku
+        default_model: str = "claude-haiku-4-5-20251001",  # Claude 4.5 Haiku
+        use_cache: Optional[bool] = None
     ):
+        """
+        Args:
+            openai_api_key: OpenAI key (default: OPENAI_API_KEY)
+            anthropic_api_key: Anthropic key (default: ANTHROPIC_API_KEY)
+            default_model: Model used when a call doesn't name one
+            use_cache: Reuse cached LLM responses (None = only for temperature 0)
+        """
         self.openai_api_key = openai_api_key or os.getenv("OPENAI_API_KEY")
         self.anthropic_api_key = anthropic_api_key or os.getenv("ANTHROPIC_API_KEY")
         self.default_model = default_model
+        self.use_cache = use_cache
         
-        # Initialize clients
-        if OpenAI and self.openai_api_key:
-            self.openai_client = OpenAI(api_key=self.openai_api_key)
-        else:
-            self.openai_client = None
-        
-        if Anthropic and self.anthropic_api_key:
-            self.anthropic_client = Anthropic(api_key=self.anthropic_api_key)
-        else:
-            self.anthropic_client = None
+        # Provider calls go through the shared gateway (pooled clients, limits, retries)
+        self.gateway = get_llm_gateway()
         
         # Initialize helper classes
         self.blender = StyleBlender()
         self.profiler = VoiceProfiler()
     
+    @property
+    def openai_client(self):
+        """Shared OpenAI client (None without an API key)"""
+        return self.gateway.client("openai", self.openai_api_key)
+    
+    @property
+    def anthropic_client(self):
+        """Shared Anthropic client (None without an API key)"""
+        return self.gateway.client("anthropic", self.anthropic_api_key)
+    
+    def available(self, model: Optional[str] = None) -> bool:
+        """Whether generation can run (for model, or with any configured provider)"""
+        if model is None:
+            return bool(self.openai_client or self.anthropic_client) or self.gateway.available()
+        return self.gateway.available(model, self._api_key(model))
+    
     def generate(
         self,
         content_brief: str,
@@ -123,6 +165,81 @@ class ContentGenerator:
         config = config or GenerationConfig()
         model = model or self.default_model
         
+        prompt, blended_style = self._prepare(content_brief, voice_profile, style_influences, config)
+        
+        # Generate content
+        content = self._generate_llm(prompt, model, config)
+        
+        return self._package_result(content, prompt, blended_style, voice_profile, config, model)
+    
+    def generate_stream(
+        self,
+        content_brief: str,
+        voice_profile: Dict,
+        style_influences: Optional[List[tuple]] = None,
+        config: Optional[GenerationConfig] = None,
+        model: Optional[str] = None
+    ) -> "GenerationStream":
+        """
+        Generate content, yielding text chunks as the model produces them
+        
+        Same arguments as generate. Iterate the returned stream for chunks;
+        once it is exhausted, stream.result holds the same dictionary
+        generate would have returned (verified against the voice).
+        
+        Example:
+            stream = generator.generate_stream(brief, profile)
+            for chunk in stream:
+                print(chunk, end="", flush=True)
+            print(stream.result["metadata"]["voice_match_score"])
+        """
+        config = config or GenerationConfig()
+        model = model or self.default_model
+        
+        prompt, blended_style = self._prepare(content_brief, voice_profile, style_influences, config)
+        
+        return GenerationStream(
+            self._stream_llm(prompt, model, config),
+            lambda content: self._package_result(content, prompt, blended_style, voice_profile, config, model, "stream")
+        )
+    
+    def _prepare(
+        self,
+        content_brief: str,
+        voice_profile: Dict,
+        style_influences: Optional[List[tuple]],
+        config: GenerationConfig,
+        context: Optional[Dict] = None
+    ) -> tuple:
+        """Build the generation prompt (returns prompt, blended_style)"""
+        context = context or self._prompt_context(content_brief, voice_profile, style_influences)
+        blended_style = context["blended_style"]
+        
+        # Create prompt (prioritize modular prompts, then ELITE, then default)
+        if config.use_modular_prompts and PROMPT_ASSEMBLER_AVAILABLE:
+            prompt = self._create_modular_prompt(content_brief, config, context)
+        elif config.use_elite_unit and ELITE_AVAILABLE:
+            prompt = self._create_elite_prompt(content_brief, voice_profile, config)
+        else:
+            prompt = self._create_prompt(blended_style, content_brief, config, context)
+        
+        return prompt, blended_style
+    
+    def _prompt_context(
+        self,
+        content_brief: str,
+        voice_profile: Dict,
+        style_influences: Optional[List[tuple]]
+    ) -> Dict:
+        """
+        Prompt parts that depend only on the brief and voice, not the format
+        
+        The knowledge base context and keywords are computed on first use
+        (see _context_part): the ELITE prompt needs neither.
+        
+        Returns:
+            {"blended_style", "content_brief", "modular_prompts", ...}
+        """
         # Blend styles
         if style_influences:
             blended_style = self.blender.blend_styles(
@@ -139,22 +256,55 @@ class ContentGenerator:
                 "blend_summary": voice_profile.get("metadata", {}).get("name", "Base voice")
             }
         
-        # Create prompt (prioritize modular prompts, then ELITE, then default)
-        if config.use_modular_prompts and PROMPT_ASSEMBLER_AVAILABLE:
-            prompt = self._create_modular_prompt(content_brief, config)
-        elif config.use_elite_unit and ELITE_AVAILABLE:
-            prompt = self._create_elite_prompt(content_brief, voice_profile, config)
-        else:
-            prompt = self._create_prompt(blended_style, content_brief, config)
-        
-        # Generate content
-        if "gpt" in model.lower() or "o1" in model.lower():
-            content = self._generate_openai(prompt, model, config)
-        elif "claude" in model.lower():
-            content = self._generate_anthropic(prompt, model, config)
-        else:
-            raise ValueError(f"Unsupported model: {model}")
+        return {
+            "blended_style": blended_style,
+            "content_brief": content_brief,
+            # Assembled modular prompts by (input_type, platforms), filled on first use
+            "modular_prompts": {},
+            # Parts computed on first use, once for all formats sharing the context
+            "parts": {},
+            "parts_lock": threading.Lock()
+        }
+    
+    def _context_part(self, context: Dict, name: str) -> Any:
+        """
+        A prompt context part, computed on first use
         
+        Args:
+            context: From _prompt_context
+            name: "knowledge_context" or "keywords"
+        """
+        with context["parts_lock"]:
+            if name not in context["parts"]:
+                content_brief = context["content_brief"]
+                if name == "keywords":
+                    context["parts"][name] = self._extract_keywords_from_brief(content_brief)
+                else:
+                    context["parts"][name] = self._knowledge_context(content_brief)
+            return context["parts"][name]
+    
+    def _knowledge_context(self, content_brief: str) -> str:
+        """Knowledge base frameworks and case studies relevant to the brief"""
+        if not KNOWLEDGE_BASE_AVAILABLE:
+            return ""
+        try:
+            kb = get_knowledge_base()
+            return kb.format_for_prompt(content_brief, max_frameworks=3, max_cases=2)
+        except Exception as e:
+            print(f"⚠️  Error loading knowledge base: {e}")
+            return ""
+    
+    def _package_result(
+        self,
+        content: str,
+        prompt: str,
+        blended_style: Dict,
+        voice_profile: Dict,
+        config: GenerationConfig,
+        model: str,
+        source: str = "generate"
+    ) -> Dict:
+        """Verify generated content against the voice and build the result (source: origin for the drift log)"""
         # Verify voice consistency (handle both LLM and rule-based profiles)
         voice_match = {"match_score": 0, "matches_voice": False}
         try:
@@ -162,7 +312,15 @@ class ContentGenerator:
             if profile_name:
                 # Check if profile has style data (rule-based) or llm_analysis (LLM-based)
                 if "style" in voice_profile or "llm_analysis" in voice_profile:
-                    voice_match = self.profiler.verify_content(profile_name, content)
+                    voice_match = self.profiler.verify_content(profile_name, content, profile=voice_profile)
+                    # Track the output in the voice's drift log
+                    get_drift_monitor().record(
+                        profile_name,
+                        vector_from_dict(voice_match["style_vector"]),
+                        match_score=voice_match["match_score"],
+                        source=source,
+                        format=config.format
+                    )
         except Exception as e:
             # If verification fails, continue without it
             pass
@@ -189,25 +347,48 @@ class ContentGenerator:
         voice_profile: Dict,
         formats: List[ContentFormat],
         style_influences: Optional[List[tuple]] = None,
-        model: Optional[str] = None
+        model: Optional[str] = None,
+        max_concurrency: Optional[int] = None
     ) -> Dict[str, Dict]:
         """
         Generate content in multiple formats at once
         
+        The style blend, knowledge context and keywords are prepared once and
+        the formats are generated concurrently (up to max_concurrency at a time).
+        
+        Args:
+            content_brief: What to write about
+            voice_profile: Base voice profile
+            formats: Formats to generate
+            style_influences: List of (style_profile, weight) tuples
+            model: AI model to use (overrides default)
+            max_concurrency: Formats generated at once (default: MULTI_FORMAT_CONCURRENCY)
+        
         Returns:
-            Dictionary mapping format to generated content
+            Dictionary mapping format to generated content, in the order of formats.
+            A format that failed maps to {"format": ..., "error": "..."} and the
+            other formats are still returned.
         """
-        results = {}
+        model = model or self.default_model
+        formats = list(dict.fromkeys(formats))
+        context = self._prompt_context(content_brief, voice_profile, style_influences)
         
-        for fmt in formats:
+        def generate_format(fmt):
             config = GenerationConfig(format=fmt)
-            results[fmt] = self.generate(
-                content_brief=content_brief,
-                voice_profile=voice_profile,
-                style_influences=style_influences,
-                config=config,
-                model=model
-            )
+            prompt, blended_style = self._prepare(content_brief, voice_profile, style_influences, config, context)
+            content = self._generate_llm(prompt, model, config)
+            return self._package_result(content, prompt, blended_style, voice_profile, config, model, "multi_format")
+        
+        workers = max(1, min(max_concurrency or MULTI_FORMAT_CONCURRENCY, len(formats)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {fmt: executor.submit(generate_format, fmt) for fmt in formats}
+        
+        results = {}
+        for fmt, future in futures.items():
+            try:
+                results[fmt] = future.result()
+            except Exception as e:
+                results[fmt] = {"format": fmt, "error": str(e)}
         
         return results
     
@@ -243,10 +424,7 @@ Original Content:
 
 Refined Content:"""
         
-        if "gpt" in model.lower():
-            refined = self._generate_openai(prompt, model, GenerationConfig())
-        else:
-            refined = self._generate_anthropic(prompt, model, GenerationConfig())
+        refined = self._generate_llm(prompt, model, GenerationConfig())
         
         return {
             "original": original_content,
@@ -258,17 +436,20 @@ Refined Content:"""
         self,
         blended_style: Dict,
         content_brief: str,
-        config: GenerationConfig
+        config: GenerationConfig,
+        context: Optional[Dict] = None
     ) -> str:
         """Create the complete generation prompt"""
+        context = context or self._prompt_context(content_brief, {}, None)
+        
         # Format-specific instructions
         format_instructions = self._get_format_instructions(config.format, config.target_length)
         
         # AEO optimization instructions
         aeo_instructions = ""
         if config.aeo_optimize:
-            # Extract potential keywords from content brief
-            keywords = self._extract_keywords_from_brief(content_brief)
+            # Potential keywords from the content brief
+            keywords = self._context_part(context, "keywords")
             keywords_text = f"\n- Primary keywords: {', '.join(keywords[:5])}" if keywords else ""
             
             aeo_instructions = f"""
@@ -296,15 +477,9 @@ Refined Content:"""
 """
         
         # Knowledge base integration
-        knowledge_context = ""
-        if KNOWLEDGE_BASE_AVAILABLE:
-            try:
-                kb = get_knowledge_base()
-                knowledge_context = kb.format_for_prompt(content_brief, max_frameworks=3, max_cases=2)
-                if knowledge_context:
-                    knowledge_context = f"\n## Knowledge Base Context:\n{knowledge_context}\n"
-            except Exception as e:
-                print(f"⚠️  Error loading knowledge base: {e}")
+        knowledge_context = self._context_part(context, "knowledge_context")
+        if knowledge_context:
+            knowledge_context = f"\n## Knowledge Base Context:\n{knowledge_context}\n"
         
         # Build complete prompt
         prompt = f"""{blended_style['composite_instructions']}
@@ -333,37 +508,39 @@ Generate the content now:"""
     def _create_modular_prompt(
         self,
         content_brief: str,
-        config: GenerationConfig
+        config: GenerationConfig,
+        context: Optional[Dict] = None
     ) -> str:
         """Create prompt using modular prompt system"""
+        context = context or self._prompt_context(content_brief, {}, None)
+        
         if not PROMPT_ASSEMBLER_AVAILABLE:
             # Fallback to regular prompt
             blended_style = {
                 "composite_instructions": "Write in Max Bernstein's voice."
             }
-            return self._create_prompt(blended_style, content_brief, config)
-        
-        # Build prompt from modular files
-        assembler = PromptAssembler()
-        prompt = assembler.build_prompt(
-            user_input=content_brief,
-            input_type=config.input_type,
-            platforms=config.platforms or [],
-            include_viral=True,
-            include_platforms=bool(config.platforms),
-            include_multiplication=bool(config.platforms and len(config.platforms) > 1)
-        )
+            return self._create_prompt(blended_style, content_brief, config, context)
+        
+        # Build prompt from modular files (format independent, so shared across formats)
+        platforms = config.platforms or []
+        key = (config.input_type, tuple(platforms))
+        if key not in context["modular_prompts"]:
+            assembler = PromptAssembler()
+            context["modular_prompts"][key] = assembler.build_prompt(
+                user_input=content_brief,
+                input_type=config.input_type,
+                platforms=platforms,
+                include_viral=True,
+                include_platforms=bool(config.platforms),
+                include_multiplication=bool(config.platforms and len(config.platforms) > 1)
+            )
+        prompt = context["modular_prompts"][key]
         
         # Add knowledge base context
-        if KNOWLEDGE_BASE_AVAILABLE:
-            try:
-                kb = get_knowledge_base()
-                knowledge_context = kb.format_for_prompt(content_brief, max_frameworks=3, max_cases=2)
-                if knowledge_context:
-                    prompt += f"\n\n## Knowledge Base Context:\n{knowledge_context}\n"
-                    prompt += "\n## Instructions:\n- Reference frameworks and case studies from the knowledge base when relevant\n- Draw from authentic experience and proven methodologies\n"
-            except Exception as e:
-                print(f"⚠️  Error loading knowledge base: {e}")
+        knowledge_context = self._context_part(context, "knowledge_context")
+        if knowledge_context:
+            prompt += f"\n\n## Knowledge Base Context:\n{knowledge_context}\n"
+            prompt += "\n## Instructions:\n- Reference frameworks and case studies from the knowledge base when relevant\n- Draw from authentic experience and proven methodologies\n"
         
         # Add format and length requirements
         format_instructions = self._get_format_instructions(config.format, config.target_length)
@@ -566,58 +743,65 @@ Generate the content now:"""
         
         return formats.get(format, formats["article"])
     
-    def _generate_openai(
+    def _api_key(self, model: str) -> Optional[str]:
+        """This generator's API key for the provider serving model"""
+        provider = self.gateway.resolve(model).name
+        return {"openai": self.openai_api_key, "anthropic": self.anthropic_api_key}.get(provider)
+    
+    def _system_prompt(self, provider: str) -> Optional[str]:
+        """System prompt per provider: OpenAI gets the writer persona, Claude the prompt alone (as before the gateway)"""
+        if provider == "anthropic":
+            return None
+        return GENERIC_SYSTEM_PROMPT
+    
+    def _generate_llm(
         self,
         prompt: str,
         model: str,
         config: GenerationConfig
     ) -> str:
-        """Generate content using OpenAI"""
-        if not self.openai_client:
-            raise ValueError("OpenAI client not initialized. Check API key.")
+        """Generate content through the LLM gateway"""
+        provider = self.gateway.resolve(model)
         
         try:
-            response = self.openai_client.chat.completions.create(
+            content = self.gateway.complete(
+                prompt,
                 model=model,
-                messages=[
-                    {"role": "system", "content": "You are an expert content writer who can adapt to any writing style."},
-                    {"role": "user", "content": prompt}
-                ],
+                system=self._system_prompt(provider.name),
+                max_tokens=4000,
                 temperature=config.temperature,
-                max_tokens=4000
+                api_key=self._api_key(model),
+                provider=provider.name,
+                use_cache=self.use_cache
             )
-            
-            content = response.choices[0].message.content
             return content.strip()
         
         except Exception as e:
-            raise Exception(f"OpenAI generation failed: {str(e)}")
+            raise Exception(f"{provider.name.title()} generation failed: {str(e)}")
     
-    def _generate_anthropic(
+    def _stream_llm(
         self,
         prompt: str,
         model: str,
         config: GenerationConfig
-    ) -> str:
-        """Generate content using Anthropic Claude"""
-        if not self.anthropic_client:
-            raise ValueError("Anthropic client not initialized. Check API key.")
+    ):
+        """Stream content chunks through the LLM gateway"""
+        provider = self.gateway.resolve(model)
         
         try:
-            message = self.anthropic_client.messages.create(
+            yield from self.gateway.stream(
+                prompt,
                 model=model,
+                system=self._system_prompt(provider.name),
                 max_tokens=4000,
                 temperature=config.temperature,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
+                api_key=self._api_key(model),
+                provider=provider.name,
+                use_cache=self.use_cache
             )
-            
-            content = message.content[0].text
-            return content.strip()
         
         except Exception as e:
-            raise Exception(f"Anthropic generation failed: {str(e)}")
+            raise Exception(f"{provider.name.title()} generation failed: {str(e)}")
 
 
 # Example usage
@@ -0,0 +1,320 @@
+"""
+Drift Monitor - Rolling style statistics over generated content
+
+This module handles:
+- Recording the feature vector and voice match score of every generated output
+- Keeping an append-only time series per profile (one JSON line per output)
+- Maintaining long-run and recent (EWMA) means and variances with O(1) updates
+- Flagging features whose recent mean drifted significantly from the long run
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
+from .atomic_io import atomic_write, file_lock
+from .style_vectors import FEATURE_KEYS
+
+
+DRIFT_STATE_VERSION = 1
+
+# Tracked series: every style feature plus the overall voice match score
+DRIFT_FEATURES = [f"{section}.{key}" for section, key in FEATURE_KEYS] + ["voice_match_score"]
+
+DEFAULT_ALPHA = 0.1         # EWMA weight of the newest output (~19 output window)
+DEFAULT_THRESHOLD = 3.0     # z-score of the recent mean that counts as drift
+DEFAULT_MIN_SAMPLES = 10    # outputs needed before drift is reported
+
+
+def _profile_stem(name: str) -> str:
+    """File stem for a profile name (same sanitizing as profile files)"""
+    return name.lower().replace(" ", "_").replace("/", "_")
+
+
+def _to_list(values: np.ndarray) -> List[Optional[float]]:
+    return [None if np.isnan(value) else float(value) for value in values]
+
+
+def _from_list(values: List[Optional[float]]) -> np.ndarray:
+    return np.array([np.nan if value is None else value for value in values], dtype=float)
+
+
+class DriftState:
+    """Running statistics of one profile's outputs"""
+
+    def __init__(self, alpha: float = DEFAULT_ALPHA):
+        size = len(DRIFT_FEATURES)
+        self.alpha = alpha
+        self.offset = 0             # bytes of the log folded into the statistics
+        self.records = 0
+        self.first_recorded = None
+        self.last_recorded = None
+        # Welford accumulators (long run) and EWMA (recent), per feature
+        self.count = np.zeros(size)
+        self.mean = np.zeros(size)
+        self.m2 = np.zeros(size)
+        self.ewma_mean = np.zeros(size)
+        self.ewma_var = np.zeros(size)
+
+    def add(self, values: np.ndarray, timestamp: str):
+        """Fold one output into the statistics (NaN features are skipped)"""
+        seen = ~np.isnan(values)
+        x = np.where(seen, values, 0.0)
+        first = seen & (self.count == 0)
+
+        # Welford
+        self.count += seen
+        delta = x - self.mean
+        self.mean += np.where(seen, delta / np.maximum(self.count, 1), 0.0)
+        self.m2 += np.where(seen, delta * (x - self.mean), 0.0)
+
+        # Exponentially weighted mean and variance
+        diff = x - self.ewma_mean
+        increment = self.alpha * diff
+        self.ewma_mean = np.where(first, x, np.where(seen, self.ewma_mean + increment, self.ewma_mean))
+        self.ewma_var = np.where(
+            first, 0.0,
+            np.where(seen, (1 - self.alpha) * (self.ewma_var + diff * increment), self.ewma_var)
+        )
+
+        self.records += 1
+        self.first_recorded = self.first_recorded or timestamp
+        self.last_recorded = timestamp
+
+    def to_dict(self) -> Dict:
+        return {
+            "version": DRIFT_STATE_VERSION,
+            "features": DRIFT_FEATURES,
+            "alpha": self.alpha,
+            "offset": self.offset,
+            "records": self.records,
+            "first_recorded": self.first_recorded,
+            "last_recorded": self.last_recorded,
+            "count": self.count.tolist(),
+            "mean": self.mean.tolist(),
+            "m2": self.m2.tolist(),
+            "ewma_mean": self.ewma_mean.tolist(),
+            "ewma_var": self.ewma_var.tolist()
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> Optional["DriftState"]:
+        """Restore saved statistics (None if outdated or for other features)"""
+        if data.get("version") != DRIFT_STATE_VERSION or data.get("features") != DRIFT_FEATURES:
+            return None
+        state = cls(data["alpha"])
+        state.offset = data["offset"]
+        state.records = data["records"]
+        state.first_recorded = data["first_recorded"]
+        state.last_recorded = data["last_recorded"]
+        for field in ("count", "mean", "m2", "ewma_mean", "ewma_var"):
+            setattr(state, field, np.array(data[field], dtype=float))
+        return state
+
+
+class DriftMonitor:
+    """Append-only drift log and rolling statistics per voice profile"""
+
+    def __init__(
+        self,
+        drift_dir: Union[str, Path] = "./data/drift",
+        alpha: float = DEFAULT_ALPHA,
+        threshold: float = DEFAULT_THRESHOLD,
+        min_samples: int = DEFAULT_MIN_SAMPLES
+    ):
+        """
+        Args:
+            drift_dir: Directory holding the logs and statistics
+            alpha: EWMA weight of the newest output (smaller = longer window)
+            threshold: |z| above which a feature is reported as drifting
+            min_samples: Outputs needed before drift is reported
+        """
+        self.drift_dir = Path(drift_dir)
+        self.alpha = alpha
+        self.threshold = threshold
+        self.min_samples = min_samples
+
+    def record(
+        self,
+        name: str,
+        vector: np.ndarray,
+        match_score: Optional[float] = None,
+        source: Optional[str] = None,
+        format: Optional[str] = None
+    ) -> Dict:
+        """
+        Append one generated output to a profile's drift log
+
+        Args:
+            name: Voice profile name
+            vector: Style feature vector of the output (FEATURE_KEYS order)
+            match_score: Voice match score of the output (0-100)
+            source: Where the output came from (e.g. "generate", "stream", "multi_format")
+            format: Content format of the output (e.g. "linkedin")
+
+        Returns:
+            The appended record
+        """
+        values = np.append(np.asarray(vector, dtype=float), np.nan if match_score is None else match_score)
+        if len(values) != len(DRIFT_FEATURES):
+            raise ValueError(f"Expected {len(FEATURE_KEYS)} features, got {len(values) - 1}")
+
+        record = {
+            "timestamp": datetime.now().isoformat(),
+            "source": source,
+            "format": format,
+            "values": _to_list(values)
+        }
+        line = (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+
+        stem = _profile_stem(name)
+        self.drift_dir.mkdir(parents=True, exist_ok=True)
+        with file_lock(self._lock_path(stem)):
+            state = self._load_state(stem)
+            with open(self._log_path(stem), 'ab') as f:
+                if f.tell() != state.offset:
+                    # Statistics lag the log (e.g. a crash before the last state write)
+                    self._replay(stem, state)
+                if f.tell() != state.offset:
+                    # Terminate a torn final line so it is skipped, not merged
+                    f.write(b"\n")
+                    state.offset = f.tell()
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            state.add(values, record["timestamp"])
+            state.offset += len(line)
+            self._save_state(stem, state)
+
+        return record
+
+    def report(self, name: str) -> Dict[str, Any]:
+        """
+        Drift report of a profile
+
+        Each feature's recent EWMA mean is compared with its long-run mean;
+        the z-score divides by the EWMA's standard error over n outputs,
+        sigma * sqrt(sum of squared EWMA weights), which tends to
+        sigma * sqrt(a / (2 - a)) as n grows.
+
+        Returns:
+            {"profile", "records", "first_recorded", "last_recorded", "drifting",
+             "features": [{"feature", "count", "mean", "std", "recent_mean",
+                           "recent_std", "z_score", "drifting"}]}
+        """
+        stem = _profile_stem(name)
+        state = self._load_state(stem)
+        log_path = self._log_path(stem)
+        if log_path.exists() and log_path.stat().st_size != state.offset:
+            with file_lock(self._lock_path(stem)):
+                state = self._load_state(stem)
+                self._replay(stem, state)
+                self._save_state(stem, state)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            std = np.sqrt(np.where(state.count > 1, state.m2 / np.maximum(state.count - 1, 1), 0.0))
+            # The EWMA starts at the first output, which keeps weight (1 - a)^(n - 1)
+            decay = (1 - state.alpha) ** (2 * np.maximum(state.count - 1, 0))
+            weights_squared = decay + state.alpha ** 2 * (1 - decay) / (1 - (1 - state.alpha) ** 2)
+            standard_error = std * np.sqrt(weights_squared)
+            z_scores = np.where(standard_error > 0, (state.ewma_mean - state.mean) / standard_error, 0.0)
+
+        features = []
+        for i, feature in enumerate(DRIFT_FEATURES):
+            if not state.count[i]:
+                continue
+            features.append({
+                "feature": feature,
+                "count": int(state.count[i]),
+                "mean": round(float(state.mean[i]), 4),
+                "std": round(float(std[i]), 4),
+                "recent_mean": round(float(state.ewma_mean[i]), 4),
+                "recent_std": round(float(np.sqrt(state.ewma_var[i])), 4),
+                "z_score": round(float(z_scores[i]), 2),
+                "drifting": bool(state.count[i] >= self.min_samples and abs(z_scores[i]) > self.threshold)
+            })
+
+        return {
+            "profile": name,
+            "records": state.records,
+            "first_recorded": state.first_recorded,
+            "last_recorded": state.last_recorded,
+            "alpha": state.alpha,
+            "threshold": self.threshold,
+            "drifting": any(feature["drifting"] for feature in features),
+            "features": features
+        }
+
+    def _replay(self, stem: str, state: DriftState):
+        """Fold log lines past state.offset into the statistics (caller holds the lock)"""
+        log_path = self._log_path(stem)
+        if not log_path.exists():
+            return
+        with open(log_path, 'rb') as f:
+            f.seek(state.offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break   # Torn final write; the next append starts a fresh line
+                try:
+                    record = json.loads(line)
+                    state.add(_from_list(record["values"]), record["timestamp"])
+                except (ValueError, KeyError, TypeError):
+                    pass
+                state.offset += len(line)
+
+    def _load_state(self, stem: str) -> DriftState:
+        """Saved statistics, or empty ones (rebuilt from the log by _replay)"""
+        try:
+            with open(self._state_path(stem), 'r') as f:
+                state = DriftState.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError):
+            state = None
+        return state or DriftState(self.alpha)
+
+    def _save_state(self, stem: str, state: DriftState):
+        atomic_write(self._state_path(stem), json.dumps(state.to_dict()).encode("utf-8"))
+
+    def _log_path(self, stem: str) -> Path:
+        return self.drift_dir / f"{stem}.jsonl"
+
+    def _state_path(self, stem: str) -> Path:
+        return self.drift_dir / f"{stem}.state.json"
+
+    def _lock_path(self, stem: str) -> Path:
+        return self.drift_dir / "locks" / f"{stem}.lock"
+
+
+# Global instance
+_drift_monitor = None
+
+def get_drift_monitor() -> DriftMonitor:
+    """Get the process-wide drift monitor"""
+    global _drift_monitor
+    if _drift_monitor is None:
+        _drift_monitor = DriftMonitor(os.getenv('VOICECRAFT_DRIFT_DIR', './data/drift'))
+    return _drift_monitor
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    # Example: a voice that slowly shifts towards longer sentences
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        monitor = DriftMonitor(tmp)
+        base = np.full(len(FEATURE_KEYS), 10.0)
+        for i in range(60):
+            vector = base + rng.normal(0, 1, len(FEATURE_KEYS))
+            if i >= 40:
+                vector[0] += 4
+            monitor.record("Example Voice", vector, match_score=80 + rng.normal(0, 2))
+
+        report = monitor.report("Example Voice")
+        print(f"Records: {report['records']}, drifting: {report['drifting']}")
+        for feature in report["features"]:
+            if feature["drifting"]:
+                print(f"  {feature['feature']}: {feature['mean']} → {feature['recent_mean']} (z={feature['z_score']})")
@@ -6,19 +6,19 @@ while maintaining your authentic voice.
 """
 
 import os
+import threading
 from typing import Optional
 from pathlib import Path
 
-try:
-    from openai import OpenAI
-    from anthropic import Anthropic
-except ImportError:
-    OpenAI = None
-    Anthropic = None
-
+from .atomic_io import atomic_write
 from .llm_voice_analyzer import LLMVoiceAnalyzer
 
 
+def humanizer_prompt_path(profile_name: str) -> Path:
+    """Humanizer prompt file of a voice profile"""
+    return Path(f"./data/outputs/{profile_name.lower().replace(' ', '-')}-ai-humanizer-prompt.md")
+
+
 class Humanizer:
     """Humanize AI-generated text using personalized voice profile"""
     
@@ -27,8 +27,18 @@ class Humanizer:
         profile_name: str,
         openai_api_key: Optional[str] = None,
         anthropic_api_key: Optional[str] = None,
-        model: Optional[str] = None
+        model: Optional[str] = None,
+        use_cache: Optional[bool] = None
     ):
+        """
+        Args:
+            profile_name: Voice profile whose humanizer prompt is used
+            openai_api_key: OpenAI key (default: OPENAI_API_KEY)
+            anthropic_api_key: Anthropic key (default: ANTHROPIC_API_KEY)
+            model: Default model
+            use_cache: Reuse cached responses, e.g. for unchanged drafts
+                       (None = only for temperature 0)
+        """
         self.profile_name = profile_name
         self.model = model or "claude-haiku-4-5-20251001"
         
@@ -36,15 +46,22 @@ class Humanizer:
         self.analyzer = LLMVoiceAnalyzer(
             openai_api_key=openai_api_key,
             anthropic_api_key=anthropic_api_key,
-            default_model=self.model
+            default_model=self.model,
+            use_cache=use_cache
         )
         
-        # Load humanizer prompt
+        # Load humanizer prompt (generated once on first use if missing)
+        self._prompt_lock = threading.Lock()
         self.humanizer_prompt = self._load_humanizer_prompt()
     
+    @property
+    def prompt_path(self) -> Path:
+        """Humanizer prompt file of this profile"""
+        return humanizer_prompt_path(self.profile_name)
+    
     def _load_humanizer_prompt(self) -> Optional[str]:
         """Load the humanizer prompt for this profile"""
-        prompt_path = Path(f"./data/outputs/{self.profile_name.lower().replace(' ', '-')}-ai-humanizer-prompt.md")
+        prompt_path = self.prompt_path
         
         if prompt_path.exists():
             with open(prompt_path, 'r') as f:
@@ -72,11 +89,13 @@ class Humanizer:
         """
         model = model or self.model
         
-        # If prompt doesn't exist, generate it first
+        # If prompt doesn't exist, generate it first (once, even with concurrent callers)
         if not self.humanizer_prompt:
-            print("Generating humanizer prompt...")
-            self._generate_prompt()
-            self.humanizer_prompt = self._load_humanizer_prompt()
+            with self._prompt_lock:
+                if not self.humanizer_prompt:
+                    print("Generating humanizer prompt...")
+                    self._generate_prompt()
+                    self.humanizer_prompt = self._load_humanizer_prompt()
         
         if not self.humanizer_prompt:
             raise ValueError("Could not load or generate humanizer prompt")
@@ -85,12 +104,7 @@ class Humanizer:
         full_prompt = self.humanizer_prompt + "\n\n---\n\n**Text to humanize:**\n\n" + text
         
         # Call LLM
-        if "gpt" in model.lower():
-            humanized = self.analyzer._call_openai(full_prompt, model)
-        elif "claude" in model.lower():
-            humanized = self.analyzer._call_anthropic(full_prompt, model)
-        else:
-            raise ValueError(f"Unsupported model: {model}")
+        humanized = self.analyzer._call_llm(full_prompt, model)
         
         result = {
             "original": text,
@@ -112,10 +126,7 @@ HUMANIZED:
 What AI-isms were removed? What voice elements were added?
 """
             
-            if "gpt" in model.lower():
-                analysis = self.analyzer._call_openai(analysis_prompt, model)
-            else:
-                analysis = self.analyzer._call_anthropic(analysis_prompt, model)
+            analysis = self.analyzer._call_llm(analysis_prompt, model)
             
             result["analysis"] = analysis
         
@@ -150,11 +161,10 @@ What AI-isms were removed? What voice elements were added?
         )
         
         # Save it
-        output_path = Path(f"./data/outputs/{self.profile_name.lower().replace(' ', '-')}-ai-humanizer-prompt.md")
+        output_path = self.prompt_path
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, 'w') as f:
-            f.write(prompt)
+        atomic_write(output_path, prompt.encode("utf-8"))
         
         print(f"✓ Humanizer prompt generated: {output_path}")
 
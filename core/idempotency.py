@@ -0,0 +1,263 @@
+"""
+Idempotency - Replay and coalesce duplicate content requests
+
+This module handles:
+- Fingerprinting a request (endpoint, resolved profile, input, format and options)
+- Storing responses by Idempotency-Key in SQLite for a retention window
+- Reserving a key while its request runs, so duplicates in any process wait for it
+- Rejecting a key reused with a different request
+- Sharing one in-flight execution between concurrent identical requests
+
+Tuning (environment):
+    VOICECRAFT_IDEMPOTENCY_PATH      Database file (default ./data/idempotency/requests.sqlite)
+    VOICECRAFT_IDEMPOTENCY_TTL       Seconds a response is replayed for its key (default 24 hours)
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
+
+from .process_owner import owner_alive, owner_id
+
+
+DEFAULT_TTL = 24 * 3600
+RESERVATION_TTL = 15 * 60   # Seconds before a reservation of a vanished process is taken over
+
+
+def request_fingerprint(endpoint: str, payload: Dict) -> str:
+    """Stable key of a request: identical endpoint and payload, identical fingerprint"""
+    request = json.dumps({"endpoint": endpoint, "payload": payload}, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(request.encode("utf-8")).hexdigest()
+
+
+class IdempotencyConflict(ValueError):
+    """An Idempotency-Key was reused with a different request"""
+
+
+class IdempotencyInProgress(RuntimeError):
+    """The request of an Idempotency-Key is still running (in this or another process)"""
+
+
+class IdempotencyStore:
+    """
+    SQLite-backed responses keyed by Idempotency-Key, kept for a time-to-live
+
+    A key is reserved ("in_progress") while its request runs and holds the
+    response once it is stored ("complete").
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = "./data/idempotency/requests.sqlite",
+        ttl: float = DEFAULT_TTL,
+        reservation_ttl: float = RESERVATION_TTL
+    ):
+        """
+        Args:
+            path: SQLite database file
+            ttl: Seconds a stored response is replayed
+            reservation_ttl: Seconds a reservation blocks its key when its
+                             process can't be checked (another host)
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self.reservation_ttl = reservation_ttl
+        self.replays = 0
+        self.stores = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # One connection shared by threads (serialized by _lock); WAL lets processes share the file
+        self._db = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS requests ("
+                "key TEXT PRIMARY KEY, fingerprint TEXT, status INTEGER, response TEXT, created_at REAL, "
+                "state TEXT DEFAULT 'complete', owner TEXT)"
+            )
+            columns = {row[1] for row in self._db.execute("PRAGMA table_info(requests)")}
+            if "state" not in columns:
+                # Stores created before reservations
+                self._db.execute("ALTER TABLE requests ADD COLUMN state TEXT DEFAULT 'complete'")
+                self._db.execute("ALTER TABLE requests ADD COLUMN owner TEXT")
+            self._db.execute("CREATE INDEX IF NOT EXISTS requests_created ON requests (created_at)")
+
+    def get(self, key: str, fingerprint: str) -> Optional[Dict]:
+        """
+        The stored response of a key
+
+        Returns:
+            {"status", "response"} or None if the key is unknown, expired or
+            still in progress
+
+        Raises:
+            IdempotencyConflict: The key belongs to a different request
+        """
+        with self._lock, self._db:
+            row = self._db.execute(
+                "SELECT fingerprint, status, response FROM requests "
+                "WHERE key = ? AND created_at > ? AND state = 'complete'",
+                (key, time.time() - self.ttl)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[0] != fingerprint:
+                raise IdempotencyConflict("Idempotency-Key was already used for a different request")
+            self.replays += 1
+            return {"status": row[1], "response": json.loads(row[2])}
+
+    def reserve(self, key: str, fingerprint: str) -> Optional[Dict]:
+        """
+        Claim a key for a request about to run, or return its stored response
+
+        The check and the claim are one transaction, so of several processes
+        sending the same key exactly one gets to run it. A reservation whose
+        process is gone (or that is older than reservation_ttl) is taken over.
+
+        Returns:
+            None if the key is now reserved for the caller (run the request,
+            then put() or release()), else the stored {"status", "response"}
+
+        Raises:
+            IdempotencyConflict: The key belongs to a different request
+            IdempotencyInProgress: The key's request is still running
+        """
+        now = time.time()
+        with self._lock, self._db:
+            # Takes the write lock up front: no other process can claim the key in between
+            self._db.execute("BEGIN IMMEDIATE")
+            row = self._db.execute(
+                "SELECT fingerprint, status, response, created_at, state, owner FROM requests WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                stored_fingerprint, status, response, created_at, state, owner = row
+                expired = created_at <= now - self.ttl
+                abandoned = state == "in_progress" and (
+                    created_at <= now - self.reservation_ttl or not owner_alive(owner)
+                )
+                if expired or abandoned:
+                    row = None
+            if row is None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO requests (key, fingerprint, status, response, created_at, state, owner) "
+                    "VALUES (?, ?, NULL, NULL, ?, 'in_progress', ?)",
+                    (key, fingerprint, now, owner_id())
+                )
+                return None
+            if stored_fingerprint != fingerprint:
+                raise IdempotencyConflict("Idempotency-Key was already used for a different request")
+            if state == "in_progress":
+                raise IdempotencyInProgress("A request with this Idempotency-Key is still in progress")
+            self.replays += 1
+            return {"status": status, "response": json.loads(response)}
+
+    def put(self, key: str, fingerprint: str, status: int, response: Any):
+        """Store a response for its key (completing its reservation) and drop expired ones"""
+        now = time.time()
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO requests (key, fingerprint, status, response, created_at, state, owner) "
+                "VALUES (?, ?, ?, ?, ?, 'complete', NULL)",
+                (key, fingerprint, status, json.dumps(response, default=str), now)
+            )
+            self._db.execute("DELETE FROM requests WHERE created_at <= ?", (now - self.ttl,))
+            self.stores += 1
+
+    def release(self, key: str, fingerprint: str):
+        """Drop a reservation whose request failed, so a retry runs it again"""
+        with self._lock, self._db:
+            self._db.execute(
+                "DELETE FROM requests WHERE key = ? AND fingerprint = ? AND state = 'in_progress'",
+                (key, fingerprint)
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        """Stored keys, reservations and replay counts"""
+        with self._lock:
+            counts = dict(self._db.execute(
+                "SELECT state, COUNT(*) FROM requests WHERE created_at > ? GROUP BY state", (time.time() - self.ttl,)
+            ).fetchall())
+            return {
+                "keys": counts.get("complete", 0),
+                "in_progress": counts.get("in_progress", 0),
+                "replays": self.replays,
+                "stores": self.stores,
+                "ttl": self.ttl
+            }
+
+
+class InflightRequests:
+    """
+    Concurrent identical requests share one execution (per event loop)
+
+    The shared call is shielded: a caller that goes away doesn't cancel it
+    for the others.
+    """
+
+    def __init__(self):
+        self.executed = 0
+        self.coalesced = 0
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    async def run(self, fingerprint: str, call: Callable[[], Awaitable]) -> Any:
+        """
+        Await call(), or the identical call already in flight
+
+        Args:
+            fingerprint: Key of the request (see request_fingerprint)
+            call: Starts the work; only invoked if nothing identical is in flight
+
+        Returns:
+            The shared result (exceptions are shared as well)
+        """
+        task = self._inflight.get(fingerprint)
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._inflight[fingerprint] = task
+            task.add_done_callback(lambda _: self._inflight.pop(fingerprint, None))
+            self.executed += 1
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def stats(self) -> Dict[str, int]:
+        return {"in_flight": len(self._inflight), "executed": self.executed, "coalesced": self.coalesced}
+
+
+# Global instance
+_idempotency_store = None
+
+def get_idempotency_store() -> IdempotencyStore:
+    """Get the process-wide idempotency store"""
+    global _idempotency_store
+    if _idempotency_store is None:
+        _idempotency_store = IdempotencyStore(
+            os.getenv('VOICECRAFT_IDEMPOTENCY_PATH', './data/idempotency/requests.sqlite'),
+            float(os.getenv('VOICECRAFT_IDEMPOTENCY_TTL', DEFAULT_TTL))
+        )
+    return _idempotency_store
+
+
+if __name__ == "__main__":
+    # Example: three identical requests at once run the work a single time
+    async def main():
+        inflight = InflightRequests()
+        calls = []
+
+        async def generate():
+            calls.append(1)
+            await asyncio.sleep(0.2)
+            return {"content": "One draft for everyone"}
+
+        key = request_fingerprint("content", {"input_text": "Why focus beats hustle"})
+        results = await asyncio.gather(*(inflight.run(key, generate) for _ in range(3)))
+        print(f"{len(results)} responses from {len(calls)} execution: {inflight.stats()}")
+
+    asyncio.run(main())
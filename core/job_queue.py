@@ -0,0 +1,347 @@
+"""
+Job Queue - Background jobs for long-running content requests
+
+This module handles:
+- Accepting jobs and returning an id immediately
+- Running jobs on a bounded worker pool
+- Persisting job state and step-level progress in SQLite (secrets stay in memory)
+- Requeueing jobs interrupted by a restart
+- Delivering completion callbacks (webhooks) with retries
+
+Tuning (environment):
+    VOICECRAFT_JOBS_PATH         Database file (default ./data/jobs/jobs.sqlite)
+    VOICECRAFT_JOB_WORKERS       Jobs run at once per process (default 2)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from .process_owner import owner_alive, owner_id
+from .workflow_runs import public_params
+
+
+JOB_STATUSES = ("queued", "running", "succeeded", "failed")
+
+DEFAULT_WORKERS = 2
+MAX_ATTEMPTS = 3            # Runs interrupted by restarts before a job is failed
+CALLBACK_RETRIES = 3
+CALLBACK_TIMEOUT = 10
+
+# Handler: handler(params, report) -> result; report(step, status) records progress
+JobHandler = Callable[[Dict, Callable[[str, str], None]], Any]
+
+
+class JobQueue:
+    """SQLite-backed job queue with a worker pool and completion callbacks"""
+
+    def __init__(
+        self,
+        path: Union[str, Path] = "./data/jobs/jobs.sqlite",
+        workers: int = DEFAULT_WORKERS,
+        callback_retries: int = CALLBACK_RETRIES,
+        callback_backoff: float = 1.0,
+        redact: Optional[Callable[[Dict], Dict]] = None
+    ):
+        """
+        Args:
+            path: SQLite database file
+            workers: Jobs run at once
+            callback_retries: Delivery attempts of each completion callback
+            callback_backoff: Seconds before the first retry (doubling after each)
+            redact: Drops secrets from params before they are stored; the full
+                    params are kept in memory until this process runs the job
+                    (a job requeued after a restart runs with the stored ones)
+        """
+        self.path = Path(path)
+        self.workers = workers
+        self.callback_retries = callback_retries
+        self.callback_backoff = callback_backoff
+        self.redact = redact
+        self.handlers: Dict[str, JobHandler] = {}
+        self.owner = owner_id()
+        self._executor = None
+        self._params: Dict[str, Dict] = {}
+        self._running: set = set()      # Ids of jobs this queue is running
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # One connection shared by threads (serialized by _lock); WAL lets processes share the file
+        self._db = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        with self._lock, self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "id TEXT PRIMARY KEY, kind TEXT, status TEXT, params TEXT, result TEXT, error TEXT, "
+                "steps TEXT, callback_url TEXT, callback_status TEXT, attempts INTEGER, owner TEXT, "
+                "created_at TEXT, started_at TEXT, finished_at TEXT)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at)")
+
+    def register(self, kind: str, handler: JobHandler):
+        """Run jobs of this kind with handler(params, report)"""
+        self.handlers[kind] = handler
+
+    def start(self) -> int:
+        """
+        Start the worker pool and pick up unfinished jobs
+
+        Jobs left running by a process that no longer exists are requeued
+        (or failed after MAX_ATTEMPTS runs), as are jobs claimed under this
+        process's owner token that this queue isn't running; undelivered
+        callbacks are retried.
+
+        Returns:
+            Number of jobs requeued or resumed from the queue
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="job")
+
+        with self._lock, self._db:
+            for row in self._db.execute("SELECT id, owner, attempts FROM jobs WHERE status = 'running'").fetchall():
+                if row["id"] in self._running:
+                    continue
+                if row["owner"] != self.owner and owner_alive(row["owner"]):
+                    continue
+                if row["attempts"] >= MAX_ATTEMPTS:
+                    self._db.execute(
+                        "UPDATE jobs SET status = 'failed', error = ?, finished_at = ?, "
+                        "callback_status = CASE WHEN callback_url IS NULL THEN NULL ELSE 'pending' END WHERE id = ?",
+                        (f"Interrupted {row['attempts']} times", datetime.now().isoformat(), row["id"])
+                    )
+                else:
+                    self._db.execute("UPDATE jobs SET status = 'queued', owner = NULL WHERE id = ?", (row["id"],))
+            queued = [row["id"] for row in self._db.execute(
+                "SELECT id FROM jobs WHERE status = 'queued' ORDER BY created_at"
+            )]
+            undelivered = [row["id"] for row in self._db.execute(
+                "SELECT id FROM jobs WHERE status IN ('succeeded', 'failed') AND callback_status = 'pending'"
+            )]
+
+        for job_id in queued:
+            self._executor.submit(self._run, job_id)
+        for job_id in undelivered:
+            self._executor.submit(self._deliver, job_id)
+        return len(queued)
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker pool (queued jobs stay in the store for the next start)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def submit(self, kind: str, params: Dict, callback_url: Optional[str] = None) -> Dict:
+        """
+        Store a job and queue it for a worker
+
+        Args:
+            kind: Registered job kind (e.g. "content")
+            params: JSON-serializable handler parameters
+            callback_url: URL that receives the finished job as a JSON POST
+
+        Returns:
+            The stored job
+        """
+        if kind not in self.handlers:
+            raise ValueError(f"Unknown job kind: {kind}")
+
+        job_id = uuid.uuid4().hex
+        stored = self.redact(params) if self.redact else params
+        with self._lock, self._db:
+            if stored is not params:
+                self._params[job_id] = params
+            self._db.execute(
+                "INSERT INTO jobs (id, kind, status, params, steps, callback_url, attempts, created_at) "
+                "VALUES (?, ?, 'queued', ?, '[]', ?, 0, ?)",
+                (job_id, kind, json.dumps(stored), callback_url, datetime.now().isoformat())
+            )
+            executor = self._executor
+        if executor is not None:
+            executor.submit(self._run, job_id)
+        return self.get(job_id)
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """A job with its status, progress and result, without params (None if unknown)"""
+        with self._lock:
+            row = self._db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_dict(row) if row else None
+
+    def list(self, status: Optional[str] = None, limit: int = 50) -> List[Dict]:
+        """Most recent jobs first, without results"""
+        query = "SELECT * FROM jobs"
+        args: tuple = ()
+        if status:
+            query += " WHERE status = ?"
+            args = (status,)
+        with self._lock:
+            rows = self._db.execute(query + " ORDER BY created_at DESC LIMIT ?", args + (limit,)).fetchall()
+        jobs = []
+        for row in rows:
+            job = self._to_dict(row)
+            del job["result"]
+            jobs.append(job)
+        return jobs
+
+    def wait(self, job_id: str, timeout: Optional[float] = None, interval: float = 0.05) -> Optional[Dict]:
+        """Poll until a job finishes (returns it, possibly unfinished after timeout)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            job = self.get(job_id)
+            if job is None or job["status"] in ("succeeded", "failed"):
+                return job
+            if deadline is not None and time.monotonic() >= deadline:
+                return job
+            time.sleep(interval)
+
+    def stats(self) -> Dict[str, int]:
+        """Job count per status"""
+        with self._lock:
+            counts = dict(self._db.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+        return {status: counts.get(status, 0) for status in JOB_STATUSES}
+
+    def _run(self, job_id: str):
+        """Claim and run one job (skipped if another worker claimed it first)"""
+        with self._lock, self._db:
+            claimed = self._db.execute(
+                "UPDATE jobs SET status = 'running', owner = ?, started_at = ?, attempts = attempts + 1 "
+                "WHERE id = ? AND status = 'queued'",
+                (self.owner, datetime.now().isoformat(), job_id)
+            ).rowcount
+            params = self._params.pop(job_id, None)
+            row = self._db.execute("SELECT kind, params FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if claimed:
+                self._running.add(job_id)
+        if not claimed:
+            return
+
+        if params is None:
+            params = json.loads(row["params"])
+        handler = self.handlers.get(row["kind"])
+        try:
+            if handler is None:
+                raise ValueError(f"Unknown job kind: {row['kind']}")
+            result = handler(params, lambda step, status: self._progress(job_id, step, status))
+            self._finish(job_id, "succeeded", result=result)
+        except Exception as e:
+            self._finish(job_id, "failed", error=str(e))
+        finally:
+            with self._lock:
+                self._running.discard(job_id)
+
+        self._deliver(job_id)
+
+    def _progress(self, job_id: str, step: str, status: str):
+        """Record a step starting or finishing"""
+        with self._lock, self._db:
+            row = self._db.execute("SELECT steps FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            steps = json.loads(row["steps"])
+            entry = {"step": step, "status": status, "updated_at": datetime.now().isoformat()}
+            for i, existing in enumerate(steps):
+                if existing["step"] == step:
+                    steps[i] = entry
+                    break
+            else:
+                steps.append(entry)
+            self._db.execute("UPDATE jobs SET steps = ? WHERE id = ?", (json.dumps(steps), job_id))
+
+    def _finish(self, job_id: str, status: str, result: Any = None, error: Optional[str] = None):
+        with self._lock, self._db:
+            self._db.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ?, "
+                "callback_status = CASE WHEN callback_url IS NULL THEN NULL ELSE 'pending' END WHERE id = ?",
+                (status, json.dumps(result, default=str), error, datetime.now().isoformat(), job_id)
+            )
+
+    def _deliver(self, job_id: str):
+        """POST a finished job to its callback URL, retrying with backoff"""
+        job = self.get(job_id)
+        if not job or job["callback_status"] != "pending":
+            return
+
+        delivered = False
+        for attempt in range(self.callback_retries):
+            try:
+                status_code = self._post(job["callback_url"], job)
+                delivered = 200 <= status_code < 300
+                if delivered or 400 <= status_code < 500 and status_code not in (408, 429):
+                    break
+            except Exception as e:
+                print(f"⚠️  Job {job_id} callback failed: {e}")
+            if attempt + 1 < self.callback_retries:
+                time.sleep(self.callback_backoff * 2 ** attempt)
+
+        with self._lock, self._db:
+            self._db.execute(
+                "UPDATE jobs SET callback_status = ? WHERE id = ?",
+                ("delivered" if delivered else "failed", job_id)
+            )
+
+    def _post(self, url: str, payload: Dict) -> int:
+        """Send a callback (returns the HTTP status code)"""
+        import requests
+        response = requests.post(url, json=payload, timeout=CALLBACK_TIMEOUT)
+        return response.status_code
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> Dict:
+        return {
+            "id": row["id"],
+            "kind": row["kind"],
+            "status": row["status"],
+            "result": json.loads(row["result"]) if row["result"] else None,
+            "error": row["error"],
+            "steps": json.loads(row["steps"]),
+            "callback_url": row["callback_url"],
+            "callback_status": row["callback_status"],
+            "attempts": row["attempts"],
+            "created_at": row["created_at"],
+            "started_at": row["started_at"],
+            "finished_at": row["finished_at"]
+        }
+
+
+# Global instance
+_job_queue = None
+
+def get_job_queue() -> JobQueue:
+    """Get the process-wide job queue (call start() to run jobs)"""
+    global _job_queue
+    if _job_queue is None:
+        _job_queue = JobQueue(
+            os.getenv('VOICECRAFT_JOBS_PATH', './data/jobs/jobs.sqlite'),
+            workers=int(os.getenv('VOICECRAFT_JOB_WORKERS', DEFAULT_WORKERS)),
+            redact=public_params
+        )
+    return _job_queue
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    # Example: a two-step job polled until it finishes
+    def slow_job(params, report):
+        for step in ("draft", "polish"):
+            report(step, "running")
+            time.sleep(0.1)
+            report(step, "complete")
+        return {"content": params["topic"].upper()}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = JobQueue(Path(tmp) / "jobs.sqlite")
+        queue.register("example", slow_job)
+        queue.start()
+        job = queue.submit("example", {"topic": "focus beats hustle"})
+        print(f"Submitted {job['id']} ({job['status']})")
+        job = queue.wait(job["id"])
+        print(f"Finished: {job['status']}, steps: {[s['step'] for s in job['steps']]}, result: {job['result']}")
+        queue.shutdown()
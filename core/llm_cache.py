@@ -0,0 +1,190 @@
+"""
+LLM Cache - On-disk cache of LLM responses keyed by prompt fingerprint
+
+This module handles:
+- Fingerprinting a request (model, temperature, max_tokens, system and user prompt)
+- Storing responses in SQLite with a time-to-live
+- Size-based LRU eviction (entry count and total bytes)
+- Hit/miss statistics for monitoring
+
+Tuning (environment):
+    VOICECRAFT_LLM_CACHE             "0" disables the cache entirely
+    VOICECRAFT_LLM_CACHE_PATH        Database file (default ./data/cache/llm_cache.sqlite)
+    VOICECRAFT_LLM_CACHE_TTL         Seconds a response stays valid (default 7 days)
+    VOICECRAFT_LLM_CACHE_MAX_MB      Total response size kept (default 64)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+
+DEFAULT_TTL = 7 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 10000
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def fingerprint(
+    model: str,
+    prompt: str,
+    system: Optional[str] = None,
+    temperature: float = 0.7,
+    max_tokens: int = 4000,
+    provider: str = ""
+) -> str:
+    """Stable cache key of a completion request (provider keeps stub output apart)"""
+    request = json.dumps(
+        {
+            "provider": provider, "model": model, "system": system, "prompt": prompt,
+            "temperature": temperature, "max_tokens": max_tokens
+        },
+        sort_keys=True,
+        ensure_ascii=False
+    )
+    return hashlib.sha256(request.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """SQLite-backed response cache with TTL and LRU eviction"""
+
+    def __init__(
+        self,
+        path: Union[str, Path] = "./data/cache/llm_cache.sqlite",
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        """
+        Args:
+            path: SQLite database file
+            ttl: Seconds a cached response stays valid
+            max_entries: Entries kept before least recently used ones are evicted
+            max_bytes: Total response bytes kept before eviction
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # One connection shared by threads (serialized by _lock); WAL lets processes share the file
+        self._db = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, model TEXT, response TEXT, size INTEGER, "
+                "created_at REAL, accessed_at REAL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+
+    def get(self, key: str) -> Optional[str]:
+        """Cached response for a fingerprint (None on miss or expiry)"""
+        now = time.time()
+        with self._lock, self._db:
+            row = self._db.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.ttl:
+                if row is not None:
+                    self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.misses += 1
+                return None
+            self._db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            return row[0]
+
+    def put(self, key: str, response: str, model: str = ""):
+        """Store a response and evict least recently used entries beyond the limits"""
+        now = time.time()
+        size = len(response.encode("utf-8"))
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, model, response, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, response, size, now, now)
+            )
+            self.stores += 1
+            self._evict(now)
+
+    def clear(self):
+        """Drop every cached response and reset statistics"""
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM responses")
+            self.hits = self.misses = self.stores = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss statistics and current size"""
+        with self._lock:
+            entries, total = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "stores": self.stores,
+                "evictions": self.evictions,
+                "entries": entries,
+                "bytes": total,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes
+            }
+
+    def _evict(self, now: float):
+        """Remove expired entries, then the least recently used (caller holds the lock)"""
+        removed = self._db.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl,)).rowcount
+
+        entries, total = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if entries > self.max_entries or total > self.max_bytes:
+            rows = self._db.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall()
+            stale = []
+            for key, size in rows:
+                if entries <= self.max_entries and total <= self.max_bytes:
+                    break
+                stale.append((key,))
+                entries -= 1
+                total -= size
+            self._db.executemany("DELETE FROM responses WHERE key = ?", stale)
+            removed += len(stale)
+
+        self.evictions += removed
+
+
+# Global instance
+_llm_cache = None
+
+def get_llm_cache() -> Optional[LLMCache]:
+    """Get the process-wide LLM response cache (None if disabled)"""
+    global _llm_cache
+    if os.getenv('VOICECRAFT_LLM_CACHE', '1') == '0':
+        return None
+    if _llm_cache is None:
+        _llm_cache = LLMCache(
+            os.getenv('VOICECRAFT_LLM_CACHE_PATH', './data/cache/llm_cache.sqlite'),
+            ttl=float(os.getenv('VOICECRAFT_LLM_CACHE_TTL', DEFAULT_TTL)),
+            max_bytes=int(float(os.getenv('VOICECRAFT_LLM_CACHE_MAX_MB', DEFAULT_MAX_BYTES / 1024 / 1024)) * 1024 * 1024)
+        )
+    return _llm_cache
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    # Example: repeated prompts are served from disk
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = LLMCache(Path(tmp) / "cache.sqlite", max_entries=2)
+        for prompt in ["a", "b", "a", "c", "a"]:
+            key = fingerprint("stub", prompt, temperature=0)
+            if cache.get(key) is None:
+                cache.put(key, f"response to {prompt}", "stub")
+        print(cache.stats())
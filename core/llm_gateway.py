@@ -0,0 +1,712 @@
+"""
+LLM Gateway - One place for every language model call
+
+This module handles:
+- Routing a model name to a provider (Anthropic, OpenAI, offline stub) via a registry
+- Pooling provider clients so HTTP connections are reused across callers
+- Per-provider concurrency and request-rate limits, timeouts and jittered retry backoff
+- Synchronous (complete) and asyncio (acomplete) entry points
+- Streaming text chunks as they arrive (stream, astream)
+- Serving repeated deterministic requests from the on-disk response cache
+
+Tuning (environment):
+    VOICECRAFT_LLM_PROVIDER          Route every call to this provider (e.g. "stub")
+    VOICECRAFT_LLM_TIMEOUT           Request timeout in seconds (default 120)
+    VOICECRAFT_LLM_RETRIES           Retries after a transient failure (default 3)
+    VOICECRAFT_LLM_CONCURRENCY_<P>   In-flight requests per provider, e.g. ..._ANTHROPIC=8
+    VOICECRAFT_LLM_RPM_<P>           Requests per minute per provider, e.g. ..._OPENAI=500 (default unlimited)
+    VOICECRAFT_STUB_LATENCY          Simulated stub latency in seconds (default 0)
+"""
+
+import asyncio
+import hashlib
+import os
+import random
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
+
+from .llm_cache import LLMCache, fingerprint, get_llm_cache
+
+try:
+    from openai import OpenAI, AsyncOpenAI
+except ImportError:
+    print("Warning: openai not installed. Install with: pip install openai")
+    OpenAI = None
+    AsyncOpenAI = None
+
+try:
+    from anthropic import Anthropic, AsyncAnthropic
+except ImportError:
+    print("Warning: anthropic not installed. Install with: pip install anthropic")
+    Anthropic = None
+    AsyncAnthropic = None
+
+
+DEFAULT_TIMEOUT = 120.0
+DEFAULT_RETRIES = 3
+BACKOFF_BASE = 0.5      # seconds before the first retry (upper bound, jittered)
+BACKOFF_CAP = 8.0
+
+# HTTP statuses worth retrying (plus any 5xx)
+RETRYABLE_STATUS = {408, 409, 429}
+
+
+@dataclass
+class LLMRequest:
+    """A single completion request"""
+    prompt: str
+    model: str
+    system: Optional[str] = None
+    max_tokens: int = 4000
+    temperature: float = 0.7
+    api_key: Optional[str] = None
+    timeout: float = DEFAULT_TIMEOUT
+
+
+def is_retryable(error: Exception) -> bool:
+    """Whether an error is transient (rate limit, timeout, connection, server error)"""
+    status = getattr(error, "status_code", None)
+    if isinstance(status, int):
+        return status in RETRYABLE_STATUS or status >= 500
+    if isinstance(error, (TimeoutError, ConnectionError, asyncio.TimeoutError)):
+        return True
+    # SDK connection/timeout errors carry no status code
+    return type(error).__name__ in ("APIConnectionError", "APITimeoutError")
+
+
+class LLMProvider:
+    """Base class of gateway providers"""
+
+    name = ""
+    default_concurrency = 8
+
+    def matches(self, model: str) -> bool:
+        """Whether this provider serves the model"""
+        return False
+
+    def available(self, api_key: Optional[str] = None) -> bool:
+        """Whether the provider can make calls (SDK installed, key present)"""
+        return True
+
+    def complete(self, request: LLMRequest) -> str:
+        raise NotImplementedError
+
+    async def acomplete(self, request: LLMRequest) -> str:
+        raise NotImplementedError
+
+    def stream(self, request: LLMRequest) -> Iterator[str]:
+        """Yield text chunks (providers without streaming yield one chunk)"""
+        yield self.complete(request)
+
+    async def astream(self, request: LLMRequest) -> AsyncIterator[str]:
+        yield await self.acomplete(request)
+
+
+class _PooledClientProvider(LLMProvider):
+    """Provider whose SDK clients are created once per API key and shared"""
+
+    env_key = ""
+    sync_class = None
+    async_class = None
+
+    def __init__(self):
+        self._clients: Dict[tuple, Any] = {}
+        self._lock = threading.Lock()
+
+    def api_key(self, api_key: Optional[str] = None) -> Optional[str]:
+        return api_key or os.getenv(self.env_key)
+
+    def available(self, api_key: Optional[str] = None) -> bool:
+        return self.sync_class is not None and bool(self.api_key(api_key))
+
+    def client(self, api_key: Optional[str] = None, asynchronous: bool = False):
+        """Shared SDK client for an API key (None if unavailable)"""
+        key = self.api_key(api_key)
+        client_class = self.async_class if asynchronous else self.sync_class
+        if not key or client_class is None:
+            return None
+
+        with self._lock:
+            client = self._clients.get((key, asynchronous))
+            if client is None:
+                # The gateway retries; the SDK's own retries would multiply attempts
+                client = self._clients[(key, asynchronous)] = client_class(api_key=key, max_retries=0)
+            return client
+
+    def _require_client(self, request: LLMRequest, asynchronous: bool = False):
+        client = self.client(request.api_key, asynchronous)
+        if client is None:
+            raise ValueError(f"{self.name.title()} client not initialized. Check API key.")
+        return client
+
+
+class AnthropicProvider(_PooledClientProvider):
+    """Anthropic Claude models"""
+
+    name = "anthropic"
+    env_key = "ANTHROPIC_API_KEY"
+    sync_class = Anthropic
+    async_class = AsyncAnthropic
+
+    def matches(self, model: str) -> bool:
+        return model.lower().startswith("claude")
+
+    def _params(self, request: LLMRequest) -> Dict:
+        params = {
+            "model": request.model,
+            "max_tokens": request.max_tokens,
+            "temperature": request.temperature,
+            "messages": [{"role": "user", "content": request.prompt}],
+            "timeout": request.timeout
+        }
+        if request.system:
+            params["system"] = request.system
+        return params
+
+    def complete(self, request: LLMRequest) -> str:
+        message = self._require_client(request).messages.create(**self._params(request))
+        return message.content[0].text
+
+    async def acomplete(self, request: LLMRequest) -> str:
+        message = await self._require_client(request, asynchronous=True).messages.create(**self._params(request))
+        return message.content[0].text
+
+    def stream(self, request: LLMRequest) -> Iterator[str]:
+        with self._require_client(request).messages.stream(**self._params(request)) as stream:
+            for text in stream.text_stream:
+                yield text
+
+    async def astream(self, request: LLMRequest) -> AsyncIterator[str]:
+        async with self._require_client(request, asynchronous=True).messages.stream(**self._params(request)) as stream:
+            async for text in stream.text_stream:
+                yield text
+
+
+class OpenAIProvider(_PooledClientProvider):
+    """OpenAI GPT and o-series models"""
+
+    name = "openai"
+    env_key = "OPENAI_API_KEY"
+    sync_class = OpenAI
+    async_class = AsyncOpenAI
+
+    # Model id prefixes served by OpenAI (substring tests would misroute e.g. "...-o1-...")
+    model_prefixes = ("gpt-", "chatgpt-", "ft:", "o1", "o3", "o4")
+
+    def matches(self, model: str) -> bool:
+        return model.lower().startswith(self.model_prefixes)
+
+    def _params(self, request: LLMRequest) -> Dict:
+        messages = [{"role": "user", "content": request.prompt}]
+        if request.system:
+            messages.insert(0, {"role": "system", "content": request.system})
+        return {
+            "model": request.model,
+            "messages": messages,
+            "temperature": request.temperature,
+            "max_tokens": request.max_tokens,
+            "timeout": request.timeout
+        }
+
+    def complete(self, request: LLMRequest) -> str:
+        response = self._require_client(request).chat.completions.create(**self._params(request))
+        return response.choices[0].message.content
+
+    async def acomplete(self, request: LLMRequest) -> str:
+        response = await self._require_client(request, asynchronous=True).chat.completions.create(**self._params(request))
+        return response.choices[0].message.content
+
+    def stream(self, request: LLMRequest) -> Iterator[str]:
+        for chunk in self._require_client(request).chat.completions.create(**self._params(request), stream=True):
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    async def astream(self, request: LLMRequest) -> AsyncIterator[str]:
+        client = self._require_client(request, asynchronous=True)
+        async for chunk in await client.chat.completions.create(**self._params(request), stream=True):
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+
+_STUB_WORDS = (
+    "the team", "a founder", "every leader", "a customer", "every writer", "the best company",
+    "builds", "ignores", "measures", "questions", "rewards", "protects",
+    "trust", "focus", "clarity", "momentum", "culture", "feedback", "the work", "simple habits"
+)
+
+
+class StubProvider(LLMProvider):
+    """Offline provider returning deterministic prose (tests, load tests, demos)"""
+
+    name = "stub"
+    default_concurrency = 64
+
+    def __init__(self, latency: Optional[float] = None):
+        self.latency = latency
+
+    def matches(self, model: str) -> bool:
+        return model.lower().startswith("stub")
+
+    def _latency(self) -> float:
+        if self.latency is not None:
+            return self.latency
+        return float(os.getenv("VOICECRAFT_STUB_LATENCY", "0"))
+
+    def _text(self, request: LLMRequest) -> str:
+        seed = hashlib.sha256(f"{request.model}\n{request.system}\n{request.prompt}".encode("utf-8")).digest()
+        rng = random.Random(seed)
+        sentences = []
+        for _ in range(max(3, min(request.max_tokens // 40, 12))):
+            subject, verb, obj = rng.choice(_STUB_WORDS[:6]), rng.choice(_STUB_WORDS[6:12]), rng.choice(_STUB_WORDS[12:])
+            sentences.append(f"{subject.capitalize()} {verb} {obj}.")
+        return " ".join(sentences)
+
+    def complete(self, request: LLMRequest) -> str:
+        if self._latency():
+            time.sleep(self._latency())
+        return self._text(request)
+
+    async def acomplete(self, request: LLMRequest) -> str:
+        if self._latency():
+            await asyncio.sleep(self._latency())
+        return self._text(request)
+
+    def _chunks(self, request: LLMRequest) -> list:
+        words = self._text(request).split(" ")
+        return [words[0]] + [f" {word}" for word in words[1:]]
+
+    def stream(self, request: LLMRequest) -> Iterator[str]:
+        chunks = self._chunks(request)
+        for chunk in chunks:
+            if self._latency():
+                time.sleep(self._latency() / len(chunks))
+            yield chunk
+
+    async def astream(self, request: LLMRequest) -> AsyncIterator[str]:
+        chunks = self._chunks(request)
+        for chunk in chunks:
+            if self._latency():
+                await asyncio.sleep(self._latency() / len(chunks))
+            yield chunk
+
+
+class RateLimiter:
+    """Token bucket pacing requests to a per-minute rate (thread and asyncio safe)"""
+
+    def __init__(self, per_minute: float, burst: int = 1):
+        """
+        Args:
+            per_minute: Sustained requests per minute
+            burst: Requests allowed back to back before pacing starts
+        """
+        self.per_minute = per_minute
+        self.burst = burst
+        self._rate = per_minute / 60.0
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take the next slot; returns seconds to wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self._rate)
+
+    def acquire(self) -> float:
+        """Block until a request may be sent (returns seconds waited)"""
+        wait = self.reserve()
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    async def aacquire(self) -> float:
+        """Async version of acquire"""
+        wait = self.reserve()
+        if wait:
+            await asyncio.sleep(wait)
+        return wait
+
+
+class LLMGateway:
+    """Provider registry plus shared limits, timeouts and retries"""
+
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        retries: Optional[int] = None,
+        cache: Optional[LLMCache] = None
+    ):
+        """
+        Args:
+            timeout: Default request timeout in seconds
+            retries: Retries after a transient failure
+            cache: Response cache (default: the process-wide cache)
+        """
+        self.cache = cache
+        self.timeout = timeout if timeout is not None else float(os.getenv("VOICECRAFT_LLM_TIMEOUT", DEFAULT_TIMEOUT))
+        self.retries = retries if retries is not None else int(os.getenv("VOICECRAFT_LLM_RETRIES", DEFAULT_RETRIES))
+        self.providers: Dict[str, LLMProvider] = {}
+        self._limits: Dict[str, int] = {}
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        # Per event loop (asyncio primitives are loop-bound); entries go away with their loop
+        self._async_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._rate_limiters: Dict[str, Optional[RateLimiter]] = {}
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+        for provider in (AnthropicProvider(), OpenAIProvider(), StubProvider()):
+            self.register(provider)
+
+    def register(
+        self,
+        provider: LLMProvider,
+        concurrency: Optional[int] = None,
+        rate_per_minute: Optional[float] = None
+    ):
+        """
+        Add or replace a provider
+
+        Args:
+            provider: Provider instance (looked up by provider.name)
+            concurrency: Max in-flight requests (default: env or provider default)
+            rate_per_minute: Max requests started per minute (default: env or unlimited)
+        """
+        if concurrency is None:
+            env_limit = os.getenv(f"VOICECRAFT_LLM_CONCURRENCY_{provider.name.upper()}")
+            concurrency = int(env_limit) if env_limit else provider.default_concurrency
+        if rate_per_minute is None:
+            env_rate = os.getenv(f"VOICECRAFT_LLM_RPM_{provider.name.upper()}")
+            rate_per_minute = float(env_rate) if env_rate else None
+        self.set_rate_limit(provider.name, rate_per_minute)
+        with self._lock:
+            self.providers[provider.name] = provider
+            self._limits[provider.name] = concurrency
+            self._semaphores[provider.name] = threading.BoundedSemaphore(concurrency)
+            for semaphores in self._async_semaphores.values():
+                semaphores.pop(provider.name, None)
+            self._stats.setdefault(provider.name, {"calls": 0, "retries": 0, "failures": 0, "throttled": 0})
+
+    def set_rate_limit(self, provider: str, per_minute: Optional[float], burst: int = 1):
+        """Pace a provider to per_minute requests (None or 0 removes the limit)"""
+        with self._lock:
+            self._rate_limiters[provider] = RateLimiter(per_minute, burst) if per_minute else None
+
+    def resolve(self, model: str, provider: Optional[str] = None) -> LLMProvider:
+        """
+        Pick the provider for a model
+
+        VOICECRAFT_LLM_PROVIDER overrides routing for every call.
+        """
+        name = provider or os.getenv("VOICECRAFT_LLM_PROVIDER")
+        if name:
+            if name not in self.providers:
+                raise ValueError(f"Unknown LLM provider: {name}")
+            return self.providers[name]
+
+        for candidate in self.providers.values():
+            if candidate.matches(model):
+                return candidate
+        raise ValueError(f"Unsupported model: {model}")
+
+    def available(self, model: Optional[str] = None, api_key: Optional[str] = None) -> bool:
+        """Whether a model (or any provider, if model is None) can be called"""
+        if model is None:
+            override = os.getenv("VOICECRAFT_LLM_PROVIDER")
+            if override:
+                return override in self.providers and self.providers[override].available(api_key)
+            return any(p.available() for p in self.providers.values() if p.name != "stub")
+        try:
+            return self.resolve(model).available(api_key)
+        except ValueError:
+            return False
+
+    def client(self, provider: str, api_key: Optional[str] = None):
+        """Shared SDK client of a provider (None if unavailable or not SDK based)"""
+        target = self.providers.get(provider)
+        return target.client(api_key) if isinstance(target, _PooledClientProvider) else None
+
+    def _request(self, prompt, model, system, max_tokens, temperature, api_key, timeout) -> LLMRequest:
+        return LLMRequest(
+            prompt=prompt,
+            model=model,
+            system=system,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            api_key=api_key,
+            timeout=timeout if timeout is not None else self.timeout
+        )
+
+    def complete(
+        self,
+        prompt: str,
+        model: str,
+        system: Optional[str] = None,
+        max_tokens: int = 4000,
+        temperature: float = 0.7,
+        api_key: Optional[str] = None,
+        timeout: Optional[float] = None,
+        provider: Optional[str] = None,
+        use_cache: Optional[bool] = None
+    ) -> str:
+        """
+        Run a completion, retrying transient failures
+
+        Args:
+            prompt: User prompt
+            model: Model name (also selects the provider)
+            system: Optional system prompt
+            max_tokens: Completion token limit
+            temperature: Sampling temperature
+            api_key: Provider API key (default: from environment)
+            timeout: Request timeout in seconds (default: gateway timeout)
+            provider: Force a provider by name
+            use_cache: True to use the response cache, False to bypass it,
+                       None to cache only deterministic (temperature 0) requests
+
+        Returns:
+            Completion text
+        """
+        target = self.resolve(model, provider)
+        request = self._request(prompt, model, system, max_tokens, temperature, api_key, timeout)
+
+        cache, key = self._response_cache(target, request, use_cache)
+        if cache is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+
+        for attempt in range(self.retries + 1):
+            self._throttle(target.name)
+            with self._semaphores[target.name]:
+                try:
+                    self._count(target.name, "calls")
+                    return self._cache_store(cache, key, request, target.complete(request))
+                except Exception as e:
+                    if attempt >= self.retries or not is_retryable(e):
+                        self._count(target.name, "failures")
+                        raise
+            self._count(target.name, "retries")
+            time.sleep(self._backoff(attempt))
+
+    async def acomplete(
+        self,
+        prompt: str,
+        model: str,
+        system: Optional[str] = None,
+        max_tokens: int = 4000,
+        temperature: float = 0.7,
+        api_key: Optional[str] = None,
+        timeout: Optional[float] = None,
+        provider: Optional[str] = None,
+        use_cache: Optional[bool] = None
+    ) -> str:
+        """Async version of complete (same arguments)"""
+        target = self.resolve(model, provider)
+        request = self._request(prompt, model, system, max_tokens, temperature, api_key, timeout)
+
+        cache, key = self._response_cache(target, request, use_cache)
+        if cache is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+
+        for attempt in range(self.retries + 1):
+            await self._athrottle(target.name)
+            async with self._async_semaphore(target.name):
+                try:
+                    self._count(target.name, "calls")
+                    response = await asyncio.wait_for(target.acomplete(request), request.timeout)
+                    return self._cache_store(cache, key, request, response)
+                except Exception as e:
+                    if attempt >= self.retries or not is_retryable(e):
+                        self._count(target.name, "failures")
+                        raise
+            self._count(target.name, "retries")
+            await asyncio.sleep(self._backoff(attempt))
+
+    def _response_cache(self, target: LLMProvider, request: LLMRequest, use_cache: Optional[bool]) -> tuple:
+        """Cache and key for a request, or (None, None) when it should not be cached"""
+        if use_cache is False or (use_cache is None and request.temperature > 0):
+            return None, None
+        cache = self.cache or get_llm_cache()
+        if cache is None:
+            return None, None
+        key = fingerprint(
+            request.model,
+            request.prompt,
+            system=request.system,
+            temperature=request.temperature,
+            max_tokens=request.max_tokens,
+            provider=target.name
+        )
+        return cache, key
+
+    def _cache_store(self, cache: Optional[LLMCache], key: Optional[str], request: LLMRequest, response: str) -> str:
+        if cache is not None and response:
+            cache.put(key, response, request.model)
+        return response
+
+    def stream(
+        self,
+        prompt: str,
+        model: str,
+        system: Optional[str] = None,
+        max_tokens: int = 4000,
+        temperature: float = 0.7,
+        api_key: Optional[str] = None,
+        timeout: Optional[float] = None,
+        provider: Optional[str] = None,
+        use_cache: Optional[bool] = None
+    ) -> Iterator[str]:
+        """
+        Yield completion text chunks as they arrive (same arguments as complete)
+
+        Transient failures are retried only until the first chunk was
+        yielded; the concurrency slot is held until the stream finishes or
+        the caller stops iterating.
+        """
+        target = self.resolve(model, provider)
+        request = self._request(prompt, model, system, max_tokens, temperature, api_key, timeout)
+
+        cache, key = self._response_cache(target, request, use_cache)
+        if cache is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                yield cached
+                return
+
+        for attempt in range(self.retries + 1):
+            chunks = []
+            self._throttle(target.name)
+            with self._semaphores[target.name]:
+                try:
+                    self._count(target.name, "calls")
+                    for chunk in target.stream(request):
+                        chunks.append(chunk)
+                        yield chunk
+                    self._cache_store(cache, key, request, "".join(chunks))
+                    return
+                except Exception as e:
+                    if chunks or attempt >= self.retries or not is_retryable(e):
+                        self._count(target.name, "failures")
+                        raise
+            self._count(target.name, "retries")
+            time.sleep(self._backoff(attempt))
+
+    async def astream(
+        self,
+        prompt: str,
+        model: str,
+        system: Optional[str] = None,
+        max_tokens: int = 4000,
+        temperature: float = 0.7,
+        api_key: Optional[str] = None,
+        timeout: Optional[float] = None,
+        provider: Optional[str] = None,
+        use_cache: Optional[bool] = None
+    ) -> AsyncIterator[str]:
+        """Async version of stream (same arguments)"""
+        target = self.resolve(model, provider)
+        request = self._request(prompt, model, system, max_tokens, temperature, api_key, timeout)
+
+        cache, key = self._response_cache(target, request, use_cache)
+        if cache is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                yield cached
+                return
+
+        for attempt in range(self.retries + 1):
+            chunks = []
+            await self._athrottle(target.name)
+            async with self._async_semaphore(target.name):
+                try:
+                    self._count(target.name, "calls")
+                    async for chunk in target.astream(request):
+                        chunks.append(chunk)
+                        yield chunk
+                    self._cache_store(cache, key, request, "".join(chunks))
+                    return
+                except Exception as e:
+                    if chunks or attempt >= self.retries or not is_retryable(e):
+                        self._count(target.name, "failures")
+                        raise
+            self._count(target.name, "retries")
+            await asyncio.sleep(self._backoff(attempt))
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Calls, retries, failures, throttled calls and limits per provider"""
+        with self._lock:
+            return {
+                name: dict(
+                    counts,
+                    concurrency=self._limits[name],
+                    rate_per_minute=self._rate_limiters[name].per_minute if self._rate_limiters.get(name) else None
+                )
+                for name, counts in self._stats.items()
+            }
+
+    def _throttle(self, provider: str):
+        """Wait for the provider's rate limit (if any)"""
+        limiter = self._rate_limiters.get(provider)
+        if limiter is not None and limiter.acquire():
+            self._count(provider, "throttled")
+
+    async def _athrottle(self, provider: str):
+        limiter = self._rate_limiters.get(provider)
+        if limiter is not None and await limiter.aacquire():
+            self._count(provider, "throttled")
+
+    def _async_semaphore(self, provider: str) -> asyncio.Semaphore:
+        """Concurrency limit for the running event loop (asyncio primitives are loop-bound)"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            # A semaphore that has blocked keeps its loop alive, so closed loops are dropped here too
+            for closed in [other for other in self._async_semaphores if other.is_closed()]:
+                del self._async_semaphores[closed]
+            semaphores = self._async_semaphores.setdefault(loop, {})
+            semaphore = semaphores.get(provider)
+            if semaphore is None:
+                semaphore = semaphores[provider] = asyncio.Semaphore(self._limits[provider])
+            return semaphore
+
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff"""
+        return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+
+    def _count(self, provider: str, field: str):
+        with self._lock:
+            self._stats[provider][field] += 1
+
+
+# Global instance
+_llm_gateway = None
+
+def get_llm_gateway() -> LLMGateway:
+    """Get the process-wide LLM gateway"""
+    global _llm_gateway
+    if _llm_gateway is None:
+        _llm_gateway = LLMGateway()
+    return _llm_gateway
+
+
+if __name__ == "__main__":
+    # Example: offline calls through the stub provider
+    gateway = get_llm_gateway()
+    print(gateway.complete("Write one paragraph about focus.", model="stub"))
+
+    async def fan_out():
+        prompts = [f"Idea {i}" for i in range(5)]
+        return await asyncio.gather(*(gateway.acomplete(p, model="stub", max_tokens=120) for p in prompts))
+
+    for text in asyncio.run(fan_out()):
+        print(f"- {text[:60]}...")
+    print(gateway.stats())
@@ -10,19 +10,14 @@ import os
 from typing import Dict, List, Optional, Any
 import json
 
-try:
-    from openai import OpenAI
-    from anthropic import Anthropic
-except ImportError:
-    OpenAI = None
-    Anthropic = None
-
 import sys
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from core.llm_gateway import get_llm_gateway
+
 try:
     from prompts.voice_analysis_prompts import (
         PERSONAL_BRAND_VOICE_GUIDE_PROMPT,
@@ -52,22 +47,41 @@ class LLMVoiceAnalyzer:
         self,
         openai_api_key: Optional[str] = None,
         anthropic_api_key: Optional[str] = None,
-        default_model: str = "gpt-4-turbo-preview"
+        default_model: str = "gpt-4-turbo-preview",
+        use_cache: Optional[bool] = None
     ):
+        """
+        Args:
+            openai_api_key: OpenAI key (default: OPENAI_API_KEY)
+            anthropic_api_key: Anthropic key (default: ANTHROPIC_API_KEY)
+            default_model: Model used when a call doesn't name one
+            use_cache: Reuse cached LLM responses (None = only for temperature 0)
+        """
+        self.use_cache = use_cache
         self.openai_api_key = openai_api_key or os.getenv("OPENAI_API_KEY")
         self.anthropic_api_key = anthropic_api_key or os.getenv("ANTHROPIC_API_KEY")
         # Use Claude 4.5 Haiku for writing, GPT-4o for analysis
         self.default_model = default_model or "claude-haiku-4-5-20251001"
         
-        if OpenAI and self.openai_api_key:
-            self.openai_client = OpenAI(api_key=self.openai_api_key)
-        else:
-            self.openai_client = None
-        
-        if Anthropic and self.anthropic_api_key:
-            self.anthropic_client = Anthropic(api_key=self.anthropic_api_key)
-        else:
-            self.anthropic_client = None
+        # Provider calls go through the shared gateway (pooled clients, limits, retries)
+        self.gateway = get_llm_gateway()
+    
+    @property
+    def openai_client(self):
+        """Shared OpenAI client (None without an API key)"""
+        return self.gateway.client("openai", self.openai_api_key)
+    
+    @property
+    def anthropic_client(self):
+        """Shared Anthropic client (None without an API key)"""
+        return self.gateway.client("anthropic", self.anthropic_api_key)
+    
+    def available(self, model: Optional[str] = None) -> bool:
+        """Whether analysis can run (for model, or with any configured provider)"""
+        if model is None:
+            return bool(self.openai_client or self.anthropic_client) or self.gateway.available()
+        provider = self.gateway.resolve(model).name
+        return self.gateway.available(model, self._api_keys().get(provider))
     
     def create_personal_brand_voice_guide(
         self,
@@ -115,12 +129,7 @@ class LLMVoiceAnalyzer:
         prompt += "Please analyze these samples and create the complete Personal & Brand Voice Guide following the output structure."
         
         # Generate via LLM
-        if "gpt" in model.lower():
-            response = self._call_openai(prompt, model)
-        elif "claude" in model.lower():
-            response = self._call_anthropic(prompt, model)
-        else:
-            raise ValueError(f"Unsupported model: {model}")
+        response = self._call_llm(prompt, model)
         
         # Parse response (assuming structured output)
         # In practice, you'd parse the markdown/structured response
@@ -152,12 +161,7 @@ class LLMVoiceAnalyzer:
         prompt += f"<user_transcript>\n{transcript}\n</user_transcript>\n\n"
         prompt += "Please analyze this transcript and generate all three artifacts."
         
-        if "gpt" in model.lower():
-            response = self._call_openai(prompt, model)
-        elif "claude" in model.lower():
-            response = self._call_anthropic(prompt, model)
-        else:
-            raise ValueError(f"Unsupported model: {model}")
+        response = self._call_llm(prompt, model)
         
         return {
             "analysis": response,
@@ -217,12 +221,7 @@ class LLMVoiceAnalyzer:
         prompt += f"<avatar_blueprint>\n{json.dumps(avatar_blueprint, indent=2)}\n</avatar_blueprint>\n\n"
         prompt += "Please analyze for friction points and create the adjustment guide."
         
-        if "gpt" in model.lower():
-            response = self._call_openai(prompt, model)
-        elif "claude" in model.lower():
-            response = self._call_anthropic(prompt, model)
-        else:
-            raise ValueError(f"Unsupported model: {model}")
+        response = self._call_llm(prompt, model)
         
         return {
             "friction_analysis": response,
@@ -252,12 +251,7 @@ class LLMVoiceAnalyzer:
         prompt += f"<transcripts>\n{combined_transcripts}\n</transcripts>\n\n"
         prompt += "Please detect all speakers and present findings."
         
-        if "gpt" in model.lower():
-            response = self._call_openai(prompt, model)
-        elif "claude" in model.lower():
-            response = self._call_anthropic(prompt, model)
-        else:
-            raise ValueError(f"Unsupported model: {model}")
+        response = self._call_llm(prompt, model)
         
         return {
             "speaker_detection": response,
@@ -366,46 +360,29 @@ Signal>Noise serves as a bridge between technology and human creativity, positio
         
         return identity
     
-    def _call_openai(self, prompt: str, model: str) -> str:
-        """Call OpenAI API."""
-        if not self.openai_client:
-            raise ValueError("OpenAI client not initialized")
+    def _api_keys(self) -> Dict[str, Optional[str]]:
+        return {"openai": self.openai_api_key, "anthropic": self.anthropic_api_key}
+    
+    def _call_llm(self, prompt: str, model: str) -> str:
+        """Call the model through the LLM gateway."""
+        provider = self.gateway.resolve(model).name
         
         # Adjust max_tokens based on model
         # GPT-4 Turbo supports up to 4096 completion tokens
         # GPT-4o supports up to 16384 completion tokens
-        if "gpt-4o" in model.lower():
+        if provider != "openai" or "gpt-4o" in model.lower():
             max_tokens = 8000
-        elif "gpt-4-turbo" in model.lower() or "gpt-4-0125" in model.lower():
-            max_tokens = 4096
         else:
             max_tokens = 4096  # Safe default
         
-        response = self.openai_client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": "You are an expert voice analyst."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=max_tokens
-        )
-        
-        return response.choices[0].message.content
-    
-    def _call_anthropic(self, prompt: str, model: str) -> str:
-        """Call Anthropic API."""
-        if not self.anthropic_client:
-            raise ValueError("Anthropic client not initialized")
-        
-        message = self.anthropic_client.messages.create(
+        return self.gateway.complete(
+            prompt,
             model=model,
-            max_tokens=8000,
+            system="You are an expert voice analyst." if provider == "openai" else None,
+            max_tokens=max_tokens,
             temperature=0.7,
-            messages=[
-                {"role": "user", "content": prompt}
-            ]
+            api_key=self._api_keys().get(provider),
+            provider=provider,
+            use_cache=self.use_cache
         )
-        
-        return message.content[0].text
 
@@ -0,0 +1,67 @@
+"""
+Model Registry - Lazy, process-wide NLP model loading
+
+This module handles:
+- Loading spaCy, textstat and TextBlob only on first real use
+- Sharing loaded models across every analyzer in the process
+- Remembering failed loads so unavailable models are not retried per call
+"""
+
+import importlib
+import threading
+from typing import Any, Callable, Dict, Optional
+
+
+_models: Dict[str, Any] = {}
+_lock = threading.Lock()
+
+
+def _get_model(key: str, loader: Callable[[], Any], install_hint: str) -> Optional[Any]:
+    """Return a cached model, loading it on first use (None if unavailable)"""
+    if key in _models:
+        return _models[key]
+
+    with _lock:
+        if key not in _models:
+            try:
+                _models[key] = loader()
+            except Exception as e:
+                print(f"Warning: {key} not available ({e}). {install_hint}")
+                _models[key] = None
+
+    return _models[key]
+
+
+def _load_textstat():
+    textstat = importlib.import_module("textstat")
+    # Syllable counting needs extra corpora; probe once so failures are cached
+    textstat.syllable_count("probe")
+    return textstat
+
+
+def _load_textblob():
+    return importlib.import_module("textblob").TextBlob
+
+
+def get_spacy_model(name: str = "en_core_web_sm") -> Optional[Any]:
+    """Get a shared spaCy pipeline (None if spaCy or the model is missing)"""
+    return _get_model(
+        f"spacy:{name}",
+        lambda: importlib.import_module("spacy").load(name),
+        f"Install with: pip install spacy && python -m spacy download {name}"
+    )
+
+
+def get_textstat() -> Optional[Any]:
+    """Get the textstat module (None if unavailable)"""
+    return _get_model("textstat", _load_textstat, "Install with: pip install textstat")
+
+
+def get_textblob() -> Optional[Any]:
+    """Get the TextBlob class (None if unavailable)"""
+    return _get_model("textblob", _load_textblob, "Install with: pip install textblob")
+
+
+def loaded_models() -> Dict[str, bool]:
+    """Report which models have been requested and whether they loaded"""
+    return {key: model is not None for key, model in _models.items()}
@@ -0,0 +1,79 @@
+"""
+Process Owner - Identify the process that claimed a record, and whether it still runs
+
+This module handles:
+- An owner token per process: host, pid and the process start time
+- Telling a live owner from a dead one whose pid was reused (e.g. a restarted
+  container that comes back as the same host with PID 1)
+
+Jobs, workflow runs and idempotency reservations record owner_id() when they
+are claimed; owner_alive() decides whether an unfinished one was abandoned.
+"""
+
+import os
+import socket
+import uuid
+from typing import Optional
+
+
+def _start_time(pid: int) -> Optional[str]:
+    """A process's start time in clock ticks since boot (None without /proc)"""
+    try:
+        with open(f"/proc/{pid}/stat", 'r') as f:
+            stat = f.read()
+    except OSError:
+        return None
+    # The command name may hold spaces and parentheses; fields after it are plain
+    fields = stat[stat.rindex(")") + 2:].split()
+    return fields[19]
+
+
+# Where /proc is missing, a random nonce still tells this process from an earlier one with its pid
+_owner = f"{socket.gethostname()}:{os.getpid()}:{_start_time(os.getpid()) or uuid.uuid4().hex}"
+
+
+def owner_id() -> str:
+    """This process as "<host>:<pid>:<start>", recorded on the jobs, runs and keys it claims"""
+    return _owner
+
+
+def owner_alive(owner: Optional[str]) -> bool:
+    """
+    Whether the process of an owner_id() still runs
+
+    Owners on other hosts are assumed alive. A pid that runs again under a
+    different start time belongs to a new process, so its old owner is dead.
+    """
+    if not owner:
+        return False
+    if owner == _owner:
+        return True
+    host, _, rest = owner.partition(":")
+    pid, _, started = rest.partition(":")
+    if host != socket.gethostname():
+        return True
+    try:
+        pid = int(pid)
+    except ValueError:
+        return True
+    if pid == os.getpid():
+        return False    # Same pid, different start: an earlier process (e.g. before a container restart)
+
+    current = _start_time(pid) if started else None
+    if current is not None:
+        return current == started
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+if __name__ == "__main__":
+    # Example: this process is alive; its pid with another start time is not
+    me = owner_id()
+    host, pid, _ = me.split(":")
+    print(f"{me}: alive={owner_alive(me)}")
+    print(f"{host}:{pid}:0: alive={owner_alive(f'{host}:{pid}:0')}")
@@ -0,0 +1,117 @@
+"""
+Profile Cache - Shared in-process cache of parsed voice profiles
+
+This module handles:
+- Bounded LRU caching of profiles (or profile sections) keyed by file path
+- Invalidating entries when the file's mtime or size changes
+- Hit/miss statistics for monitoring
+"""
+
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Union
+
+from .profile_store import read_profile
+
+
+DEFAULT_MAX_ENTRIES = 64
+
+
+class ProfileCache:
+    """LRU cache of profile files, validated against the file on every lookup"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        # (path, sections) -> (mtime_ns, size, pickled profile)
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: Union[str, Path], sections: Optional[Iterable[str]] = None) -> Optional[Dict]:
+        """
+        Load a profile, from cache when the file is unchanged
+
+        Args:
+            path: Profile file path (.json or .vcp)
+            sections: Profile sections to load (default: the whole profile)
+
+        Returns:
+            A private copy of the profile (callers may mutate it), or None if missing
+        """
+        file_path = os.path.abspath(path)
+        key = (file_path, None if sections is None else tuple(sorted(set(sections))))
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            self.invalidate(file_path)
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                # Unpickling is cheaper than json parsing and gives each caller its own copy
+                return pickle.loads(entry[2])
+            self.misses += 1
+
+        profile = read_profile(file_path, key[1])
+
+        self._store(key, stat, profile)
+        return profile
+
+    def put(self, path: Union[str, Path], profile: Dict):
+        """Cache a profile that was just written to path"""
+        file_path = os.path.abspath(path)
+        self.invalidate(file_path)
+        self._store((file_path, None), os.stat(file_path), profile)
+
+    def invalidate(self, path: Union[str, Path]):
+        """Forget every cached copy of a profile file"""
+        file_path = os.path.abspath(path)
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == file_path]:
+                del self._entries[key]
+
+    def clear(self):
+        """Forget all cached profiles and reset statistics"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache hit/miss statistics"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries
+            }
+
+    def _store(self, key: tuple, stat: os.stat_result, profile: Dict):
+        data = pickle.dumps(profile, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._entries[key] = (stat.st_mtime_ns, stat.st_size, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+# Global instance
+_profile_cache = None
+
+def get_profile_cache() -> ProfileCache:
+    """Get the process-wide profile cache"""
+    global _profile_cache
+    if _profile_cache is None:
+        max_entries = int(os.getenv('VOICECRAFT_PROFILE_CACHE_SIZE', DEFAULT_MAX_ENTRIES))
+        _profile_cache = ProfileCache(max_entries)
+    return _profile_cache
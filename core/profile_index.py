@@ -0,0 +1,220 @@
+"""
+Profile Index - Nearest-voice search over all stored profiles
+
+This module handles:
+- Keeping every profile's style feature vector in one persisted matrix
+- Answering top-k nearest voices for a text or another profile
+- Updating incrementally on save/delete and re-syncing stale entries by mtime
+"""
+
+import io
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+
+from .atomic_io import atomic_write, file_lock
+from .profile_store import iter_profile_files, read_profile
+from .style_vectors import FEATURE_KEYS, SECTION_NAMES, paired_similarities, profile_vector, stack_vectors
+
+
+INDEX_VERSION = 1
+INDEX_DIRNAME = ".index"
+INDEX_FILENAME = "vectors.npz"
+INDEX_LOCK_FILENAME = "locks/vectors.lock"
+
+# Profile sections an index entry is built from
+INDEX_SECTIONS = ("metadata", "style", "style_vector", "lexicons")
+
+
+class ProfileIndex:
+    """Feature-vector index of the profiles in a directory"""
+
+    def __init__(self, profiles_dir: Union[str, Path]):
+        self.profiles_dir = Path(profiles_dir)
+        self.index_path = self.profiles_dir / INDEX_DIRNAME / INDEX_FILENAME
+        self.lock_path = self.profiles_dir / INDEX_DIRNAME / INDEX_LOCK_FILENAME
+
+        # One entry per profile file, keyed by file stem
+        self.entries: Dict[str, Dict] = {}
+        self._matrix = None
+
+        self._load()
+        self.sync()
+
+    def _load(self):
+        """Read the persisted index (ignored if missing, corrupt or outdated)"""
+        if not self.index_path.exists():
+            return
+
+        entries = {}
+        try:
+            with np.load(self.index_path, allow_pickle=False) as data:
+                if int(data["version"]) != INDEX_VERSION or data["vectors"].shape[1:] != (len(FEATURE_KEYS),):
+                    return
+                for i, stem in enumerate(data["stems"]):
+                    entries[str(stem)] = {
+                        "name": str(data["names"][i]),
+                        "lexicons": str(data["lexicons"][i]),
+                        "mtime_ns": int(data["mtime_ns"][i]),
+                        "size": int(data["sizes"][i]),
+                        "vector": data["vectors"][i]
+                    }
+        except Exception as e:
+            print(f"Warning: Rebuilding profile index ({e})")
+            return
+
+        self.entries = entries
+        self._matrix = None
+
+    def save(self):
+        """Persist the index atomically (callers hold the index lock)"""
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        stems = sorted(self.entries)
+
+        arrays = {
+            "version": np.array(INDEX_VERSION),
+            "stems": np.array(stems, dtype=str),
+            "names": np.array([self.entries[stem]["name"] for stem in stems], dtype=str),
+            "lexicons": np.array([self.entries[stem]["lexicons"] for stem in stems], dtype=str),
+            "mtime_ns": np.array([self.entries[stem]["mtime_ns"] for stem in stems], dtype=np.int64),
+            "sizes": np.array([self.entries[stem]["size"] for stem in stems], dtype=np.int64),
+            "vectors": stack_vectors([self.entries[stem]["vector"] for stem in stems])
+        }
+
+        buffer = io.BytesIO()
+        np.savez(buffer, **arrays)
+        atomic_write(self.index_path, buffer.getvalue())
+
+    def sync(self) -> bool:
+        """
+        Re-index profiles whose file changed since they were indexed
+
+        Returns:
+            True if any entry was added, refreshed or removed
+        """
+        changes = {}
+        seen = set()
+
+        for profile_file in iter_profile_files(self.profiles_dir):
+            stem = profile_file.stem
+            seen.add(stem)
+            try:
+                stat = profile_file.stat()
+            except OSError:
+                continue
+
+            entry = self.entries.get(stem)
+            if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                continue
+
+            try:
+                profile = read_profile(profile_file, INDEX_SECTIONS)
+            except Exception:
+                # Skip corrupted profiles
+                continue
+            changes[stem] = self._make_entry(stem, profile, stat)
+
+        for stem in set(self.entries) - seen:
+            changes[stem] = None
+
+        if changes:
+            self._commit(changes)
+        return bool(changes)
+
+    def update(self, profile_path: Path, profile: Dict):
+        """Index a profile that was just written to profile_path"""
+        profile_path = Path(profile_path)
+        self._commit({profile_path.stem: self._make_entry(profile_path.stem, profile, profile_path.stat())})
+
+    def remove(self, profile_path: Path):
+        """Drop a deleted profile from the index"""
+        self._commit({Path(profile_path).stem: None})
+
+    def _commit(self, changes: Dict[str, Optional[Dict]]):
+        """Apply entry changes on top of the latest persisted index (None deletes)"""
+        with file_lock(self.lock_path):
+            # Another process may have written the index since we loaded it
+            self._load()
+            for stem, entry in changes.items():
+                if entry is None:
+                    self.entries.pop(stem, None)
+                else:
+                    self.entries[stem] = entry
+            self._matrix = None
+            self.save()
+
+    def lexicon_sets(self) -> List[Dict]:
+        """Distinct custom lexicon sets used by indexed profiles"""
+        return [json.loads(key) for key in sorted({entry["lexicons"] for entry in self.entries.values()})]
+
+    def nearest(
+        self,
+        query: Union[np.ndarray, Dict[str, np.ndarray]],
+        k: int = 5,
+        exclude: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Find the k profiles most similar to a feature vector
+
+        Args:
+            query: Feature vector, or one vector per lexicon set
+                   (keyed by the lexicons' sorted JSON) for text queries
+            k: Number of results
+            exclude: File stem of a profile to leave out (e.g. the query profile)
+
+        Returns:
+            Results sorted by similarity: {"name", "similarity", "details"}
+        """
+        stems, matrix = self._get_matrix()
+        if not stems:
+            return []
+
+        if isinstance(query, dict):
+            queries = np.vstack([query[self.entries[stem]["lexicons"]] for stem in stems])
+        else:
+            queries = query
+
+        sections = paired_similarities(queries, matrix)
+        scores = sections.mean(axis=-1)
+
+        # Profiles without style metrics (e.g. LLM-only) are never returned
+        scores[np.isnan(matrix).all(axis=1)] = -np.inf
+        if exclude in self.entries:
+            scores[stems.index(exclude)] = -np.inf
+
+        k = min(k, len(stems))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+
+        return [
+            {
+                "name": self.entries[stems[i]]["name"],
+                "similarity": round(float(scores[i]), 3),
+                "details": {
+                    section: round(float(value), 3)
+                    for section, value in zip(SECTION_NAMES, sections[i])
+                }
+            }
+            for i in top
+            if np.isfinite(scores[i])
+        ]
+
+    def _make_entry(self, stem: str, profile: Dict, stat: os.stat_result) -> Dict:
+        return {
+            "name": profile.get("metadata", {}).get("name", stem),
+            "lexicons": json.dumps(profile.get("lexicons") or {}, sort_keys=True),
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "vector": profile_vector(profile)
+        }
+
+    def _get_matrix(self):
+        """Stems and stacked vectors, cached until the index changes"""
+        if self._matrix is None:
+            stems = sorted(self.entries)
+            self._matrix = (stems, stack_vectors([self.entries[stem]["vector"] for stem in stems]))
+        return self._matrix
+
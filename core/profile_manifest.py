@@ -0,0 +1,178 @@
+"""
+Profile Manifest - Maintained summary index of stored voice profiles
+
+This module handles:
+- Keeping name, description, tags and sample count of every profile in one file
+- Updating the manifest atomically when profiles are saved or deleted
+- Self-healing stale entries by comparing file mtime and size
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from .atomic_io import atomic_write, file_lock
+from .profile_store import iter_profile_files, read_profile
+
+
+MANIFEST_VERSION = 1
+MANIFEST_DIRNAME = ".index"
+MANIFEST_FILENAME = "manifest.json"
+MANIFEST_LOCK_FILENAME = "locks/manifest.lock"
+
+# Profile sections a summary is built from (llm_analysis is only read when
+# a profile has no samples section)
+SUMMARY_SECTIONS = ("metadata", "samples", "style")
+
+
+def summarize_profile(profile: Dict, default_name: str) -> Dict:
+    """
+    Extract the listing summary of a profile
+
+    Args:
+        profile: Profile dictionary (any supported format)
+        default_name: Name used when the profile has no metadata name
+
+    Returns:
+        {"name", "description", "tags", "created_at", "sample_count"}
+    """
+    # Handle different profile formats
+    metadata = profile.get("metadata", {})
+
+    # Get sample count from various possible locations
+    sample_count = 0
+    if "samples" in profile:
+        samples_info = profile["samples"]
+        if isinstance(samples_info, dict):
+            sample_count = samples_info.get("count", 0)
+    elif "llm_analysis" in profile:
+        # LLM-analyzed profile format
+        llm_analysis = profile.get("llm_analysis", {})
+        sample_count = llm_analysis.get("samples_analyzed", 0)
+    elif "style" in profile:
+        # Old format - check style profile
+        style = profile.get("style", {})
+        sample_count = style.get("sample_count", 0)
+
+    return {
+        "name": metadata.get("name", default_name),
+        "description": metadata.get("description", ""),
+        "tags": metadata.get("tags", []),
+        "created_at": metadata.get("created_at", ""),
+        "sample_count": sample_count
+    }
+
+
+class ProfileManifest:
+    """Summary manifest of the profiles in a directory"""
+
+    def __init__(self, profiles_dir: Union[str, Path]):
+        self.profiles_dir = Path(profiles_dir)
+        self.manifest_path = self.profiles_dir / MANIFEST_DIRNAME / MANIFEST_FILENAME
+        self.lock_path = self.profiles_dir / MANIFEST_DIRNAME / MANIFEST_LOCK_FILENAME
+
+        # One entry per profile file, keyed by file stem; summary is None for
+        # unreadable files so they are not re-read until they change
+        self.entries: Dict[str, Dict] = {}
+
+        self._load()
+
+    def _load(self):
+        """Read the manifest (ignored if missing, corrupt or outdated)"""
+        try:
+            with open(self.manifest_path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if data.get("version") == MANIFEST_VERSION:
+            self.entries = data.get("profiles", {})
+
+    def save(self):
+        """Write the manifest atomically (callers hold the manifest lock)"""
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"version": MANIFEST_VERSION, "profiles": self.entries}
+        atomic_write(self.manifest_path, json.dumps(data, indent=2).encode("utf-8"))
+
+    def sync(self) -> bool:
+        """
+        Refresh entries whose profile file changed since it was summarized
+
+        Only changed files are read; unchanged profiles cost one stat.
+
+        Returns:
+            True if any entry was added, refreshed or removed
+        """
+        changes = {}
+        seen = set()
+
+        for profile_file in iter_profile_files(self.profiles_dir):
+            stem = profile_file.stem
+            seen.add(stem)
+            try:
+                stat = profile_file.stat()
+            except OSError:
+                continue
+
+            entry = self.entries.get(stem)
+            if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                continue
+
+            try:
+                summary = summarize_profile(self._read_summary_sections(profile_file), stem)
+            except Exception:
+                # Corrupted profiles are remembered but never listed
+                summary = None
+            changes[stem] = self._make_entry(summary, stat)
+
+        for stem in set(self.entries) - seen:
+            changes[stem] = None
+
+        if changes:
+            self._commit(changes)
+        return bool(changes)
+
+    def update(self, profile_path: Path, profile: Dict):
+        """Record a profile that was just written to profile_path"""
+        profile_path = Path(profile_path)
+        entry = self._make_entry(summarize_profile(profile, profile_path.stem), profile_path.stat())
+        self._commit({profile_path.stem: entry})
+
+    def remove(self, profile_path: Path):
+        """Drop a deleted profile from the manifest"""
+        self._commit({Path(profile_path).stem: None})
+
+    def _commit(self, changes: Dict[str, Optional[Dict]]):
+        """Apply entry changes on top of the latest manifest on disk (None deletes)"""
+        with file_lock(self.lock_path):
+            # Another process may have written the manifest since we loaded it
+            self._load()
+            for stem, entry in changes.items():
+                if entry is None:
+                    self.entries.pop(stem, None)
+                else:
+                    self.entries[stem] = entry
+            self.save()
+
+    def summaries(self) -> List[Dict]:
+        """Listing summaries of all readable profiles, ordered by file name"""
+        return [
+            dict(self.entries[stem]["summary"])
+            for stem in sorted(self.entries)
+            if self.entries[stem]["summary"] is not None
+        ]
+
+    def _read_summary_sections(self, profile_file: Path) -> Dict:
+        """Read only what a summary needs from a profile file"""
+        profile = read_profile(profile_file, SUMMARY_SECTIONS)
+        if "samples" not in profile:
+            profile.update(read_profile(profile_file, ("llm_analysis",)))
+        return profile
+
+    def _make_entry(self, summary: Optional[Dict], stat: os.stat_result) -> Dict:
+        return {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "summary": summary
+        }
@@ -0,0 +1,182 @@
+"""
+Profile Store - JSON and compact sectioned storage for voice profiles
+
+This module handles:
+- Reading and writing profiles as pretty JSON (.json) or compact .vcp files
+- Loading individual profile sections without reading the rest of the file
+- Locating profile files of either format in a profiles directory
+
+The .vcp layout is a 4-byte magic, a 4-byte big-endian header length, a JSON
+header with the section table, then one zlib-compressed JSON payload per
+section. Top-level profile keys are sections; samples.excerpts is stored as a
+section of its own so sample counts load without the excerpt text.
+"""
+
+import json
+import struct
+import zlib
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+from .atomic_io import atomic_write
+
+
+VCP_MAGIC = b"VCP\x01"
+VCP_VERSION = 1
+_HEADER_LENGTH = struct.Struct(">I")
+
+JSON_SUFFIX = ".json"
+VCP_SUFFIX = ".vcp"
+STORAGE_FORMATS = {"json": JSON_SUFFIX, "vcp": VCP_SUFFIX}
+
+# Nested values stored as separate sections ("parent.child")
+SPLIT_SECTIONS = {"samples": "excerpts"}
+
+
+def _split_sections(profile: Dict) -> Dict[str, object]:
+    """Break a profile into independently loadable sections"""
+    sections = {}
+    for key, value in profile.items():
+        child = SPLIT_SECTIONS.get(key)
+        if child and isinstance(value, dict) and child in value:
+            sections[key] = {k: v for k, v in value.items() if k != child}
+            sections[f"{key}.{child}"] = value[child]
+        else:
+            sections[key] = value
+    return sections
+
+
+def _join_sections(sections: Dict[str, object], order: List[str]) -> Dict:
+    """Reassemble loaded sections into a profile dictionary"""
+    profile = {}
+    for name in order:
+        if name not in sections:
+            continue
+        if "." in name:
+            parent, child = name.split(".", 1)
+            profile.setdefault(parent, {})[child] = sections[name]
+        else:
+            profile[name] = sections[name]
+    return profile
+
+
+def _select_sections(profile: Dict, sections: Iterable[str]) -> Dict:
+    """Apply section selection to a fully parsed profile (JSON storage)"""
+    available = _split_sections(profile)
+    return _join_sections(available, [name for name in available if name in set(sections)])
+
+
+def encode_vcp(profile: Dict, level: int = 6) -> bytes:
+    """
+    Encode a profile in the compact sectioned format
+
+    Args:
+        profile: Profile dictionary
+        level: zlib compression level
+
+    Returns:
+        The encoded file contents
+    """
+    payloads = []
+    table = []
+    offset = 0
+    for name, value in _split_sections(profile).items():
+        raw = json.dumps(value, separators=(",", ":")).encode("utf-8")
+        payload = zlib.compress(raw, level)
+        table.append({"name": name, "offset": offset, "length": len(payload), "raw_length": len(raw)})
+        payloads.append(payload)
+        offset += len(payload)
+
+    header = json.dumps({"version": VCP_VERSION, "sections": table}, separators=(",", ":")).encode("utf-8")
+    return VCP_MAGIC + _HEADER_LENGTH.pack(len(header)) + header + b"".join(payloads)
+
+
+def read_vcp_header(f) -> tuple:
+    """Read the section table of an open .vcp file (returns table, data start offset)"""
+    if f.read(len(VCP_MAGIC)) != VCP_MAGIC:
+        raise ValueError("Not a VoiceCraft profile file")
+    (header_length,) = _HEADER_LENGTH.unpack(f.read(_HEADER_LENGTH.size))
+    header = json.loads(f.read(header_length).decode("utf-8"))
+    if header.get("version") != VCP_VERSION:
+        raise ValueError(f"Unsupported profile file version: {header.get('version')}")
+    return header["sections"], len(VCP_MAGIC) + _HEADER_LENGTH.size + header_length
+
+
+def read_vcp(path: Union[str, Path], sections: Optional[Iterable[str]] = None) -> Dict:
+    """
+    Decode a compact profile, reading only the requested sections
+
+    Args:
+        path: .vcp file path
+        sections: Section names to load (default: all)
+
+    Returns:
+        Profile dictionary containing the loaded sections
+    """
+    wanted = None if sections is None else set(sections)
+
+    with open(path, 'rb') as f:
+        table, data_start = read_vcp_header(f)
+        loaded = {}
+        for entry in table:
+            if wanted is not None and entry["name"] not in wanted:
+                continue
+            f.seek(data_start + entry["offset"])
+            loaded[entry["name"]] = json.loads(zlib.decompress(f.read(entry["length"])).decode("utf-8"))
+
+    return _join_sections(loaded, [entry["name"] for entry in table])
+
+
+def vcp_sections(path: Union[str, Path]) -> List[str]:
+    """List the sections stored in a .vcp file"""
+    with open(path, 'rb') as f:
+        table, _ = read_vcp_header(f)
+    return [entry["name"] for entry in table]
+
+
+def read_profile(path: Union[str, Path], sections: Optional[Iterable[str]] = None) -> Dict:
+    """
+    Read a profile file of either format
+
+    Args:
+        path: .json or .vcp path
+        sections: Section names to load (default: all). "samples" holds the
+                  sample counts; "samples.excerpts" adds the excerpt texts.
+
+    Returns:
+        Profile dictionary
+    """
+    if Path(path).suffix == VCP_SUFFIX:
+        return read_vcp(path, sections)
+
+    with open(path, 'r') as f:
+        profile = json.load(f)
+    return profile if sections is None else _select_sections(profile, sections)
+
+
+def encode_profile(path: Union[str, Path], profile: Dict) -> bytes:
+    """Encode a profile in the format given by the path's suffix"""
+    if Path(path).suffix == VCP_SUFFIX:
+        return encode_vcp(profile)
+    return json.dumps(profile, indent=2).encode("utf-8")
+
+
+def write_profile(path: Union[str, Path], profile: Dict):
+    """Write a profile atomically, in the format given by the path's suffix"""
+    atomic_write(path, encode_profile(path, profile))
+
+
+def iter_profile_files(profiles_dir: Union[str, Path]) -> Iterator[Path]:
+    """
+    Yield the profile files of a directory, one per profile
+
+    When both formats exist for a profile, the .vcp file wins.
+    """
+    profiles_dir = Path(profiles_dir)
+    vcp_stems = set()
+    for path in sorted(profiles_dir.glob(f"*{VCP_SUFFIX}")):
+        vcp_stems.add(path.stem)
+        yield path
+    for path in sorted(profiles_dir.glob(f"*{JSON_SUFFIX}")):
+        if path.stem not in vcp_stems:
+            yield path
@@ -9,11 +9,7 @@ import os
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
-try:
-    from anthropic import Anthropic
-except ImportError:
-    Anthropic = None
-
+from .llm_gateway import get_llm_gateway
 from .prompt_library import get_prompt_library
 from .voice_profiler import VoiceProfiler
 
@@ -33,11 +29,7 @@ class PromptFusionGenerator:
     ):
         self.profile_name = profile_name
         self.anthropic_api_key = anthropic_api_key or os.getenv("ANTHROPIC_API_KEY")
-        
-        if Anthropic and self.anthropic_api_key:
-            self.client = Anthropic(api_key=self.anthropic_api_key)
-        else:
-            self.client = None
+        self.gateway = get_llm_gateway()
         
         self.profiler = VoiceProfiler()
         self.voice_profile = self.profiler.load_profile(profile_name)
@@ -46,6 +38,11 @@ class PromptFusionGenerator:
         
         self.prompt_library = get_prompt_library()
     
+    @property
+    def client(self):
+        """Shared Anthropic client (None without an API key)"""
+        return self.gateway.client("anthropic", self.anthropic_api_key)
+    
     def generate_with_prompt_fusion(
         self,
         topic: str,
@@ -68,24 +65,21 @@ class PromptFusionGenerator:
             Generated content with fusion details
         """
         
-        if not self.client:
+        if not self.gateway.available(model, self.anthropic_api_key):
             raise ValueError("Anthropic API key not set")
         
         # Build fusion prompt
         fusion_prompt = self._build_fusion_prompt(topic, writer_influences, output_format, target_length)
         
         # Generate
-        message = self.client.messages.create(
+        content = self.gateway.complete(
+            fusion_prompt,
             model=model,
             max_tokens=4000,
             temperature=0.7,
-            messages=[
-                {"role": "user", "content": fusion_prompt}
-            ]
+            api_key=self.anthropic_api_key
         )
         
-        content = message.content[0].text
-        
         return {
             "content": content,
             "topic": topic,
@@ -9,17 +9,19 @@ This module analyzes text to extract:
 - Content flow patterns
 """
 
-import re
-from typing import Dict, List, Any
+import multiprocessing
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, as_completed, wait
+from functools import partial
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Union
 from dataclasses import dataclass, asdict
 import json
 
-try:
-    import spacy
-    import textstat
-    from textblob import TextBlob
-except ImportError:
-    print("Warning: Some NLP libraries not installed. Install with: pip install spacy textstat textblob")
+from .style_tokenizer import TokenizedDocument, tokenize
+from .style_statistics import StyleStatistics
+from .style_features import FeatureExtractor
+from .model_registry import get_spacy_model, get_textstat, get_textblob
 
 
 @dataclass
@@ -45,143 +47,312 @@ class StyleProfile:
         return cls(**data)
 
 
+def iter_documents(documents: Iterable[Union[str, os.PathLike]], encoding: str = "utf-8") -> Iterator[str]:
+    """
+    Yield document texts lazily
+    
+    Args:
+        documents: Texts or file paths (str items are texts, os.PathLike items are read from disk)
+        encoding: Encoding used to read files
+    """
+    for document in documents:
+        if isinstance(document, os.PathLike):
+            with open(document, 'r', encoding=encoding) as f:
+                yield f.read()
+        else:
+            yield document
+
+
 class StyleAnalyzer:
     """Analyze writing style from content samples"""
     
-    def __init__(self):
-        # Try to load spaCy model, but don't fail if not available
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except:
-            print("Warning: spaCy model not loaded. Some features will be limited.")
-            self.nlp = None
+    def __init__(self, lexicons: Optional[Dict[str, Iterable[str]]] = None):
+        """
+        Args:
+            lexicons: Optional extra words per lexicon category
+                      (power_words, urgency_words, confidence_words)
+        """
+        self.features = FeatureExtractor(lexicons)
+    
+    @property
+    def lexicons(self) -> Dict[str, List[str]]:
+        """Extra lexicon words in use (normalized)"""
+        return self.features.lexicons
+    
+    @property
+    def nlp(self):
+        """Shared spaCy pipeline, loaded on first use (None if not available)"""
+        return get_spacy_model()
     
-    def analyze_samples(self, samples: List[str], author_name: str = "Unknown") -> StyleProfile:
+    def analyze_samples(
+        self,
+        samples: List[str],
+        author_name: str = "Unknown",
+        workers: int = 1
+    ) -> StyleProfile:
         """
         Analyze multiple content samples to create a style profile
         
         Args:
             samples: List of text samples (articles, posts, etc.)
             author_name: Name of the author
+            workers: Number of worker processes (1 = analyze in this process)
             
         Returns:
             StyleProfile object with extracted patterns
         """
-        # Combine all samples for analysis
-        combined_text = "\n\n".join(samples)
+        return self.profile_from_statistics(self.collect_statistics(samples, workers=workers), author_name)
+    
+    def analyze_each(
+        self,
+        samples: List[str],
+        author_name: str = "Unknown",
+        workers: int = 1,
+        shard_size: int = 16
+    ) -> List[StyleProfile]:
+        """
+        Analyze each sample on its own (e.g. drafts to verify)
+        
+        Args:
+            samples: List of text samples
+            author_name: Name given to every resulting profile
+            workers: Number of worker processes (1 = analyze in this process)
+            shard_size: Samples sent to a worker per task
+            
+        Returns:
+            One StyleProfile per sample, in input order
+        """
+        if workers and workers > 1 and len(samples) > shard_size:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=_process_context(),
+                initializer=_init_worker,
+                initargs=(self.lexicons,)
+            ) as executor:
+                shards = executor.map(
+                    partial(_shard_profiles, author_name=author_name),
+                    _iter_shards(samples, shard_size)
+                )
+                return [profile for shard in shards for profile in shard]
+        
+        return [
+            self.profile_from_statistics(self._document_statistics(tokenize(sample)), author_name)
+            for sample in samples
+        ]
+    
+    def analyze_stream(
+        self,
+        documents: Iterable[Union[str, os.PathLike]],
+        author_name: str = "Unknown",
+        workers: int = 1
+    ) -> StyleProfile:
+        """
+        Analyze a stream of documents with bounded memory
+        
+        Documents are read, tokenized and folded into the statistics one at a
+        time, so peak memory depends on the largest document rather than on
+        the size of the corpus.
+        
+        Args:
+            documents: Iterator of texts or file paths (str is treated as text)
+            author_name: Name of the author
+            workers: Number of worker processes (1 = analyze in this process)
+            
+        Returns:
+            StyleProfile object with extracted patterns
+        """
+        statistics = self.collect_statistics(iter_documents(documents), workers=workers)
+        return self.profile_from_statistics(statistics, author_name)
+    
+    def collect_statistics(
+        self,
+        samples: Iterable[str],
+        workers: int = 1,
+        shard_size: int = 16
+    ) -> StyleStatistics:
+        """
+        Accumulate mergeable style statistics for content samples
+        
+        Samples are consumed lazily. With workers > 1 they are sharded across a
+        process pool and the per-shard statistics are merged; merging is exact,
+        so the result is identical to a serial run.
+        
+        Args:
+            samples: Iterable of text samples
+            workers: Number of worker processes (1 = analyze in this process)
+            shard_size: Samples sent to a worker per task
+            
+        Returns:
+            StyleStatistics that can be merged with statistics of other samples
+        """
+        if workers and workers > 1:
+            return self._collect_statistics_parallel(samples, workers, shard_size)
+        
+        statistics = StyleStatistics()
+        for sample in samples:
+            statistics.merge(self._document_statistics(tokenize(sample)))
+        return statistics
+    
+    def _collect_statistics_parallel(
+        self,
+        samples: Iterable[str],
+        workers: int,
+        shard_size: int
+    ) -> StyleStatistics:
+        """Shard samples across a process pool and reduce the partial statistics"""
+        statistics = StyleStatistics()
+        
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=_process_context(),
+            initializer=_init_worker,
+            initargs=(self.lexicons,)
+        ) as executor:
+            pending = set()
+            for shard in _iter_shards(samples, shard_size):
+                pending.add(executor.submit(_shard_statistics, shard))
+                
+                # Keep a bounded number of shards in flight so streams stay bounded
+                if len(pending) >= workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        statistics.merge(future.result())
+            
+            for future in as_completed(pending):
+                statistics.merge(future.result())
         
+        return statistics
+    
+    def profile_from_statistics(self, statistics: StyleStatistics, author_name: str = "Unknown") -> StyleProfile:
+        """Build a StyleProfile from accumulated statistics"""
         return StyleProfile(
             name=author_name,
-            sentence_structure=self._analyze_sentence_structure(samples),
-            vocabulary=self._analyze_vocabulary(combined_text),
-            rhetorical_devices=self._analyze_rhetorical_devices(samples),
-            emotional_tone=self._analyze_emotional_tone(combined_text),
-            content_flow=self._analyze_content_flow(samples),
-            sample_count=len(samples),
-            total_words=len(combined_text.split())
+            sentence_structure=self._analyze_sentence_structure(statistics),
+            vocabulary=self._analyze_vocabulary(statistics),
+            rhetorical_devices=self._analyze_rhetorical_devices(statistics),
+            emotional_tone=self._analyze_emotional_tone(statistics),
+            content_flow=self._analyze_content_flow(statistics),
+            sample_count=statistics.sample_count,
+            total_words=statistics.total_words
         )
     
-    def _analyze_sentence_structure(self, samples: List[str]) -> Dict[str, float]:
-        """Analyze sentence structure patterns"""
-        all_sentences = []
-        for sample in samples:
-            # Split into sentences (simple approach)
-            sentences = re.split(r'[.!?]+', sample)
-            sentences = [s.strip() for s in sentences if s.strip()]
-            all_sentences.extend(sentences)
+    def _document_statistics(self, doc: TokenizedDocument) -> StyleStatistics:
+        """Extract the statistics of a single tokenized sample"""
+        statistics = StyleStatistics(sample_count=1, total_words=doc.word_count)
         
-        if not all_sentences:
-            return {}
+        # Sentence structure (fragments are sentences < 5 words)
+        lengths = doc.sentence_lengths
+        statistics.sentence_count = len(lengths)
+        statistics.sentence_length_sum = sum(lengths)
+        statistics.sentence_length_sq_sum = sum(length * length for length in lengths)
+        statistics.fragment_count = sum(1 for length in lengths if length < 5)
+        statistics.question_count = doc.question_count
+        statistics.exclamation_count = doc.exclamation_count
         
-        # Calculate metrics
-        sentence_lengths = [len(s.split()) for s in all_sentences]
-        avg_length = sum(sentence_lengths) / len(sentence_lengths)
+        # Vocabulary and lexicon hits
+        statistics.word_length_sum = sum(len(word) for word in doc.bare_words)
+        statistics.vocabulary = dict(Counter(doc.words))
+        statistics.lexicon_counts = self.features.lexicon_counts(doc)
         
-        # Count fragments (sentences < 5 words)
-        fragments = sum(1 for length in sentence_lengths if length < 5)
-        fragment_ratio = fragments / len(all_sentences)
+        # Readability components
+        textstat = get_textstat()
+        if textstat is not None:
+            try:
+                statistics.readability_words = textstat.lexicon_count(doc.text)
+                statistics.readability_sentences = textstat.sentence_count(doc.text)
+                statistics.readability_syllables = textstat.syllable_count(doc.text)
+                statistics.readability_samples = 1
+            except:
+                statistics.readability_words = 0
+                statistics.readability_sentences = 0
+                statistics.readability_syllables = 0
         
-        # Count questions
-        questions = sum(1 for s in all_sentences if '?' in s)
-        question_frequency = questions / len(all_sentences)
+        # Sentiment assessments (TextBlob polarity is their mean)
+        TextBlob = get_textblob()
+        if TextBlob is not None:
+            try:
+                assessments = TextBlob(doc.text).sentiment_assessments.assessments
+                for _, polarity, subjectivity, _ in assessments:
+                    statistics.add_polarity(polarity, subjectivity)
+                statistics.sentiment_samples = 1
+            except:
+                pass
         
-        # Count exclamations
-        exclamations = sum(1 for s in all_sentences if '!' in s)
-        exclamation_frequency = exclamations / len(all_sentences)
+        # Contrast patterns ("not X, Y" or "X but Y")
+        statistics.contrast_count = self.features.contrast_count(doc)
+        
+        # Rule of threes (lists of three items)
+        statistics.rule_of_three_count = self.features.rule_of_three_count(doc)
+        
+        # Opening hooks
+        hooks = self.features.hook_counts(doc)
+        if hooks is not None:
+            statistics.opening_count = 1
+            statistics.hook_counts = hooks
+        
+        # Paragraph length (rough estimate based on double newlines)
+        if doc.paragraph_lengths:
+            statistics.add_paragraph_mean(sum(doc.paragraph_lengths) / len(doc.paragraph_lengths))
+        
+        return statistics
+    
+    def _analyze_sentence_structure(self, statistics: StyleStatistics) -> Dict[str, float]:
+        """Analyze sentence structure patterns"""
+        count = statistics.sentence_count
+        if not count:
+            return {}
+        
+        total = statistics.sentence_length_sum
+        # Population variance from integer sums (exact until the final division)
+        variance = (count * statistics.sentence_length_sq_sum - total * total) / (count * count)
         
         return {
-            "avg_sentence_length": round(avg_length, 2),
-            "fragment_ratio": round(fragment_ratio, 3),
-            "question_frequency": round(question_frequency, 3),
-            "exclamation_frequency": round(exclamation_frequency, 3),
-            "sentence_count": len(all_sentences),
-            "length_variance": round(self._calculate_variance(sentence_lengths), 2)
+            "avg_sentence_length": round(total / count, 2),
+            "fragment_ratio": round(statistics.fragment_count / count, 3),
+            "question_frequency": round(statistics.question_count / count, 3),
+            "exclamation_frequency": round(statistics.exclamation_count / count, 3),
+            "sentence_count": count,
+            "length_variance": round(variance, 2)
         }
     
-    def _analyze_vocabulary(self, text: str) -> Dict[str, Any]:
+    def _analyze_vocabulary(self, statistics: StyleStatistics) -> Dict[str, Any]:
         """Analyze vocabulary patterns"""
-        words = text.lower().split()
-        
-        # Reading level
-        try:
-            reading_ease = textstat.flesch_reading_ease(text)
-            grade_level = textstat.flesch_kincaid_grade(text)
-        except:
-            reading_ease = 0
-            grade_level = 0
-        
-        # Word length
-        word_lengths = [len(w.strip('.,!?;:')) for w in words]
-        avg_word_length = sum(word_lengths) / len(word_lengths) if word_lengths else 0
-        
-        # Common power words
-        power_words = [
-            'guaranteed', 'proven', 'results', 'immediately', 'literally',
-            'obviously', 'actually', 'specifically', 'exactly', 'ultimately'
-        ]
-        power_word_count = sum(1 for word in words if word.strip('.,!?;:') in power_words)
-        power_word_density = power_word_count / len(words) if words else 0
+        total_words = statistics.total_words
+        unique_words = len(statistics.vocabulary)
+        
+        # Reading level (Flesch formulas over textstat's summed counts)
+        reading_ease = 0
+        grade_level = 0
+        if statistics.readability_samples and statistics.readability_words and statistics.readability_sentences:
+            words_per_sentence = statistics.readability_words / statistics.readability_sentences
+            syllables_per_word = statistics.readability_syllables / statistics.readability_words
+            reading_ease = 206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word
+            grade_level = 0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59
+        
+        avg_word_length = statistics.word_length_sum / total_words if total_words else 0
+        power_word_density = statistics.lexicon_counts["power_words"] / total_words if total_words else 0
         
         return {
             "avg_word_length": round(avg_word_length, 2),
             "reading_ease_score": round(reading_ease, 2),
             "grade_level": round(grade_level, 2),
-            "total_words": len(words),
-            "unique_words": len(set(words)),
-            "lexical_diversity": round(len(set(words)) / len(words), 3) if words else 0,
+            "total_words": total_words,
+            "unique_words": unique_words,
+            "lexical_diversity": round(unique_words / total_words, 3) if total_words else 0,
             "power_word_density": round(power_word_density, 4)
         }
     
-    def _analyze_rhetorical_devices(self, samples: List[str]) -> Dict[str, float]:
+    def _analyze_rhetorical_devices(self, statistics: StyleStatistics) -> Dict[str, float]:
         """Analyze use of rhetorical devices"""
-        combined = " ".join(samples)
-        sentences = re.split(r'[.!?]+', combined)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        sentence_count = statistics.sentence_count
         
-        # Repetition patterns (simple approach)
-        words = combined.lower().split()
-        word_freq = {}
-        for word in words:
-            if len(word) > 5:  # Only count substantial words
-                word_freq[word] = word_freq.get(word, 0) + 1
+        # Repetition patterns (only count substantial words)
+        substantial = [count for word, count in statistics.vocabulary.items() if len(word) > 5]
+        repeated_words = sum(1 for count in substantial if count > 3)
+        repetition_score = repeated_words / len(substantial) if substantial else 0
         
-        repeated_words = sum(1 for count in word_freq.values() if count > 3)
-        repetition_score = repeated_words / len(word_freq) if word_freq else 0
-        
-        # Contrast patterns ("not X, Y" or "X but Y")
-        contrast_patterns = [
-            r'\bnot\b.*\bbut\b',
-            r'\binstead\b',
-            r'\bhowever\b',
-            r'\byet\b'
-        ]
-        contrast_count = sum(len(re.findall(pattern, combined.lower())) for pattern in contrast_patterns)
-        contrast_usage = contrast_count / len(sentences) if sentences else 0
-        
-        # Rule of threes (lists of three items)
-        three_pattern = r'\b\w+\s*,\s*\w+\s*,\s*(and|or)\s+\w+\b'
-        rule_of_three_count = len(re.findall(three_pattern, combined))
-        rule_of_three_frequency = rule_of_three_count / len(sentences) if sentences else 0
+        contrast_usage = statistics.contrast_count / sentence_count if sentence_count else 0
+        rule_of_three_frequency = statistics.rule_of_three_count / sentence_count if sentence_count else 0
         
         return {
             "repetition_for_emphasis": round(repetition_score, 3),
@@ -189,26 +360,22 @@ class StyleAnalyzer:
             "rule_of_threes": round(rule_of_three_frequency, 3)
         }
     
-    def _analyze_emotional_tone(self, text: str) -> Dict[str, float]:
+    def _analyze_emotional_tone(self, statistics: StyleStatistics) -> Dict[str, float]:
         """Analyze emotional tone and sentiment"""
-        try:
-            blob = TextBlob(text)
-            polarity = blob.sentiment.polarity  # -1 to 1
-            subjectivity = blob.sentiment.subjectivity  # 0 to 1
-        except:
+        if not statistics.sentiment_samples:
+            # Sentiment library unavailable
             polarity = 0
             subjectivity = 0.5
+        elif not statistics.sentiment_assessments:
+            polarity = 0.0
+            subjectivity = 0.0
+        else:
+            polarity = statistics.polarity_total / statistics.sentiment_assessments  # -1 to 1
+            subjectivity = statistics.subjectivity_total / statistics.sentiment_assessments  # 0 to 1
         
-        # Urgency indicators
-        urgency_words = ['now', 'immediately', 'today', 'urgent', 'quick', 'fast', 'hurry']
-        words = text.lower().split()
-        urgency_count = sum(1 for word in words if word.strip('.,!?;:') in urgency_words)
-        urgency_score = urgency_count / len(words) if words else 0
-        
-        # Confidence indicators
-        confidence_words = ['will', 'must', 'guaranteed', 'proven', 'certain', 'definitely']
-        confidence_count = sum(1 for word in words if word.strip('.,!?;:') in confidence_words)
-        confidence_score = confidence_count / len(words) if words else 0
+        total_words = statistics.total_words
+        urgency_score = statistics.lexicon_counts["urgency_words"] / total_words if total_words else 0
+        confidence_score = statistics.lexicon_counts["confidence_words"] / total_words if total_words else 0
         
         return {
             "sentiment_polarity": round(polarity, 3),  # -1 (negative) to 1 (positive)
@@ -217,52 +384,62 @@ class StyleAnalyzer:
             "confidence_level": round(confidence_score, 4)
         }
     
-    def _analyze_content_flow(self, samples: List[str]) -> Dict[str, Any]:
+    def _analyze_content_flow(self, statistics: StyleStatistics) -> Dict[str, Any]:
         """Analyze content structure and flow"""
-        # Analyze opening patterns
-        openings = [sample[:200] for sample in samples if len(sample) > 200]
-        
-        hook_types = {
-            "question": 0,
-            "statistic": 0,
-            "bold_claim": 0,
-            "story": 0
-        }
+        # Normalize hook counts over samples long enough to have an opening
+        total = statistics.opening_count or 1
+        hook_distribution = {k: round(v/total, 3) for k, v in statistics.hook_counts.items()}
         
-        for opening in openings:
-            if '?' in opening[:100]:
-                hook_types["question"] += 1
-            if re.search(r'\d+%|\$\d+|[0-9]{2,}', opening[:100]):
-                hook_types["statistic"] += 1
-            if any(word in opening.lower()[:100] for word in ['never', 'always', 'everyone', 'nobody']):
-                hook_types["bold_claim"] += 1
-            if any(word in opening.lower()[:100] for word in ['when i', 'story', 'once', 'remember']):
-                hook_types["story"] += 1
-        
-        # Normalize
-        total = len(openings) if openings else 1
-        hook_distribution = {k: round(v/total, 3) for k, v in hook_types.items()}
-        
-        # Average paragraph length (rough estimate based on double newlines)
-        avg_para_length = []
-        for sample in samples:
-            paragraphs = sample.split('\n\n')
-            para_lengths = [len(p.split()) for p in paragraphs if p.strip()]
-            if para_lengths:
-                avg_para_length.append(sum(para_lengths) / len(para_lengths))
+        avg_para_length = 0
+        if statistics.paragraph_samples:
+            avg_para_length = round(statistics.paragraph_mean_total / statistics.paragraph_samples, 2)
         
         return {
             "hook_distribution": hook_distribution,
-            "avg_paragraph_length": round(sum(avg_para_length) / len(avg_para_length), 2) if avg_para_length else 0
+            "avg_paragraph_length": avg_para_length
         }
+
+
+def _iter_shards(samples: Iterable[str], shard_size: int) -> Iterator[List[str]]:
+    """Group samples into lists of at most shard_size"""
+    shard = []
+    for sample in samples:
+        shard.append(sample)
+        if len(shard) >= shard_size:
+            yield shard
+            shard = []
+    if shard:
+        yield shard
+
+
+def _process_context():
+    """
+    Start method of analysis workers
     
-    def _calculate_variance(self, numbers: List[float]) -> float:
-        """Calculate variance of a list of numbers"""
-        if not numbers:
-            return 0
-        mean = sum(numbers) / len(numbers)
-        variance = sum((x - mean) ** 2 for x in numbers) / len(numbers)
-        return variance
+    Callers may be multithreaded (e.g. API workers holding locks and SQLite
+    handles), and forking such a process can deadlock the children, so
+    workers come from a forkserver (spawn where that is unavailable).
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+# Analyzer reused by each worker process across shards
+_worker_analyzer = None
+
+def _init_worker(lexicons: Dict[str, List[str]]):
+    """Build the worker's analyzer once, with the parent's lexicons"""
+    global _worker_analyzer
+    _worker_analyzer = StyleAnalyzer(lexicons)
+
+def _shard_statistics(shard: List[str]) -> StyleStatistics:
+    """Compute the statistics of one shard (runs in a worker process)"""
+    return _worker_analyzer.collect_statistics(shard)
+
+def _shard_profiles(shard: List[str], author_name: str) -> List[StyleProfile]:
+    """Analyze each sample of one shard separately (runs in a worker process)"""
+    return _worker_analyzer.analyze_each(shard, author_name)
 
 
 # Example usage
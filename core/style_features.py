@@ -0,0 +1,130 @@
+"""
+Style Features - Compiled lexicon and pattern matching for style metrics
+
+This module handles:
+- Compiling the contrast, rule-of-three and opening hook patterns once
+- Counting every lexicon category in a single pass over a document
+- Extending the built-in lexicons with per-profile domain words
+"""
+
+import re
+from collections import Counter
+from typing import Dict, Iterable, Optional
+
+from .style_tokenizer import TokenizedDocument
+from .style_statistics import LEXICONS, HOOK_TYPES
+
+
+# Built-in lexicons for vocabulary and tone metrics
+DEFAULT_LEXICONS: Dict[str, frozenset] = {
+    "power_words": frozenset({
+        'guaranteed', 'proven', 'results', 'immediately', 'literally',
+        'obviously', 'actually', 'specifically', 'exactly', 'ultimately'
+    }),
+    "urgency_words": frozenset({'now', 'immediately', 'today', 'urgent', 'quick', 'fast', 'hurry'}),
+    "confidence_words": frozenset({'will', 'must', 'guaranteed', 'proven', 'certain', 'definitely'})
+}
+
+# Contrast ("not X but Y") spans words, so it stays a pattern of its own; the
+# single-word markers share one alternation (whole words never overlap)
+CONTRAST_SPAN_PATTERN = re.compile(r'\bnot\b.*\bbut\b')
+CONTRAST_WORD_PATTERN = re.compile(r'\b(?:instead|however|yet)\b')
+
+# Lists of three items ("X, Y, and Z")
+RULE_OF_THREE_PATTERN = re.compile(r'\b\w+\s*,\s*\w+\s*,\s*(?:and|or)\s+\w+\b')
+
+# Opening hooks, matched against the first 100 characters of a sample
+STATISTIC_HOOK_PATTERN = re.compile(r'\d+%|\$\d+|[0-9]{2,}')
+BOLD_CLAIM_HOOK_PATTERN = re.compile(r'never|always|everyone|nobody')
+STORY_HOOK_PATTERN = re.compile(r'when i|story|once|remember')
+
+OPENING_MIN_LENGTH = 200
+OPENING_LENGTH = 100
+
+
+def normalize_lexicons(lexicons: Optional[Dict[str, Iterable[str]]]) -> Dict[str, list]:
+    """
+    Validate user-supplied lexicons and normalize them for storage
+
+    Args:
+        lexicons: Extra words per lexicon category (e.g. {"power_words": ["roi"]})
+
+    Returns:
+        Sorted, lowercased word lists keyed by category (empty categories dropped)
+    """
+    normalized = {}
+    for category, words in (lexicons or {}).items():
+        if category not in LEXICONS:
+            raise ValueError(
+                f"Unknown lexicon category '{category}'. Expected one of: {', '.join(LEXICONS)}"
+            )
+        if isinstance(words, str):
+            words = [words]
+        cleaned = sorted({word.strip().lower() for word in words if word and word.strip()})
+        if cleaned:
+            normalized[category] = cleaned
+    return normalized
+
+
+class FeatureExtractor:
+    """Precompiled lexicon and pattern matcher shared by all samples of an analysis"""
+
+    def __init__(self, lexicons: Optional[Dict[str, Iterable[str]]] = None):
+        """
+        Args:
+            lexicons: Optional extra words per category, added to the built-in lexicons
+        """
+        self.lexicons = normalize_lexicons(lexicons)
+
+        self.categories: Dict[str, frozenset] = {}
+        for category in LEXICONS:
+            self.categories[category] = DEFAULT_LEXICONS[category] | frozenset(self.lexicons.get(category, ()))
+
+        # Every lexicon word mapped to the categories it counts towards
+        self.word_categories: Dict[str, tuple] = {}
+        for category, words in self.categories.items():
+            for word in words:
+                self.word_categories[word] = self.word_categories.get(word, ()) + (category,)
+
+    def lexicon_counts(self, doc: TokenizedDocument) -> Dict[str, int]:
+        """Count lexicon hits for every category in one pass over the document"""
+        counts = {category: 0 for category in LEXICONS}
+        word_categories = self.word_categories
+
+        for word, occurrences in Counter(doc.bare_words).items():
+            categories = word_categories.get(word)
+            if categories:
+                for category in categories:
+                    counts[category] += occurrences
+
+        return counts
+
+    def contrast_count(self, doc: TokenizedDocument) -> int:
+        """Count contrast markers ("not X but Y", "instead", "however", "yet")"""
+        return (
+            len(CONTRAST_SPAN_PATTERN.findall(doc.lowered))
+            + len(CONTRAST_WORD_PATTERN.findall(doc.lowered))
+        )
+
+    def rule_of_three_count(self, doc: TokenizedDocument) -> int:
+        """Count lists of three items"""
+        return len(RULE_OF_THREE_PATTERN.findall(doc.text))
+
+    def hook_counts(self, doc: TokenizedDocument) -> Optional[Dict[str, int]]:
+        """Classify the opening hook of a sample (None if too short to have one)"""
+        if len(doc.text) <= OPENING_MIN_LENGTH:
+            return None
+
+        opening = doc.text[:OPENING_LENGTH]
+        opening_lower = doc.lowered[:OPENING_LENGTH]
+
+        hooks = {name: 0 for name in HOOK_TYPES}
+        if '?' in opening:
+            hooks["question"] = 1
+        if STATISTIC_HOOK_PATTERN.search(opening):
+            hooks["statistic"] = 1
+        if BOLD_CLAIM_HOOK_PATTERN.search(opening_lower):
+            hooks["bold_claim"] = 1
+        if STORY_HOOK_PATTERN.search(opening_lower):
+            hooks["story"] = 1
+        return hooks
@@ -0,0 +1,151 @@
+"""
+Style Statistics - Mergeable sufficient statistics for style analysis
+
+This module handles:
+- Accumulating the raw counts and sums behind every StyleProfile metric
+- Merging accumulators from different sample sets exactly
+- Serializing accumulators into profile JSON so profiles can be appended to
+"""
+
+import math
+from dataclasses import dataclass, field, asdict
+from typing import Dict, List, Any
+
+
+STATISTICS_VERSION = 1
+
+HOOK_TYPES = ("question", "statistic", "bold_claim", "story")
+LEXICONS = ("power_words", "urgency_words", "confidence_words")
+
+
+def _add_to_partials(partials: List[float], value: float):
+    """
+    Add a float to an exact running sum (Shewchuk's algorithm, as used by math.fsum)
+
+    The partials list represents the sum without rounding error, so merging
+    accumulators in any order yields the same total.
+    """
+    i = 0
+    for partial in partials:
+        if abs(value) < abs(partial):
+            value, partial = partial, value
+        high = value + partial
+        low = partial - (high - value)
+        if low:
+            partials[i] = low
+            i += 1
+        value = high
+    partials[i:] = [value]
+
+
+@dataclass
+class StyleStatistics:
+    """Sufficient statistics for a set of content samples"""
+    sample_count: int = 0
+    total_words: int = 0
+
+    # Sentence structure
+    sentence_count: int = 0
+    sentence_length_sum: int = 0
+    sentence_length_sq_sum: int = 0
+    fragment_count: int = 0
+    question_count: int = 0
+    exclamation_count: int = 0
+
+    # Vocabulary
+    word_length_sum: int = 0
+    vocabulary: Dict[str, int] = field(default_factory=dict)
+    lexicon_counts: Dict[str, int] = field(default_factory=lambda: {name: 0 for name in LEXICONS})
+
+    # Readability components (textstat counts)
+    readability_samples: int = 0
+    readability_words: int = 0
+    readability_sentences: int = 0
+    readability_syllables: int = 0
+
+    # Sentiment (TextBlob assessments)
+    sentiment_samples: int = 0
+    sentiment_assessments: int = 0
+    polarity_sum: List[float] = field(default_factory=list)
+    subjectivity_sum: List[float] = field(default_factory=list)
+
+    # Rhetorical devices
+    contrast_count: int = 0
+    rule_of_three_count: int = 0
+
+    # Content flow
+    opening_count: int = 0
+    hook_counts: Dict[str, int] = field(default_factory=lambda: {name: 0 for name in HOOK_TYPES})
+    paragraph_samples: int = 0
+    paragraph_mean_sum: List[float] = field(default_factory=list)
+
+    def add_polarity(self, polarity: float, subjectivity: float):
+        """Add one sentiment assessment"""
+        self.sentiment_assessments += 1
+        _add_to_partials(self.polarity_sum, polarity)
+        _add_to_partials(self.subjectivity_sum, subjectivity)
+
+    def add_paragraph_mean(self, mean_length: float):
+        """Add the average paragraph length of one sample"""
+        self.paragraph_samples += 1
+        _add_to_partials(self.paragraph_mean_sum, mean_length)
+
+    def merge(self, other: 'StyleStatistics') -> 'StyleStatistics':
+        """
+        Fold another accumulator into this one (in place)
+
+        Merging is exact and order-independent, so a profile built from merged
+        statistics is identical to one built from all samples at once.
+        """
+        for name in (
+            "sample_count", "total_words",
+            "sentence_count", "sentence_length_sum", "sentence_length_sq_sum",
+            "fragment_count", "question_count", "exclamation_count",
+            "word_length_sum",
+            "readability_samples", "readability_words", "readability_sentences", "readability_syllables",
+            "sentiment_samples", "sentiment_assessments",
+            "contrast_count", "rule_of_three_count",
+            "opening_count", "paragraph_samples"
+        ):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+        for word, count in other.vocabulary.items():
+            self.vocabulary[word] = self.vocabulary.get(word, 0) + count
+        for name, count in other.lexicon_counts.items():
+            self.lexicon_counts[name] = self.lexicon_counts.get(name, 0) + count
+        for name, count in other.hook_counts.items():
+            self.hook_counts[name] = self.hook_counts.get(name, 0) + count
+
+        for value in other.polarity_sum:
+            _add_to_partials(self.polarity_sum, value)
+        for value in other.subjectivity_sum:
+            _add_to_partials(self.subjectivity_sum, value)
+        for value in other.paragraph_mean_sum:
+            _add_to_partials(self.paragraph_mean_sum, value)
+
+        return self
+
+    @property
+    def polarity_total(self) -> float:
+        return math.fsum(self.polarity_sum)
+
+    @property
+    def subjectivity_total(self) -> float:
+        return math.fsum(self.subjectivity_sum)
+
+    @property
+    def paragraph_mean_total(self) -> float:
+        return math.fsum(self.paragraph_mean_sum)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {"version": STATISTICS_VERSION}
+        data.update(asdict(self))
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'StyleStatistics':
+        data = dict(data)
+        version = data.pop("version", None)
+        if version != STATISTICS_VERSION:
+            raise ValueError(f"Unsupported statistics version: {version}")
+        return cls(**data)
@@ -0,0 +1,88 @@
+"""
+Style Tokenizer - Segment a document once for every style metric
+
+This module handles:
+- Splitting text into sentences, words and paragraphs in a single pass
+- Holding the result in a compact, reusable document representation
+- Sharing that representation across all StyleAnalyzer metrics
+"""
+
+import re
+from dataclasses import dataclass
+from typing import List
+
+
+# Sentences are maximal runs of non-terminator characters, followed by
+# their (possibly empty) run of terminators
+SENTENCE_PATTERN = re.compile(r'([^.!?]+)([.!?]*)')
+
+# Punctuation stripped from word tokens before lexicon lookups
+WORD_PUNCTUATION = '.,!?;:'
+
+
+@dataclass
+class TokenizedDocument:
+    """Compact, pre-segmented view of a single content sample"""
+    text: str
+    lowered: str
+    words: List[str]  # lowercased whitespace tokens
+    bare_words: List[str]  # lowercased tokens with punctuation stripped
+    sentence_lengths: List[int]  # word count per sentence
+    question_count: int
+    exclamation_count: int
+    paragraph_lengths: List[int]  # word count per non-empty paragraph
+
+    @property
+    def word_count(self) -> int:
+        return len(self.words)
+
+    @property
+    def sentence_count(self) -> int:
+        return len(self.sentence_lengths)
+
+
+def tokenize(text: str) -> TokenizedDocument:
+    """
+    Segment a text into sentences, words and paragraphs
+
+    Args:
+        text: Raw content sample
+
+    Returns:
+        TokenizedDocument shared by all style metrics
+    """
+    lowered = text.lower()
+    words = lowered.split()
+
+    sentence_lengths = []
+    question_count = 0
+    exclamation_count = 0
+    for match in SENTENCE_PATTERN.finditer(text):
+        length = len(match.group(1).split())
+        if not length:
+            continue
+        sentence_lengths.append(length)
+
+        terminator = match.group(2)
+        if '?' in terminator:
+            question_count += 1
+        if '!' in terminator:
+            exclamation_count += 1
+
+    paragraph_lengths = [
+        len(paragraph.split())
+        for paragraph in text.split('\n\n')
+        if paragraph.strip()
+    ]
+
+    return TokenizedDocument(
+        text=text,
+        lowered=lowered,
+        words=words,
+        bare_words=[word.strip(WORD_PUNCTUATION) for word in words],
+        sentence_lengths=sentence_lengths,
+        question_count=question_count,
+        exclamation_count=exclamation_count,
+        paragraph_lengths=paragraph_lengths
+    )
+
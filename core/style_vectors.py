@@ -0,0 +1,164 @@
+"""
+Style Vectors - Fixed-order numeric feature vectors for style profiles
+
+This module handles:
+- Flattening a style profile into a fixed-order NumPy feature vector
+- Scoring many candidates against many profiles in one vectorized call
+- Building full N×N voice similarity matrices
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+STYLE_VECTOR_VERSION = 1
+
+# Compared sections and their numeric metrics, in vector order
+FEATURE_SECTIONS = {
+    "sentence_structure": (
+        "avg_sentence_length", "fragment_ratio", "question_frequency",
+        "exclamation_frequency", "sentence_count", "length_variance"
+    ),
+    "vocabulary": (
+        "avg_word_length", "reading_ease_score", "grade_level", "total_words",
+        "unique_words", "lexical_diversity", "power_word_density"
+    ),
+    "rhetorical_devices": (
+        "repetition_for_emphasis", "contrast_usage", "rule_of_threes"
+    ),
+    "emotional_tone": (
+        "sentiment_polarity", "subjectivity", "urgency_level", "confidence_level"
+    )
+}
+
+FEATURE_KEYS = [(section, key) for section, keys in FEATURE_SECTIONS.items() for key in keys]
+SECTION_NAMES = list(FEATURE_SECTIONS)
+
+# Column -> section index, used to reduce per-feature scores per section
+_SECTION_OF_FEATURE = np.array(
+    [SECTION_NAMES.index(section) for section, _ in FEATURE_KEYS]
+)
+_SECTION_MASKS = np.stack([_SECTION_OF_FEATURE == i for i in range(len(SECTION_NAMES))])
+
+
+def vectorize_style(style: Dict) -> np.ndarray:
+    """
+    Flatten a style profile dictionary into a feature vector
+
+    Args:
+        style: StyleProfile dictionary (profile["style"])
+
+    Returns:
+        float64 array in FEATURE_KEYS order; missing or non-numeric metrics are NaN
+    """
+    vector = np.full(len(FEATURE_KEYS), np.nan)
+    for i, (section, key) in enumerate(FEATURE_KEYS):
+        value = (style.get(section) or {}).get(key)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            vector[i] = value
+    return vector
+
+
+def vector_to_dict(vector: np.ndarray) -> Dict:
+    """Serialize a feature vector for profile JSON (NaN stored as null)"""
+    return {
+        "version": STYLE_VECTOR_VERSION,
+        "values": [None if np.isnan(value) else float(value) for value in vector]
+    }
+
+
+def vector_from_dict(data: Optional[Dict]) -> Optional[np.ndarray]:
+    """Deserialize a stored feature vector (None if missing or outdated)"""
+    if not isinstance(data, dict) or data.get("version") != STYLE_VECTOR_VERSION:
+        return None
+    values = data.get("values") or []
+    if len(values) != len(FEATURE_KEYS):
+        return None
+    return np.array([np.nan if value is None else value for value in values], dtype=float)
+
+
+def profile_vector(profile: Dict) -> np.ndarray:
+    """Get a profile's feature vector (computed from its style if not stored)"""
+    vector = vector_from_dict(profile.get("style_vector"))
+    if vector is None:
+        vector = vectorize_style(profile.get("style") or {})
+    return vector
+
+
+def _section_scores(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Section similarities of broadcast-compatible (..., F) arrays
+
+    Per-metric difference is |a - b| / max(|a|, |b|) (0 when both are 0), so
+    every metric is scale-normalized to [0, 1]. Each section scores
+    1 - mean difference over the metrics present on both sides, or 0 when
+    they share none.
+    """
+    scale = np.maximum(np.abs(a), np.abs(b))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        differences = np.where(scale > 0, np.abs(a - b) / scale, 0.0)
+    present = ~(np.isnan(a) | np.isnan(b))
+    differences = np.where(present, differences, 0.0)
+
+    # Sum differences and counts per section with one matrix product each
+    masks = _SECTION_MASKS.T.astype(float)
+    totals = differences @ masks
+    counts = present.astype(float) @ masks
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        similarities = 1 - np.minimum(totals / counts, 1)
+    return np.where(counts > 0, similarities, 0.0)
+
+
+def section_similarities(candidates: np.ndarray, profiles: np.ndarray) -> np.ndarray:
+    """
+    Score every candidate against every profile, section by section
+
+    Args:
+        candidates: (m, F) array of feature vectors
+        profiles: (n, F) array of feature vectors
+
+    Returns:
+        (m, n, sections) array of similarities in SECTION_NAMES order
+    """
+    return _section_scores(np.atleast_2d(candidates)[:, None, :], np.atleast_2d(profiles)[None, :, :])
+
+
+def paired_similarities(candidates: np.ndarray, profiles: np.ndarray) -> np.ndarray:
+    """
+    Score candidates against profiles row by row
+
+    Args:
+        candidates: (n, F) or (F,) array (a single vector is compared to every row)
+        profiles: (n, F) array of feature vectors
+
+    Returns:
+        (n, sections) array of similarities in SECTION_NAMES order
+    """
+    return _section_scores(np.atleast_2d(candidates), np.atleast_2d(profiles))
+
+
+def overall_similarity(sections: np.ndarray) -> np.ndarray:
+    """Average section similarities into an overall score"""
+    return sections.mean(axis=-1)
+
+
+def similarity_matrix(vectors: np.ndarray) -> np.ndarray:
+    """
+    Compute the overall similarity of every pair of vectors
+
+    Args:
+        vectors: (n, F) array of feature vectors
+
+    Returns:
+        (n, n) array of overall similarities
+    """
+    return overall_similarity(section_similarities(vectors, vectors))
+
+
+def stack_vectors(vectors: List[np.ndarray]) -> np.ndarray:
+    """Stack feature vectors into an (n, F) matrix (empty-safe)"""
+    if not vectors:
+        return np.empty((0, len(FEATURE_KEYS)))
+    return np.vstack(vectors)
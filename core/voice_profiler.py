@@ -11,136 +11,299 @@ This module handles:
 import json
 import os
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Iterable, Union
 from datetime import datetime
 
-from .style_analyzer import StyleAnalyzer, StyleProfile
+from .style_analyzer import StyleAnalyzer, StyleProfile, iter_documents
+from .style_statistics import StyleStatistics
+from .style_features import normalize_lexicons
+from .profile_index import ProfileIndex
+from .profile_manifest import ProfileManifest
+from .profile_cache import get_profile_cache
+from .atomic_io import file_lock
+from .profile_store import JSON_SUFFIX, VCP_SUFFIX, STORAGE_FORMATS, iter_profile_files, write_profile
+from .style_vectors import (
+    vectorize_style,
+    vector_to_dict,
+    profile_vector,
+    section_similarities,
+    similarity_matrix,
+    stack_vectors
+)
+
+
+# Profile sections needed for style comparison
+STYLE_SECTIONS = ("metadata", "style", "style_vector", "lexicons")
+
+
+class ProfileVersionConflict(ValueError):
+    """Raised when a profile changed since the version a writer based its update on"""
+    pass
+
+
+class MissingStyleMetrics(ValueError):
+    """Raised when a profile exists but has no style metrics to compare against"""
+    pass
+
+
+def _next_version(version: Optional[str]) -> str:
+    """Bump the minor part of a "major.minor" profile version"""
+    try:
+        major, minor = str(version).split(".")
+        return f"{int(major)}.{int(minor) + 1}"
+    except ValueError:
+        return "1.1"
 
 
 class VoiceProfiler:
     """Create and manage voice profiles"""
     
-    def __init__(self, profiles_dir: str = "./data/voices"):
+    def __init__(self, profiles_dir: str = "./data/voices", storage_format: Optional[str] = None):
+        """
+        Args:
+            profiles_dir: Directory holding the profiles
+            storage_format: Format for saved profiles, "json" or compact "vcp"
+                            (default: VOICECRAFT_PROFILE_FORMAT or "json").
+                            Profiles of either format are always readable.
+        """
         self.profiles_dir = Path(profiles_dir)
         self.profiles_dir.mkdir(parents=True, exist_ok=True)
+        self.storage_format = storage_format or os.getenv('VOICECRAFT_PROFILE_FORMAT', 'json')
+        if self.storage_format not in STORAGE_FORMATS:
+            raise ValueError(f"Unknown profile storage format: {self.storage_format}")
         self.analyzer = StyleAnalyzer()
+        self._lexicon_analyzers: Dict[str, StyleAnalyzer] = {}
+        self._index: Optional[ProfileIndex] = None
+        self._manifest: Optional[ProfileManifest] = None
+    
+    @property
+    def index(self) -> ProfileIndex:
+        """Nearest-voice index over this directory (loaded and synced on first use)"""
+        if self._index is None:
+            self._index = ProfileIndex(self.profiles_dir)
+        return self._index
+    
+    @property
+    def manifest(self) -> ProfileManifest:
+        """Summary manifest of this directory (loaded on first use)"""
+        if self._manifest is None:
+            self._manifest = ProfileManifest(self.profiles_dir)
+        return self._manifest
+    
+    def _get_analyzer(self, lexicons: Optional[Dict[str, List[str]]] = None) -> StyleAnalyzer:
+        """Get an analyzer for a profile's custom lexicons (compiled once per lexicon set)"""
+        if not lexicons:
+            return self.analyzer
+        
+        key = json.dumps(lexicons, sort_keys=True)
+        if key not in self._lexicon_analyzers:
+            self._lexicon_analyzers[key] = StyleAnalyzer(lexicons)
+        return self._lexicon_analyzers[key]
     
     def create_profile(
         self,
         name: str,
-        content_samples: List[str],
+        content_samples: Iterable[Union[str, os.PathLike]],
         description: Optional[str] = None,
-        tags: Optional[List[str]] = None
+        tags: Optional[List[str]] = None,
+        workers: int = 1,
+        lexicons: Optional[Dict[str, List[str]]] = None
     ) -> Dict:
         """
         Create a voice profile from content samples
         
         Args:
             name: Profile name (e.g., "Louie Bernstein")
-            content_samples: List of text samples
+            content_samples: Text samples or file paths; consumed as a stream
             description: Optional description
             tags: Optional tags (e.g., ["sales", "consulting"])
+            workers: Number of analysis worker processes (1 = serial)
+            lexicons: Optional domain words per lexicon category,
+                      e.g. {"power_words": ["pipeline", "quota"]}
             
         Returns:
             Complete voice profile dictionary
         """
+        lexicons = normalize_lexicons(lexicons)
+        
         # Analyze the style
-        style_profile = self.analyzer.analyze_samples(content_samples, name)
+        excerpts = []
+        statistics = self._collect_statistics(content_samples, excerpts, workers, lexicons)
+        
+        if not statistics.sample_count:
+            raise ValueError("No content samples provided")
+        
+        profile = self._build_profile(name, statistics, excerpts, description, tags, lexicons=lexicons)
+        
+        # Save profile
+        self.save_profile(name, profile)
+        
+        return profile
+    
+    def _collect_statistics(
+        self,
+        content_samples: Iterable[Union[str, os.PathLike]],
+        excerpts: List[str],
+        workers: int = 1,
+        lexicons: Optional[Dict[str, List[str]]] = None
+    ) -> StyleStatistics:
+        """Stream samples through the analyzer, keeping excerpts of the first few"""
+        def samples_with_excerpts():
+            for sample in iter_documents(content_samples):
+                if len(excerpts) < 3:
+                    # Store first 500 chars of each sample for reference
+                    excerpts.append(sample[:500])
+                yield sample
+        
+        analyzer = self._get_analyzer(lexicons)
+        return analyzer.collect_statistics(samples_with_excerpts(), workers=workers)
+    
+    def _build_profile(
+        self,
+        name: str,
+        statistics: StyleStatistics,
+        excerpts: List[str],
+        description: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        created_at: Optional[str] = None,
+        lexicons: Optional[Dict[str, List[str]]] = None
+    ) -> Dict:
+        """Assemble a complete profile dictionary from style statistics"""
+        style_profile = self.analyzer.profile_from_statistics(statistics, name)
+        style = style_profile.to_dict()
+        now = datetime.now().isoformat()
         
-        # Create complete profile
         profile = {
             "metadata": {
                 "name": name,
                 "description": description or "",
                 "tags": tags or [],
-                "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat(),
+                "created_at": created_at or now,
+                "updated_at": now,
                 "version": "1.0"
             },
-            "style": style_profile.to_dict(),
+            "style": style,
+            # Fixed-order numeric features for vectorized similarity
+            "style_vector": vector_to_dict(vectorize_style(style)),
             "samples": {
-                "count": len(content_samples),
+                "count": statistics.sample_count,
                 "total_words": style_profile.total_words,
-                # Store first 500 chars of each sample for reference
-                "excerpts": [sample[:500] for sample in content_samples[:3]]
-            }
+                "excerpts": excerpts
+            },
+            # Mergeable accumulators so new samples can be appended later
+            "statistics": statistics.to_dict()
         }
         
-        # Save profile
-        self.save_profile(name, profile)
+        if lexicons:
+            # Custom lexicons the statistics were counted with
+            profile["lexicons"] = lexicons
         
         return profile
     
-    def load_profile(self, name: str) -> Optional[Dict]:
-        """Load a voice profile by name"""
-        profile_path = self._get_profile_path(name)
+    def load_profile(self, name: str, sections: Optional[Iterable[str]] = None) -> Optional[Dict]:
+        """
+        Load a voice profile by name (served from the shared profile cache when unchanged)
+        
+        Args:
+            name: Profile name
+            sections: Top-level sections to load, e.g. ["metadata", "style"]
+                      (default: everything). "samples" holds the sample counts;
+                      "samples.excerpts" adds the excerpt texts. Compact .vcp
+                      profiles read only the requested sections from disk.
+        """
+        profile_path = self._find_profile_path(name)
         
-        if not profile_path.exists():
+        if profile_path is None:
             return None
         
-        with open(profile_path, 'r') as f:
-            return json.load(f)
+        return get_profile_cache().get(profile_path, sections)
     
-    def save_profile(self, name: str, profile: Dict):
-        """Save a voice profile"""
+    def save_profile(self, name: str, profile: Dict, expected_version: Optional[str] = None):
+        """
+        Save a voice profile (in this profiler's storage format)
+        
+        Writers are serialized by a per-profile lock and the file is replaced
+        atomically, so concurrent readers see either the old or new profile.
+        Saving over an existing profile bumps metadata.version.
+        
+        Args:
+            name: Profile name
+            profile: Profile dictionary (its metadata.version is updated)
+            expected_version: If given, the metadata.version the caller's
+                              changes are based on; raises
+                              ProfileVersionConflict if the stored profile
+                              has moved on
+        """
         profile_path = self._get_profile_path(name)
         
-        with open(profile_path, 'w') as f:
-            json.dump(profile, f, indent=2)
+        with self._profile_lock(name):
+            exists = self._find_profile_path(name) is not None
+            current_version = self._stored_version(name) if exists else None
+            if expected_version is not None and current_version != expected_version:
+                raise ProfileVersionConflict(
+                    f"Profile '{name}' is at version {current_version}, expected {expected_version}"
+                )
+            
+            if exists:
+                profile.setdefault("metadata", {})["version"] = _next_version(current_version)
+            
+            write_profile(profile_path, profile)
+            
+            # Drop the copy in the other format so it cannot shadow this one
+            for other_path in self._profile_paths(name):
+                if other_path != profile_path and other_path.exists():
+                    other_path.unlink()
+                    get_profile_cache().invalidate(other_path)
+            
+            get_profile_cache().put(profile_path, profile)
+            self.index.update(profile_path, profile)
+            self.manifest.update(profile_path, profile)
+    
+    def delete_profile(self, name: str) -> bool:
+        """
+        Delete a voice profile
+        
+        Returns:
+            True if the profile existed and was deleted
+        """
+        deleted = False
+        
+        with self._profile_lock(name):
+            for profile_path in self._profile_paths(name):
+                try:
+                    profile_path.unlink()
+                except FileNotFoundError:
+                    continue
+                
+                get_profile_cache().invalidate(profile_path)
+                self.index.remove(profile_path)
+                self.manifest.remove(profile_path)
+                deleted = True
+        
+        return deleted
     
     def list_profiles(self) -> List[Dict]:
         """List all available voice profiles"""
-        profiles = []
-        
-        for profile_file in self.profiles_dir.glob("*.json"):
-            try:
-                with open(profile_file, 'r') as f:
-                    profile = json.load(f)
-                    
-                    # Handle different profile formats
-                    metadata = profile.get("metadata", {})
-                    
-                    # Get sample count from various possible locations
-                    sample_count = 0
-                    if "samples" in profile:
-                        samples_info = profile["samples"]
-                        if isinstance(samples_info, dict):
-                            sample_count = samples_info.get("count", 0)
-                    elif "llm_analysis" in profile:
-                        # LLM-analyzed profile format
-                        llm_analysis = profile.get("llm_analysis", {})
-                        sample_count = llm_analysis.get("samples_analyzed", 0)
-                    elif "style" in profile:
-                        # Old format - check style profile
-                        style = profile.get("style", {})
-                        sample_count = style.get("sample_count", 0)
-                    
-                    profiles.append({
-                        "name": metadata.get("name", profile_file.stem),
-                        "description": metadata.get("description", ""),
-                        "tags": metadata.get("tags", []),
-                        "created_at": metadata.get("created_at", ""),
-                        "sample_count": sample_count
-                    })
-            except Exception as e:
-                # Skip corrupted profiles
-                continue
-        
-        return profiles
+        # Summaries come from the manifest; only profiles changed since they
+        # were last summarized are re-read
+        self.manifest.sync()
+        return self.manifest.summaries()
     
     def update_profile(
         self,
         name: str,
-        new_samples: List[str],
-        append: bool = True
+        new_samples: Iterable[Union[str, os.PathLike]],
+        append: bool = True,
+        workers: int = 1
     ) -> Dict:
         """
         Update an existing voice profile with new samples
         
         Args:
             name: Profile name
-            new_samples: New content samples
+            new_samples: New content samples (texts or file paths)
             append: If True, combine with existing; if False, replace
+            workers: Number of analysis worker processes (1 = serial)
             
         Returns:
             Updated profile
@@ -150,17 +313,52 @@ class VoiceProfiler:
         if not existing_profile:
             raise ValueError(f"Profile '{name}' not found")
         
+        metadata = existing_profile.get("metadata", {})
+        lexicons = existing_profile.get("lexicons")
+        
+        if append and "statistics" in existing_profile:
+            # Analyze the new samples without holding the lock (O(new text))
+            new_excerpts = []
+            new_statistics = self._collect_statistics(new_samples, new_excerpts, workers, lexicons)
+            
+            # Fold them into the latest stored accumulators, so concurrent
+            # appends serialize instead of overwriting each other
+            with self._profile_lock(name):
+                current_profile = self.load_profile(name)
+                
+                if not current_profile or "statistics" not in current_profile:
+                    raise ProfileVersionConflict(f"Profile '{name}' was replaced while updating")
+                if current_profile.get("lexicons") != lexicons:
+                    raise ProfileVersionConflict(f"Profile '{name}' lexicons changed while updating")
+                
+                metadata = current_profile.get("metadata", {})
+                statistics = StyleStatistics.from_dict(current_profile["statistics"]).merge(new_statistics)
+                excerpts = (list(current_profile.get("samples", {}).get("excerpts", [])) + new_excerpts)[:3]
+                
+                new_profile = self._build_profile(
+                    name,
+                    statistics,
+                    excerpts,
+                    description=metadata.get("description"),
+                    tags=metadata.get("tags"),
+                    created_at=metadata.get("created_at"),
+                    lexicons=lexicons
+                )
+                self.save_profile(name, new_profile, expected_version=metadata.get("version"))
+            return new_profile
+        
         if append:
-            # Would need to re-analyze with all samples combined
-            # For now, just replace
-            pass
+            print(f"Warning: Profile '{name}' has no stored statistics to append to. "
+                  "Replacing it with the new samples.")
         
         # Create new profile with new samples
         new_profile = self.create_profile(
             name=name,
             content_samples=new_samples,
-            description=existing_profile["metadata"].get("description"),
-            tags=existing_profile["metadata"].get("tags")
+            description=metadata.get("description"),
+            tags=metadata.get("tags"),
+            workers=workers,
+            lexicons=lexicons
         )
         
         return new_profile
@@ -172,94 +370,231 @@ class VoiceProfiler:
         Returns:
             Dictionary with similarity scores for different aspects
         """
-        profile1 = self.load_profile(name1)
-        profile2 = self.load_profile(name2)
+        profile1 = self.load_profile(name1, STYLE_SECTIONS)
+        profile2 = self.load_profile(name2, STYLE_SECTIONS)
         
         if not profile1 or not profile2:
             raise ValueError("One or both profiles not found")
         
-        style1 = profile1["style"]
-        style2 = profile2["style"]
-        
-        # Compare sentence structure
-        sentence_sim = self._compare_dict_values(
-            style1["sentence_structure"],
-            style2["sentence_structure"]
-        )
-        
-        # Compare vocabulary
-        vocab_sim = self._compare_dict_values(
-            style1["vocabulary"],
-            style2["vocabulary"]
-        )
-        
-        # Compare rhetorical devices
-        rhetoric_sim = self._compare_dict_values(
-            style1["rhetorical_devices"],
-            style2["rhetorical_devices"]
-        )
-        
-        # Compare emotional tone
-        tone_sim = self._compare_dict_values(
-            style1["emotional_tone"],
-            style2["emotional_tone"]
-        )
+        sentence_sim, vocab_sim, rhetoric_sim, tone_sim = section_similarities(
+            profile_vector(profile1),
+            profile_vector(profile2)
+        )[0, 0]
         
         # Overall similarity (average)
         overall = (sentence_sim + vocab_sim + rhetoric_sim + tone_sim) / 4
         
         return {
-            "overall_similarity": round(overall, 3),
-            "sentence_structure_similarity": round(sentence_sim, 3),
-            "vocabulary_similarity": round(vocab_sim, 3),
-            "rhetorical_similarity": round(rhetoric_sim, 3),
-            "tone_similarity": round(tone_sim, 3)
+            "overall_similarity": round(float(overall), 3),
+            "sentence_structure_similarity": round(float(sentence_sim), 3),
+            "vocabulary_similarity": round(float(vocab_sim), 3),
+            "rhetorical_similarity": round(float(rhetoric_sim), 3),
+            "tone_similarity": round(float(tone_sim), 3)
         }
     
-    def verify_content(self, name: str, content: str) -> Dict[str, Any]:
+    def verify_content(self, name: str, content: str, profile: Optional[Dict] = None) -> Dict[str, Any]:
         """
         Verify if content matches a voice profile
         
         Args:
             name: Profile name
             content: Content to verify
+            profile: Already-loaded profile (skips loading it again)
             
         Returns:
             Verification results with match percentage and details
         """
-        profile = self.load_profile(name)
+        if profile is None:
+            profile = self.load_profile(name, STYLE_SECTIONS)
         
         if not profile:
             raise ValueError(f"Profile '{name}' not found")
         
-        # Analyze the new content
-        new_analysis = self.analyzer.analyze_samples([content], "temp")
+        if "style" not in profile:
+            raise MissingStyleMetrics(f"Profile '{name}' has no style metrics to verify against")
+        
+        # Analyze the new content (with the profile's own lexicons)
+        content_vector = self._content_vector(content, profile.get("lexicons"))
         
         # Compare with profile
-        target_style = profile["style"]
-        new_style = new_analysis.to_dict()
+        sections = section_similarities(content_vector, profile_vector(profile))[0, 0]
         
-        # Calculate match scores
-        sentence_match = self._compare_dict_values(
-            target_style["sentence_structure"],
-            new_style["sentence_structure"]
-        )
+        return self._match_result(sections, content_vector)
+    
+    def verify_batch(
+        self,
+        name: str,
+        contents: List[str],
+        workers: int = 1,
+        profile: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """
+        Verify many drafts against one voice profile
         
-        vocab_match = self._compare_dict_values(
-            target_style["vocabulary"],
-            new_style["vocabulary"]
-        )
+        The profile is loaded once, the drafts are analyzed together
+        (across worker processes if workers > 1) and scored in one
+        vectorized pass.
         
-        rhetoric_match = self._compare_dict_values(
-            target_style["rhetorical_devices"],
-            new_style["rhetorical_devices"]
-        )
+        Args:
+            name: Profile name
+            contents: Drafts to verify
+            workers: Number of analysis worker processes (1 = serial)
+            profile: Already-loaded profile (skips loading it again)
+            
+        Returns:
+            {"match_scores": [...], "results": [verify_content result per draft],
+             "summary": {"count", "passing", "mean_score", "min_score", "max_score"}}
+        """
+        if profile is None:
+            profile = self.load_profile(name, STYLE_SECTIONS)
         
-        tone_match = self._compare_dict_values(
-            target_style["emotional_tone"],
-            new_style["emotional_tone"]
-        )
+        if not profile:
+            raise ValueError(f"Profile '{name}' not found")
+        
+        if "style" not in profile:
+            raise MissingStyleMetrics(f"Profile '{name}' has no style metrics to verify against")
+        
+        contents = list(contents)
+        analyses = self._get_analyzer(profile.get("lexicons")).analyze_each(contents, "temp", workers=workers)
+        vectors = stack_vectors([vectorize_style(analysis.to_dict()) for analysis in analyses])
+        scores = section_similarities(vectors, profile_vector(profile))[:, 0]
+        
+        results = [self._match_result(sections, vector) for sections, vector in zip(scores, vectors)]
+        match_scores = [result["match_score"] for result in results]
+        
+        return {
+            "match_scores": match_scores,
+            "results": results,
+            "summary": {
+                "count": len(results),
+                "passing": sum(1 for result in results if result["matches_voice"]),
+                "mean_score": round(sum(match_scores) / len(match_scores), 1) if match_scores else 0,
+                "min_score": min(match_scores, default=0),
+                "max_score": max(match_scores, default=0)
+            }
+        }
+    
+    def compare_to_profiles(self, content: str, names: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Score content against many voice profiles in one vectorized pass
+        
+        Args:
+            content: Content to score
+            names: Profile names to compare against (default: all stored profiles)
+            
+        Returns:
+            Verification results per profile, best match first
+        """
+        profiles = self._load_profiles(names)
+        
+        # Content is analyzed once per distinct lexicon set
+        results = []
+        for lexicons, group in self._group_by_lexicons(profiles).items():
+            content_vector = self._content_vector(content, json.loads(lexicons))
+            vectors = stack_vectors([profile_vector(profile) for _, profile in group])
+            scores = section_similarities(content_vector, vectors)[0]
+            
+            for (profile_name, _), sections in zip(group, scores):
+                result = self._match_result(sections)
+                result["name"] = profile_name
+                results.append(result)
+        
+        results.sort(key=lambda result: result["match_score"], reverse=True)
+        return results
+    
+    def similarity_matrix(self, names: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Compute the overall similarity of every pair of voice profiles
+        
+        Args:
+            names: Profile names to include (default: all stored profiles)
+            
+        Returns:
+            {"names": [...], "matrix": N×N list of similarities (0-1)}
+        """
+        profiles = self._load_profiles(names)
+        vectors = stack_vectors([profile_vector(profile) for _, profile in profiles])
+        matrix = similarity_matrix(vectors)
+        
+        return {
+            "names": [profile_name for profile_name, _ in profiles],
+            "matrix": [[round(float(value), 3) for value in row] for row in matrix]
+        }
+    
+    def nearest_voices(self, content: str, k: int = 5) -> List[Dict[str, Any]]:
+        """
+        Find the stored voices closest to a piece of content
+        
+        Args:
+            content: Content to route
+            k: Number of voices to return
+            
+        Returns:
+            Top-k voices, best first: {"name", "similarity" (0-1), "details"}
+        """
+        # Content is analyzed once per distinct lexicon set in the index
+        query = {
+            json.dumps(lexicons, sort_keys=True): self._content_vector(content, lexicons)
+            for lexicons in self.index.lexicon_sets()
+        }
+        return self.index.nearest(query, k)
+    
+    def nearest_to_profile(self, name: str, k: int = 5) -> List[Dict[str, Any]]:
+        """
+        Find the stored voices closest to another profile
+        
+        Args:
+            name: Profile name
+            k: Number of voices to return (the profile itself is excluded)
+            
+        Returns:
+            Top-k voices, best first: {"name", "similarity" (0-1), "details"}
+        """
+        profile = self.load_profile(name, STYLE_SECTIONS)
+        
+        if not profile:
+            raise ValueError(f"Profile '{name}' not found")
+        
+        return self.index.nearest(profile_vector(profile), k, exclude=self._get_profile_path(name).stem)
+    
+    def _content_vector(self, content: str, lexicons: Optional[Dict[str, List[str]]] = None):
+        """Analyze content into a feature vector"""
+        analysis = self._get_analyzer(lexicons).analyze_samples([content], "temp")
+        return vectorize_style(analysis.to_dict())
+    
+    def _load_profiles(self, names: Optional[List[str]] = None) -> List[tuple]:
+        """Load (name, profile) pairs for style comparison"""
+        profiles = []
         
+        if names is None:
+            for profile_file in iter_profile_files(self.profiles_dir):
+                try:
+                    profile = get_profile_cache().get(profile_file, STYLE_SECTIONS)
+                except Exception:
+                    # Skip corrupted profiles
+                    continue
+                if profile and "style" in profile:
+                    profiles.append((profile.get("metadata", {}).get("name", profile_file.stem), profile))
+            return profiles
+        
+        for profile_name in names:
+            profile = self.load_profile(profile_name, STYLE_SECTIONS)
+            if not profile:
+                raise ValueError(f"Profile '{profile_name}' not found")
+            profiles.append((profile_name, profile))
+        return profiles
+    
+    def _group_by_lexicons(self, profiles: List[tuple]) -> Dict[str, List[tuple]]:
+        """Group (name, profile) pairs by their custom lexicons"""
+        groups = {}
+        for profile_name, profile in profiles:
+            key = json.dumps(profile.get("lexicons") or {}, sort_keys=True)
+            groups.setdefault(key, []).append((profile_name, profile))
+        return groups
+    
+    def _match_result(self, sections, content_vector=None) -> Dict[str, Any]:
+        """Build a verification result from per-section similarities"""
+        sentence_match, vocab_match, rhetoric_match, tone_match = (float(value) for value in sections)
         overall_match = (sentence_match + vocab_match + rhetoric_match + tone_match) / 4
         
         return {
@@ -276,48 +611,11 @@ class VoiceProfiler:
                 "vocab": vocab_match,
                 "rhetoric": rhetoric_match,
                 "tone": tone_match
-            })
+            }),
+            # Feature vector of the verified content (for drift monitoring)
+            "style_vector": None if content_vector is None else vector_to_dict(content_vector)
         }
     
-    def _compare_dict_values(self, dict1: Dict, dict2: Dict) -> float:
-        """
-        Compare two dictionaries with numeric values
-        Returns similarity score between 0 and 1
-        """
-        common_keys = set(dict1.keys()) & set(dict2.keys())
-        
-        if not common_keys:
-            return 0.0
-        
-        differences = []
-        for key in common_keys:
-            val1 = dict1[key]
-            val2 = dict2[key]
-            
-            # Skip non-numeric values
-            if not isinstance(val1, (int, float)) or not isinstance(val2, (int, float)):
-                continue
-            
-            # Normalize the difference
-            if val1 == 0 and val2 == 0:
-                diff = 0
-            elif val1 == 0 or val2 == 0:
-                diff = 1
-            else:
-                # Calculate relative difference
-                diff = abs(val1 - val2) / max(abs(val1), abs(val2))
-            
-            differences.append(diff)
-        
-        if not differences:
-            return 0.5  # No comparable values
-        
-        # Convert average difference to similarity score
-        avg_diff = sum(differences) / len(differences)
-        similarity = 1 - min(avg_diff, 1)
-        
-        return similarity
-    
     def _get_recommendations(self, overall_match: float, details: Dict[str, float]) -> List[str]:
         """Generate recommendations for improving voice match"""
         recommendations = []
@@ -345,10 +643,32 @@ class VoiceProfiler:
         return recommendations
     
     def _get_profile_path(self, name: str) -> Path:
-        """Get file path for a profile"""
+        """Get file path for a profile (in this profiler's storage format)"""
         # Sanitize name for filename
         safe_name = name.lower().replace(" ", "_").replace("/", "_")
-        return self.profiles_dir / f"{safe_name}.json"
+        return self.profiles_dir / f"{safe_name}{STORAGE_FORMATS[self.storage_format]}"
+    
+    def _profile_paths(self, name: str) -> List[Path]:
+        """Candidate file paths for a profile, compact format first"""
+        stem = self._get_profile_path(name).stem
+        return [self.profiles_dir / f"{stem}{suffix}" for suffix in (VCP_SUFFIX, JSON_SUFFIX)]
+    
+    def _profile_lock(self, name: str):
+        """Exclusive writer lock for one profile (reentrant; readers don't take it)"""
+        stem = self._get_profile_path(name).stem
+        return file_lock(self.profiles_dir / ".index" / "locks" / f"{stem}.lock")
+    
+    def _stored_version(self, name: str) -> Optional[str]:
+        """metadata.version of the stored profile (None if unknown)"""
+        profile = self.load_profile(name, ["metadata"]) or {}
+        return profile.get("metadata", {}).get("version")
+    
+    def _find_profile_path(self, name: str) -> Optional[Path]:
+        """Get the existing file of a profile, whichever format it is stored in"""
+        for profile_path in self._profile_paths(name):
+            if profile_path.exists():
+                return profile_path
+        return None
 
 
 # Example usage
@@ -4,12 +4,22 @@ Workflow Automation - The Real Product
 Input from anywhere → World-class content → Auto-publish
 
 This is the actual value proposition.
+
+Every run is checkpointed to data/runs/<run_id> (see workflow_runs), so a
+failed or interrupted run resumes after its last completed step.
+
+Tuning (environment):
+    VOICECRAFT_STEP_TIMEOUT_<STEP>   Seconds a post-generation step may take (HUMANIZATION,
+                                     SAVING, NOTION, AITABLE, PUBLISHING; 0 = no limit)
 """
 
 import os
+import importlib
 import json
+import time
+from dataclasses import replace
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Callable, Dict, Iterator, Optional, List
 from datetime import datetime
 import re
 
@@ -23,6 +33,49 @@ except ImportError:
 from .content_generator import ContentGenerator, GenerationConfig
 from .humanizer import Humanizer
 from .voice_profiler import VoiceProfiler
+from .workflow_dag import Step, StepSkipped, StepTimeout, WorkflowDAG
+from .workflow_runs import WorkflowRun, get_run_journal, journal_enabled
+
+
+# Seconds each post-generation step may take (None = no limit). Humanization
+# is an LLM call already bounded by the gateway's own timeouts and retries.
+DEFAULT_STEP_TIMEOUTS: Dict[str, Optional[float]] = {
+    "humanization": None,
+    "saving": 10.0,
+    "notion": 30.0,
+    "aitable": 30.0,
+    "publishing": 60.0
+}
+
+
+def step_timeout(step: str, overrides: Optional[Dict[str, Optional[float]]] = None) -> Optional[float]:
+    """Timeout of a workflow step: explicit override, then environment, then default"""
+    if overrides and step in overrides:
+        return overrides[step]
+    value = os.getenv(f"VOICECRAFT_STEP_TIMEOUT_{step.upper()}")
+    if value is not None:
+        return float(value) or None
+    return DEFAULT_STEP_TIMEOUTS.get(step)
+
+
+def _timed_step(step: str, start: float, started_at: str, **fields) -> Dict:
+    """A timeline entry for a step run inline (started at time.monotonic() == start)"""
+    return {
+        "step": step,
+        "status": "complete",
+        "started_at": started_at,
+        "finished_at": datetime.now().isoformat(),
+        "duration": round(time.monotonic() - start, 3),
+        **fields
+    }
+
+
+# Progress listener: on_step(step, status), e.g. ("generation", "running")
+StepListener = Callable[[str, str], None]
+
+
+def _ignore_step(step: str, status: str):
+    pass
 
 
 class ContentWorkflow:
@@ -36,9 +89,11 @@ class ContentWorkflow:
         self,
         profile_name: str,
         openai_api_key: Optional[str] = None,
-        anthropic_api_key: Optional[str] = None
+        anthropic_api_key: Optional[str] = None,
+        step_timeouts: Optional[Dict[str, Optional[float]]] = None
     ):
         self.profile_name = profile_name
+        self.step_timeouts = step_timeouts or {}
         self.generator = ContentGenerator(
             openai_api_key=openai_api_key,
             anthropic_api_key=anthropic_api_key
@@ -51,7 +106,7 @@ class ContentWorkflow:
         if not self.voice_profile:
             print(f"⚠️  Warning: Profile '{profile_name}' not found. Using empty profile.")
             print(f"   Profile path: {self.profiler._get_profile_path(profile_name)}")
-            print(f"   Available profiles: {[p.stem for p in self.profiler.profiles_dir.glob('*.json')]}")
+            print(f"   Available profiles: {[p['name'] for p in self.profiler.list_profiles()]}")
             self.voice_profile = {}  # Use empty profile instead of failing
     
     def process_input(
@@ -64,7 +119,9 @@ class ContentWorkflow:
         auto_humanize: bool = True,
         auto_publish: bool = False,
         publish_config: Optional[Dict] = None,
-        auto_yes: bool = True  # Skip all prompts by default
+        auto_yes: bool = True,  # Skip all prompts by default
+        on_step: Optional[StepListener] = None,
+        run_id: Optional[str] = None
     ) -> Dict:
         """
         Process input from anywhere and create world-class content.
@@ -78,10 +135,169 @@ class ContentWorkflow:
             auto_humanize: Automatically humanize the output
             auto_publish: Automatically publish to configured destination
             publish_config: Publishing configuration (GitHub, WordPress, etc.)
+            on_step: Progress listener, called as on_step(step, status) when steps start and finish
+            run_id: Resume this run from its last completed step (or start it under this id)
             
         Returns:
-            Complete workflow result with all steps
+            Complete workflow result; "steps" is the timeline of every step
+            (status, started_at, finished_at, duration in seconds)
+        """
+        report = on_step or _ignore_step
+        run = self._open_run(run_id, {
+            "input_text": input_text,
+            "input_type": input_type,
+            "output_format": output_format,
+            "target_length": target_length,
+            "style_influences": style_influences,
+            "auto_humanize": auto_humanize,
+            "auto_publish": auto_publish,
+            "publish_config": publish_config
+        })
+        try:
+            workflow_result, content_brief = self._start_workflow(
+                input_text, input_type, output_format, auto_yes, report, run
+            )
+            
+            # Step 2: Generate content (unless an earlier attempt of this run did)
+            generation_result = run.checkpoints.get("generation")
+            generation_started = None
+            if generation_result is None:
+                if not auto_yes:
+                    print(f"✍️  Generating {workflow_result['output_format']}...")
+                report("generation", "running")
+                generation_started = (time.monotonic(), datetime.now().isoformat())
+                
+                generation_result = self.generator.generate(
+                    content_brief=content_brief,
+                    voice_profile=self.voice_profile,
+                    style_influences=style_influences,
+                    config=GenerationConfig(format=workflow_result["output_format"], target_length=target_length),
+                    model="claude-haiku-4-5-20251001"
+                )
+                run.checkpoint("generation", generation_result)
+            
+            workflow_result = self._finish_workflow(
+                workflow_result, generation_result, auto_humanize, auto_publish, publish_config, auto_yes, report,
+                generation_started, run
+            )
+        except BaseException as e:
+            run.finish("failed", str(e) or type(e).__name__)
+            raise
+        
+        run.finish("complete")
+        return workflow_result
+    
+    def process_input_stream(
+        self,
+        input_text: str,
+        input_type: Optional[str] = None,
+        output_format: Optional[str] = None,
+        target_length: int = 1200,
+        style_influences: Optional[List[tuple]] = None,
+        auto_humanize: bool = True,
+        auto_publish: bool = False,
+        publish_config: Optional[Dict] = None,
+        on_step: Optional[StepListener] = None,
+        run_id: Optional[str] = None
+    ) -> Iterator[Dict]:
+        """
+        Run the workflow, streaming the generation stage as it happens.
+        
+        Same arguments as process_input (prompts are always skipped).
+        
+        Yields events:
+            {"event": "start", "data": {"input_type", "output_format"}}
+            {"event": "chunk", "data": {"text"}}            (many)
+            {"event": "generated", "data": {"content", "metadata"}}
+            {"event": "complete", "data": <process_input result>}
         """
+        report = on_step or _ignore_step
+        run = self._open_run(run_id, {
+            "input_text": input_text,
+            "input_type": input_type,
+            "output_format": output_format,
+            "target_length": target_length,
+            "style_influences": style_influences,
+            "auto_humanize": auto_humanize,
+            "auto_publish": auto_publish,
+            "publish_config": publish_config
+        })
+        try:
+            workflow_result, content_brief = self._start_workflow(
+                input_text, input_type, output_format, True, report, run
+            )
+            yield {
+                "event": "start",
+                "data": {"input_type": workflow_result["input_type"], "output_format": workflow_result["output_format"]}
+            }
+            
+            # Step 2: Generate content, chunk by chunk (a resumed run replays its draft as one chunk)
+            generation_result = run.checkpoints.get("generation")
+            generation_started = None
+            if generation_result is None:
+                report("generation", "running")
+                generation_started = (time.monotonic(), datetime.now().isoformat())
+                stream = self.generator.generate_stream(
+                    content_brief=content_brief,
+                    voice_profile=self.voice_profile,
+                    style_influences=style_influences,
+                    config=GenerationConfig(format=workflow_result["output_format"], target_length=target_length),
+                    model="claude-haiku-4-5-20251001"
+                )
+                for chunk in stream:
+                    yield {"event": "chunk", "data": {"text": chunk}}
+                generation_result = stream.result
+                run.checkpoint("generation", generation_result)
+            else:
+                yield {"event": "chunk", "data": {"text": generation_result["content"]}}
+            
+            yield {
+                "event": "generated",
+                "data": {"content": generation_result["content"], "metadata": generation_result["metadata"]}
+            }
+            
+            # Post-processing follows as one trailing event
+            workflow_result = self._finish_workflow(
+                workflow_result, generation_result, auto_humanize, auto_publish, publish_config, True, report,
+                generation_started, run
+            )
+        except BaseException as e:
+            # Includes the consumer going away mid-stream (GeneratorExit)
+            run.finish("failed", str(e) or type(e).__name__)
+            raise
+        
+        run.finish("complete")
+        yield {"event": "complete", "data": workflow_result}
+    
+    def _open_run(self, run_id: Optional[str], params: Dict) -> WorkflowRun:
+        """The run's checkpoint journal: resumed if run_id exists, in memory only if journaling is off"""
+        if run_id is None and not journal_enabled():
+            return WorkflowRun()
+        return get_run_journal().start(self.profile_name, params, run_id)
+    
+    def _start_workflow(
+        self,
+        input_text: str,
+        input_type: Optional[str],
+        output_format: Optional[str],
+        auto_yes: bool,
+        report: StepListener = _ignore_step,
+        run: Optional[WorkflowRun] = None
+    ) -> tuple:
+        """Detect input/output types and process the input (returns workflow_result, content_brief)"""
+        run = run or WorkflowRun()
+        restored = run.checkpoints.get("input_processing")
+        if restored:
+            workflow_result = {
+                "input": input_text,
+                "input_type": restored["input_type"],
+                "output_format": restored["output_format"],
+                "timestamp": datetime.now().isoformat(),
+                "run_id": run.run_id,
+                "steps": [{"step": "input_processing", "status": "restored", "result": restored["content_brief"]}]
+            }
+            report("input_processing", "restored")
+            return workflow_result, restored["content_brief"]
         
         # Auto-detect input type if not specified
         if input_type is None:
@@ -96,12 +312,14 @@ class ContentWorkflow:
             "input_type": input_type,
             "output_format": output_format,
             "timestamp": datetime.now().isoformat(),
+            "run_id": run.run_id,
             "steps": []
         }
         
         # Step 1: Process input based on type
         if not auto_yes:
             print(f"📥 Processing {input_type}...")
+        start, started_at = time.monotonic(), datetime.now().isoformat()
         
         if input_type == "voice_note":
             content_brief = self._process_voice_note(input_text)
@@ -112,121 +330,168 @@ class ContentWorkflow:
         else:  # topic
             content_brief = input_text
         
-        workflow_result["steps"].append({
-            "step": "input_processing",
-            "result": content_brief,
-            "status": "complete"
+        workflow_result["steps"].append(_timed_step("input_processing", start, started_at, result=content_brief))
+        run.checkpoint("input_processing", {
+            "input_type": input_type,
+            "output_format": output_format,
+            "content_brief": content_brief
         })
+        report("input_processing", "complete")
         
-        # Step 2: Generate content
-        if not auto_yes:
-            print(f"✍️  Generating {output_format}...")
+        return workflow_result, content_brief
+    
+    def _finish_workflow(
+        self,
+        workflow_result: Dict,
+        generation_result: Dict,
+        auto_humanize: bool,
+        auto_publish: bool,
+        publish_config: Optional[Dict],
+        auto_yes: bool,
+        report: StepListener = _ignore_step,
+        generation_started: Optional[tuple] = None,
+        run: Optional[WorkflowRun] = None
+    ) -> Dict:
+        """
+        Humanize, save, sync integrations and publish generated content
+        
+        Saving, Notion, AITable and publishing only need the final content, so
+        they run concurrently once humanization is done, each within its own
+        timeout. Notion and AITable are best-effort: their failures are
+        recorded in the timeline but don't fail the workflow.
+        
+        Each completed step is checkpointed to the run; steps an earlier
+        attempt completed are restored, not repeated (no duplicate pages or
+        posts). A step that timed out writes, syncs, publishes and
+        checkpoints nothing more, even though its thread runs on.
+        generation_started=None means the draft was restored.
+        """
+        run = run or WorkflowRun()
+        input_text = workflow_result["input"]
+        output_format = workflow_result["output_format"]
         
-        config = GenerationConfig(
-            format=output_format,
-            target_length=target_length
-        )
+        if generation_started is None:
+            workflow_result["steps"].append({
+                "step": "generation",
+                "status": "restored",
+                "result": generation_result["content"],
+                "metadata": generation_result["metadata"]
+            })
+            report("generation", "restored")
+        else:
+            workflow_result["steps"].append(_timed_step(
+                "generation", *generation_started,
+                result=generation_result["content"],
+                metadata=generation_result["metadata"]
+            ))
+            report("generation", "complete")
         
-        generation_result = self.generator.generate(
-            content_brief=content_brief,
-            voice_profile=self.voice_profile,
-            style_influences=style_influences,
-            config=config,
-            model="claude-haiku-4-5-20251001"
-        )
+        title = generation_result.get("metadata", {}).get("title", "Untitled Article")
         
-        workflow_result["steps"].append({
-            "step": "generation",
-            "result": generation_result["content"],
-            "metadata": generation_result["metadata"],
-            "status": "complete"
-        })
+        def final_content(results):
+            return results.get("humanization", generation_result["content"])
         
-        content = generation_result["content"]
+        def proceed(name, cancelled):
+            # Checked before anything with lasting effects: a timed-out step must not act late
+            if cancelled.is_set():
+                raise StepTimeout(f"Step '{name}' timed out")
         
-        # Step 3: Humanize (if enabled)
-        if auto_humanize:
+        def humanize(results, cancelled):
             if not auto_yes:
                 print("🎨 Humanizing content...")
-            
-            humanize_result = self.humanizer.humanize(
-                text=content,
+            return self.humanizer.humanize(
+                text=generation_result["content"],
                 show_analysis=False,
                 model="claude-haiku-4-5-20251001"
-            )
-            
-            content = humanize_result["humanized"]
-            
-            workflow_result["steps"].append({
-                "step": "humanization",
-                "result": content,
-                "status": "complete"
-            })
-        
-        # Step 4: Save output
-        output_path = self._save_output(content, output_format)
-        workflow_result["output_path"] = str(output_path)
-        
-        # Step 4.5: Save to Notion (if configured)
-        try:
-            from integrations.notion_integration import save_to_notion
-            notion_result = save_to_notion(
-                title=generation_result.get("metadata", {}).get("title", "Untitled Article"),
-                topic=input_text[:100],  # First 100 chars of input
-                content=content,
-                status="Draft",
-                word_count=len(content.split()),
-                platform=output_format.title()
-            )
-            if notion_result and notion_result.get("id"):
-                workflow_result["notion_page_id"] = notion_result.get("id")
-                if not auto_yes:
-                    print("📝 Saved to Notion")
-        except ImportError:
-            pass  # Notion integration not available
-        except Exception as e:
-            if not auto_yes:
-                print(f"⚠️  Notion save skipped: {e}")
-        
-        # Step 4.6: Save to AITable (if configured) - legacy support
-        try:
-            from integrations.aitable_integration import save_to_aitable
-            aitable_result = save_to_aitable(
-                title=generation_result.get("metadata", {}).get("title", "Untitled Article"),
-                topic=input_text[:100],
-                content=content,
-                status="Draft",
-                word_count=len(content.split()),
-                platform=output_format.title()
-            )
-            if aitable_result and aitable_result.get("id"):
-                workflow_result["aitable_record_id"] = aitable_result.get("id")
+            )["humanized"]
+        
+        def save(results, cancelled):
+            proceed("saving", cancelled)
+            return str(self._save_output(final_content(results), output_format))
+        
+        def save_to_integration(label, module, function):
+            def run(results, cancelled):
+                try:
+                    save_record = getattr(importlib.import_module(f"integrations.{module}"), function)
+                except ImportError:
+                    raise StepSkipped(f"{label} integration not available")
+                content = final_content(results)
+                proceed(label.lower(), cancelled)
+                record = save_record(
+                    title=title,
+                    topic=input_text[:100],  # First 100 chars of input
+                    content=content,
+                    status="Draft",
+                    word_count=len(content.split()),
+                    platform=output_format.title()
+                )
+                if not (record and record.get("id")):
+                    raise StepSkipped(f"{label} not configured")
                 if not auto_yes:
-                    print("📊 Saved to AITable")
-        except (ImportError, ValueError):
-            pass  # AITable integration not available
-        except Exception as e:
-            if not auto_yes:
-                print(f"⚠️  AITable save skipped: {e}")
+                    print(f"📝 Saved to {label}")
+                return record["id"]
+            return run
         
-        # Step 5: Auto-publish (if enabled)
-        if auto_publish and publish_config:
+        def publish(results, cancelled):
             if not auto_yes:
                 print("🚀 Publishing...")
-            
-            publish_result = self._publish(
-                content=content,
+            proceed("publishing", cancelled)
+            published = self._publish(
+                content=final_content(results),
                 config=publish_config,
                 format=output_format
             )
-            
-            workflow_result["steps"].append({
-                "step": "publishing",
-                "result": publish_result,
-                "status": "complete" if publish_result.get("success") else "failed"
-            })
+            if not published.get("success"):
+                raise RuntimeError(published.get("error", "Publishing failed"))
+            return published
+        
+        after = ("humanization",) if auto_humanize else ()
+        steps = [Step("humanization", humanize, timeout=step_timeout("humanization", self.step_timeouts))] if auto_humanize else []
+        steps += [
+            Step("saving", save, after, step_timeout("saving", self.step_timeouts)),
+            Step("notion", save_to_integration("Notion", "notion_integration", "save_to_notion"),
+                 after, step_timeout("notion", self.step_timeouts), optional=True),
+            Step("aitable", save_to_integration("AITable", "aitable_integration", "save_to_aitable"),
+                 after, step_timeout("aitable", self.step_timeouts), optional=True)
+        ]
+        if auto_publish and publish_config:
+            steps.append(Step("publishing", publish, after, step_timeout("publishing", self.step_timeouts), optional=True))
+        
+        def checkpointed(step):
+            def run_step(results, cancelled):
+                output = step.run(results, cancelled)
+                proceed(step.name, cancelled)
+                run.checkpoint(step.name, output)
+                return output
+            return replace(step, run=run_step, cancellable=True)
+        
+        restored = {step.name: run.checkpoints[step.name] for step in steps if step.name in run.checkpoints}
+        results, timeline = WorkflowDAG([checkpointed(step) for step in steps]).run(restored, on_step=report)
+        
+        # Only the step's returned result: a timed-out publish thread can't change it later
+        publish_result = dict(results.get("publishing") or {})
+        for entry in timeline:
+            if entry["step"] == "publishing" and entry["status"] not in ("complete", "restored"):
+                publish_result = {"success": False, "error": entry.get("error", "Publishing failed")}
+        
+        for entry in timeline:
+            if entry["step"] == "humanization" and "humanization" in results:
+                entry["result"] = results["humanization"]
+            elif entry["step"] == "publishing":
+                entry["result"] = publish_result
+            elif entry["status"] != "complete" and not auto_yes:
+                print(f"⚠️  {entry['step'].title()} skipped: {entry.get('error')}")
+        workflow_result["steps"].extend(timeline)
+        
+        workflow_result["output_path"] = results["saving"]
+        if "notion" in results:
+            workflow_result["notion_page_id"] = results["notion"]
+        if "aitable" in results:
+            workflow_result["aitable_record_id"] = results["aitable"]
+        if auto_publish and publish_config:
+            workflow_result["publish_result"] = publish_result
         
-        workflow_result["final_content"] = content
+        workflow_result["final_content"] = final_content(results)
         workflow_result["status"] = "complete"
         
         if not auto_yes:
@@ -0,0 +1,241 @@
+"""
+Workflow DAG - Run workflow steps by their dependencies
+
+This module handles:
+- Declaring steps with dependencies, per-step timeouts and optional (best-effort) steps
+- Signalling timed-out steps to stop before they act (threads can't be killed)
+- Running every step as soon as its dependencies finished, independent steps concurrently
+- Skipping steps whose dependencies failed (or that report nothing to do)
+- Recording a timeline with start/finish times and durations per step
+"""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+DEFAULT_MAX_WORKERS = 4
+
+
+class StepTimeout(TimeoutError):
+    """A step ran longer than its timeout"""
+
+
+class StepSkipped(Exception):
+    """Raised by a step with nothing to do (e.g. an integration that isn't configured)"""
+
+
+@dataclass
+class Step:
+    """
+    One unit of work; run(results) receives the results of finished steps by name
+
+    A step that exceeds its timeout is recorded as "timeout" and its result is
+    ignored, but its thread can't be stopped and keeps running. Cancellable
+    steps are called as run(results, cancelled) instead: the threading.Event
+    is set when the step times out (or the run ends without it), and the step
+    must check it before anything with lasting effects (checkpoints, writes,
+    publishing) so a timed-out step doesn't act after its deadline.
+    """
+    name: str
+    run: Callable[..., Any]
+    depends_on: Tuple[str, ...] = ()
+    timeout: Optional[float] = None     # seconds; None = no limit
+    optional: bool = False              # failures are recorded but don't fail the run
+    cancellable: bool = False           # run(results, cancelled) gets a cancellation Event
+
+
+class WorkflowDAG:
+    """A validated set of steps, run with bounded concurrency"""
+
+    def __init__(self, steps: List[Step], max_workers: int = DEFAULT_MAX_WORKERS):
+        """
+        Args:
+            steps: Steps in declaration order (the timeline keeps this order)
+            max_workers: Steps run at once
+
+        Raises:
+            ValueError: Duplicate names, unknown dependencies or a cycle
+        """
+        self.steps = {step.name: step for step in steps}
+        self.order = [step.name for step in steps]
+        self.max_workers = max_workers
+
+        if len(self.steps) != len(steps):
+            raise ValueError("Duplicate step names")
+        for step in steps:
+            unknown = set(step.depends_on) - set(self.steps)
+            if unknown:
+                raise ValueError(f"Step '{step.name}' depends on unknown steps: {sorted(unknown)}")
+        self._check_acyclic()
+
+    def run(
+        self,
+        results: Optional[Dict[str, Any]] = None,
+        on_step: Optional[Callable[[str, str], None]] = None
+    ) -> Tuple[Dict[str, Any], List[Dict]]:
+        """
+        Run every step
+
+        Args:
+            results: Results already available to steps (e.g. from earlier
+                     stages). Steps whose name is a key here are restored
+                     (e.g. from a checkpoint) instead of run again.
+            on_step: Progress listener, called as on_step(name, status)
+
+        Returns:
+            (results by step name, timeline). Timeline entries hold step,
+            status ("complete", "restored", "failed", "timeout" or "skipped"),
+            started_at, finished_at, duration (seconds) and error.
+
+        Raises:
+            The first error of a required step, after the timeline is complete
+        """
+        results = dict(results or {})
+        report = on_step or (lambda name, status: None)
+        entries: Dict[str, Dict] = {}
+        failed: set = set()
+        first_error: Optional[BaseException] = None
+        for name in self.order:
+            if name in results:
+                entries[name] = self._entry(name, "restored")
+                report(name, "restored")
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="step")
+        running: Dict[Any, Tuple[str, float, str, threading.Event]] = {}   # future -> (name, start, started_at, cancelled)
+        try:
+            while len(entries) < len(self.steps):
+                # Start or skip every step whose dependencies are settled
+                for name in self.order:
+                    if name in entries or any(future_name == name for future_name, *_ in running.values()):
+                        continue
+                    step = self.steps[name]
+                    if any(dependency in failed for dependency in step.depends_on):
+                        entries[name] = self._entry(name, "skipped", error="A dependency failed")
+                        failed.add(name)
+                        report(name, "skipped")
+                    elif all(dependency in entries for dependency in step.depends_on):
+                        report(name, "running")
+                        snapshot = dict(results)
+                        cancelled = threading.Event()
+                        if step.cancellable:
+                            future = executor.submit(step.run, snapshot, cancelled)
+                        else:
+                            future = executor.submit(step.run, snapshot)
+                        running[future] = (name, time.monotonic(), datetime.now().isoformat(), cancelled)
+
+                if not running:
+                    continue
+
+                done, _ = wait(running, timeout=self._next_deadline(running), return_when=FIRST_COMPLETED)
+                now = time.monotonic()
+                for future, (name, start, started_at, cancelled) in list(running.items()):
+                    step = self.steps[name]
+                    timed_out = step.timeout is not None and now - start >= step.timeout
+                    if future not in done and not timed_out:
+                        continue
+                    del running[future]
+
+                    error = reason = None
+                    if future in done:
+                        try:
+                            results[name] = future.result()
+                            status = "complete"
+                        except StepSkipped as e:
+                            reason, status = str(e), "skipped"
+                        except Exception as e:
+                            error, status = e, "failed"
+                    else:
+                        # The thread can't be stopped: its result is ignored and it is told to stop acting
+                        cancelled.set()
+                        future.cancel()
+                        error, status = StepTimeout(f"Step '{name}' timed out after {step.timeout}s"), "timeout"
+
+                    entries[name] = self._entry(
+                        name, status, started_at=started_at, duration=now - start,
+                        error=str(error) if error else reason
+                    )
+                    report(name, status)
+                    if error is not None:
+                        failed.add(name)
+                        if not step.optional and first_error is None:
+                            first_error = error
+        finally:
+            for _, _, _, cancelled in running.values():
+                cancelled.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        timeline = [entries[name] for name in self.order]
+        if first_error is not None:
+            raise first_error
+        return results, timeline
+
+    def _next_deadline(self, running: Dict) -> Optional[float]:
+        """Seconds until the earliest running step times out (None if none can)"""
+        now = time.monotonic()
+        deadlines = [
+            start + self.steps[name].timeout - now
+            for name, start, *_ in running.values()
+            if self.steps[name].timeout is not None
+        ]
+        return max(0.0, min(deadlines)) if deadlines else None
+
+    @staticmethod
+    def _entry(
+        name: str,
+        status: str,
+        started_at: Optional[str] = None,
+        duration: float = 0.0,
+        error: Optional[str] = None
+    ) -> Dict:
+        entry = {
+            "step": name,
+            "status": status,
+            "started_at": started_at,
+            "finished_at": datetime.now().isoformat() if started_at else None,
+            "duration": round(duration, 3)
+        }
+        if error:
+            entry["error"] = error
+        return entry
+
+    def _check_acyclic(self):
+        visiting, visited = set(), set()
+
+        def visit(name):
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle through step '{name}'")
+            visiting.add(name)
+            for dependency in self.steps[name].depends_on:
+                visit(dependency)
+            visiting.discard(name)
+            visited.add(name)
+
+        for name in self.order:
+            visit(name)
+
+
+if __name__ == "__main__":
+    # Example: one source feeding three independent sinks, one of them hanging
+    def sink(seconds):
+        def run(results):
+            time.sleep(seconds)
+            return f"stored {results['draft']}"
+        return run
+
+    dag = WorkflowDAG([
+        Step("draft", lambda results: "draft text"),
+        Step("disk", sink(0.1), depends_on=("draft",)),
+        Step("notion", sink(0.2), depends_on=("draft",), optional=True),
+        Step("slow_cms", sink(5), depends_on=("draft",), timeout=0.3, optional=True),
+    ])
+    start = time.perf_counter()
+    results, timeline = dag.run()
+    print(f"Finished in {time.perf_counter() - start:.2f}s")
+    for entry in timeline:
+        print(f"  {entry['step']:10} {entry['status']:8} {entry['duration']}s {entry.get('error', '')}")
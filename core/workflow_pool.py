@@ -0,0 +1,140 @@
+"""
+Workflow Pool - Warmed ContentWorkflow instances per voice profile
+
+This module handles:
+- Reusing one ContentWorkflow per profile across requests and threads
+- Rebuilding a workflow when its profile or humanizer prompt changes on disk
+- Building each profile's workflow once, even under concurrent requests
+- Evicting least recently used profiles beyond a size limit
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+from .humanizer import humanizer_prompt_path
+from .voice_profiler import VoiceProfiler
+from .workflow_automation import ContentWorkflow
+
+
+DEFAULT_MAX_PROFILES = 16
+
+
+def _file_signature(path) -> Optional[Tuple[int, int, int]]:
+    """(mtime, size, inode) of a file, None if it doesn't exist"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+class WorkflowPool:
+    """Process-wide registry of ready-to-use workflows keyed by profile name"""
+
+    def __init__(
+        self,
+        max_profiles: int = DEFAULT_MAX_PROFILES,
+        factory: Callable[[str], ContentWorkflow] = ContentWorkflow
+    ):
+        """
+        Args:
+            max_profiles: Workflows kept before least recently used ones are dropped
+            factory: Builds the workflow of a profile name
+        """
+        self.max_profiles = max_profiles
+        self.factory = factory
+        self.profiler = VoiceProfiler()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._entries: "OrderedDict[str, Tuple[ContentWorkflow, Tuple]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._build_locks: Dict[str, threading.Lock] = {}
+
+    def get(self, profile_name: str) -> ContentWorkflow:
+        """
+        The workflow of a profile, built on first use
+
+        A workflow is rebuilt when its profile file or humanizer prompt was
+        created, replaced or removed since it was built.
+        """
+        signature = self._signature(profile_name)
+        with self._lock:
+            entry = self._entries.get(profile_name)
+            if entry and entry[1] == signature:
+                self._entries.move_to_end(profile_name)
+                self.hits += 1
+                return entry[0]
+            build_lock = self._build_locks.setdefault(profile_name, threading.Lock())
+
+        with build_lock:
+            # Another request may have built it while we waited
+            signature = self._signature(profile_name)
+            with self._lock:
+                entry = self._entries.get(profile_name)
+                if entry and entry[1] == signature:
+                    self.hits += 1
+                    return entry[0]
+                self.misses += 1
+                if entry:
+                    self.invalidations += 1
+
+            # Signature taken before building: a change mid-build triggers another rebuild
+            workflow = self.factory(profile_name)
+
+            with self._lock:
+                self._entries[profile_name] = (workflow, signature)
+                self._entries.move_to_end(profile_name)
+                while len(self._entries) > self.max_profiles:
+                    evicted, _ = self._entries.popitem(last=False)
+                    self._build_locks.pop(evicted, None)
+            return workflow
+
+    def invalidate(self, profile_name: Optional[str] = None):
+        """Drop one profile's workflow (or all of them)"""
+        with self._lock:
+            if profile_name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(profile_name, None)
+
+    def stats(self) -> Dict:
+        """Hit/miss statistics and pooled profiles"""
+        with self._lock:
+            return {
+                "profiles": list(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "max_profiles": self.max_profiles
+            }
+
+    def _signature(self, profile_name: str) -> Tuple:
+        """Files a workflow depends on: profile (either format) and humanizer prompt"""
+        paths = self.profiler._profile_paths(profile_name) + [humanizer_prompt_path(profile_name)]
+        return tuple(_file_signature(path) for path in paths)
+
+
+# Global instance
+_workflow_pool = None
+
+def get_workflow_pool() -> WorkflowPool:
+    """Get the process-wide workflow pool"""
+    global _workflow_pool
+    if _workflow_pool is None:
+        _workflow_pool = WorkflowPool(int(os.getenv('VOICECRAFT_WORKFLOW_POOL_SIZE', DEFAULT_MAX_PROFILES)))
+    return _workflow_pool
+
+
+if __name__ == "__main__":
+    import time
+
+    # Example: the second request reuses the first one's workflow
+    pool = get_workflow_pool()
+    for _ in range(2):
+        start = time.perf_counter()
+        pool.get("Max Bernstein")
+        print(f"Workflow ready in {(time.perf_counter() - start) * 1000:.1f} ms")
+    print(pool.stats())
@@ -0,0 +1,260 @@
+"""
+Workflow Runs - Checkpoint journal for resumable content workflows
+
+This module handles:
+- Giving every workflow run an id and a directory under data/runs/<run_id>
+- Persisting each completed step's output (brief, draft, humanized text, sink results)
+- Reporting failed and interrupted runs
+- Resuming a run from its last completed step
+
+Tuning (environment):
+    VOICECRAFT_RUNS_PATH         Journal directory (default ./data/runs)
+    VOICECRAFT_RUN_JOURNAL       "0" disables checkpointing of new runs
+"""
+
+import json
+import os
+import re
+import threading
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from .atomic_io import atomic_write
+from .process_owner import owner_alive, owner_id
+
+
+RUN_STATUSES = ("running", "complete", "failed", "interrupted")
+
+# Publish settings never written to disk (resumed runs read them from the environment)
+SECRET_KEYS = ("github_token", "password", "app_password")
+
+_RUN_ID = re.compile(r"^[\w.-]+$")
+
+
+def public_params(params: Dict) -> Dict:
+    """Workflow arguments without the SECRET_KEYS of publish_config, safe to store"""
+    params = dict(params)
+    if params.get("publish_config"):
+        params["publish_config"] = {
+            key: value for key, value in params["publish_config"].items() if key not in SECRET_KEYS
+        }
+    return params
+
+
+def new_run_id() -> str:
+    """A sortable, readable run id, e.g. 20250101-093000-1a2b3c"""
+    return f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+
+
+class WorkflowRun:
+    """
+    One run's checkpoints; safe to update from concurrent steps
+
+    A run without a journal (journaling disabled) keeps checkpoints in memory only.
+    """
+
+    def __init__(
+        self,
+        journal: Optional["RunJournal"] = None,
+        run_id: Optional[str] = None,
+        meta: Optional[Dict] = None,
+        checkpoints: Optional[Dict[str, Any]] = None
+    ):
+        self.journal = journal
+        self.run_id = run_id
+        self.meta = meta or {}
+        self.checkpoints = checkpoints or {}
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        return self.journal.run_path(self.run_id)
+
+    def checkpoint(self, step: str, output: Any):
+        """Persist a completed step's output"""
+        if self.journal is not None:
+            data = {"step": step, "saved_at": datetime.now().isoformat(), "output": output}
+            atomic_write(self.path / f"{step}.json", json.dumps(data, default=str).encode("utf-8"))
+        with self._lock:
+            self.checkpoints[step] = output
+
+    def finish(self, status: str, error: Optional[str] = None):
+        """Record the run's outcome ("complete" or "failed")"""
+        if self.journal is None:
+            return
+        with self._lock:
+            self.meta.update(status=status, error=error, updated_at=datetime.now().isoformat())
+            self.journal._write_meta(self.run_id, self.meta)
+
+
+class RunJournal:
+    """Directory of workflow runs, one subdirectory per run"""
+
+    def __init__(self, root: Union[str, Path] = "./data/runs"):
+        """
+        Args:
+            root: Directory holding the runs
+        """
+        self.root = Path(root)
+
+    def run_path(self, run_id: str) -> Path:
+        if not _RUN_ID.match(run_id):
+            raise ValueError(f"Invalid run id: {run_id}")
+        return self.root / run_id
+
+    def start(self, profile_name: str, params: Dict, run_id: Optional[str] = None) -> WorkflowRun:
+        """
+        Open a run: resume an existing one or create it
+
+        Args:
+            profile_name: Voice profile of the workflow
+            params: process_input arguments (secrets are dropped before saving)
+            run_id: Id of the run to resume or create (default: a new id)
+
+        Returns:
+            The run, with the checkpoints of steps that already completed
+        """
+        run_id = run_id or new_run_id()
+        path = self.run_path(run_id)
+        now = datetime.now().isoformat()
+
+        meta = self._read_meta(run_id)
+        if meta is None:
+            path.mkdir(parents=True, exist_ok=True)
+            meta = {
+                "run_id": run_id,
+                "profile_name": profile_name,
+                "params": public_params(params),
+                "created_at": now,
+                "attempts": 0
+            }
+        meta.update(status="running", owner=owner_id(), error=None, updated_at=now, attempts=meta["attempts"] + 1)
+        self._write_meta(run_id, meta)
+        return WorkflowRun(self, run_id, meta, self._read_checkpoints(path))
+
+    def get(self, run_id: str) -> Optional[Dict]:
+        """A run's details and checkpoints (None if unknown)"""
+        meta = self._read_meta(run_id)
+        if meta is None:
+            return None
+        return {**self._summary(meta), "checkpoints": self._read_checkpoints(self.run_path(run_id))}
+
+    def list(self, status: Optional[str] = None, limit: int = 20) -> List[Dict]:
+        """
+        Most recent runs first
+
+        Args:
+            status: Only runs with this status (see RUN_STATUSES)
+            limit: Maximum runs returned
+
+        Returns:
+            Run summaries (run_id, profile_name, status, steps, error, ...)
+        """
+        if not self.root.exists():
+            return []
+        runs = []
+        for path in sorted(self.root.iterdir(), reverse=True):
+            meta = self._read_meta(path.name) if path.is_dir() and _RUN_ID.match(path.name) else None
+            if meta is None:
+                continue
+            summary = self._summary(meta)
+            if status is None or summary["status"] == status:
+                runs.append(summary)
+            if len(runs) >= limit:
+                break
+        return runs
+
+    def _summary(self, meta: Dict) -> Dict:
+        status = meta["status"]
+        if status == "running" and not owner_alive(meta.get("owner")):
+            status = "interrupted"
+        return {
+            **{key: value for key, value in meta.items() if key != "owner"},
+            "status": status,
+            "steps": sorted(
+                path.stem for path in self.run_path(meta["run_id"]).glob("*.json") if path.name != "run.json"
+            )
+        }
+
+    def _read_meta(self, run_id: str) -> Optional[Dict]:
+        try:
+            with open(self.run_path(run_id) / "run.json", 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_meta(self, run_id: str, meta: Dict):
+        atomic_write(self.run_path(run_id) / "run.json", json.dumps(meta, indent=2, default=str).encode("utf-8"))
+
+    @staticmethod
+    def _read_checkpoints(path: Path) -> Dict[str, Any]:
+        checkpoints = {}
+        for checkpoint_path in path.glob("*.json"):
+            if checkpoint_path.name == "run.json":
+                continue
+            try:
+                with open(checkpoint_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                continue    # Unreadable checkpoint: the step simply runs again
+            checkpoints[data["step"]] = data["output"]
+        return checkpoints
+
+
+def resume_run(
+    run_id: str,
+    workflow_factory: Optional[Callable] = None,
+    on_step: Optional[Callable[[str, str], None]] = None
+) -> Dict:
+    """
+    Continue a failed or interrupted run from its last completed step
+
+    Args:
+        run_id: Run to resume
+        workflow_factory: Builds the workflow of a profile (default: the workflow pool)
+        on_step: Progress listener, as for process_input
+
+    Returns:
+        The workflow result (completed runs are rebuilt from their checkpoints)
+
+    Raises:
+        KeyError: Unknown run
+    """
+    run = get_run_journal().get(run_id)
+    if run is None:
+        raise KeyError(f"Run not found: {run_id}")
+    if workflow_factory is None:
+        from .workflow_pool import get_workflow_pool
+        workflow_factory = get_workflow_pool().get
+
+    params = dict(run["params"])
+    if params.get("style_influences"):
+        params["style_influences"] = [tuple(influence) for influence in params["style_influences"]]
+    workflow = workflow_factory(run["profile_name"])
+    return workflow.process_input(**params, auto_yes=True, on_step=on_step, run_id=run_id)
+
+
+def journal_enabled() -> bool:
+    """Whether new workflow runs are checkpointed"""
+    return os.getenv('VOICECRAFT_RUN_JOURNAL', '1') != '0'
+
+
+# Global instance
+_run_journal = None
+
+def get_run_journal() -> RunJournal:
+    """Get the process-wide run journal"""
+    global _run_journal
+    if _run_journal is None:
+        _run_journal = RunJournal(os.getenv('VOICECRAFT_RUNS_PATH', './data/runs'))
+    return _run_journal
+
+
+if __name__ == "__main__":
+    # Example: show the latest runs and what each one completed
+    for run in get_run_journal().list(limit=10):
+        print(f"{run['run_id']}  {run['status']:11} {run['profile_name']}: {', '.join(run['steps'])}")
+        if run.get("error"):
+            print(f"    error: {run['error']}")
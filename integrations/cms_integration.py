@@ -645,8 +645,7 @@ class WebsiteEditor:
             }
         
         try:
-            import anthropic
-            client = anthropic.Anthropic(api_key=api_key)
+            from core.llm_gateway import get_llm_gateway
             
             prompt = f"""Parse this command to add content to a website CMS:
 
@@ -662,14 +661,16 @@ Respond in JSON:
 
 If unclear, respond with {{"error": "reason"}}."""
             
-            response = client.messages.create(
+            response_text = get_llm_gateway().complete(
+                prompt,
                 model="claude-sonnet-4-20250514",
                 max_tokens=300,
-                messages=[{"role": "user", "content": prompt}]
+                temperature=1.0,
+                api_key=api_key
             )
             
             import json
-            result_text = response.content[0].text.strip()
+            result_text = response_text.strip()
             if result_text.startswith('```'):
                 result_text = result_text.split('\n', 1)[1].rsplit('\n```', 1)[0]
             
@@ -703,8 +704,7 @@ If unclear, respond with {{"error": "reason"}}."""
             return {'success': False}
         
         try:
-            import anthropic
-            client = anthropic.Anthropic(api_key=api_key)
+            from core.llm_gateway import get_llm_gateway
             
             prompt = f"""Extract testimonial information from this command:
 
@@ -717,14 +717,16 @@ Respond in JSON:
   "role_company": "role at company or just role"
 }}"""
             
-            response = client.messages.create(
+            response_text = get_llm_gateway().complete(
+                prompt,
                 model="claude-sonnet-4-20250514",
                 max_tokens=200,
-                messages=[{"role": "user", "content": prompt}]
+                temperature=1.0,
+                api_key=api_key
             )
             
             import json
-            result_text = response.content[0].text.strip()
+            result_text = response_text.strip()
             if result_text.startswith('```'):
                 result_text = result_text.split('\n', 1)[1].rsplit('\n```', 1)[0]
             
@@ -742,8 +744,7 @@ Respond in JSON:
             return {'success': False}
         
         try:
-            import anthropic
-            client = anthropic.Anthropic(api_key=api_key)
+            from core.llm_gateway import get_llm_gateway
             
             prompt = f"""Extract FAQ question and answer from this command:
 
@@ -755,14 +756,16 @@ Respond in JSON:
   "answer": "the answer"
 }}"""
             
-            response = client.messages.create(
+            response_text = get_llm_gateway().complete(
+                prompt,
                 model="claude-sonnet-4-20250514",
                 max_tokens=300,
-                messages=[{"role": "user", "content": prompt}]
+                temperature=1.0,
+                api_key=api_key
             )
             
             import json
-            result_text = response.content[0].text.strip()
+            result_text = response_text.strip()
             if result_text.startswith('```'):
                 result_text = result_text.split('\n', 1)[1].rsplit('\n```', 1)[0]
             
@@ -780,8 +783,7 @@ Respond in JSON:
             return {'success': False}
         
         try:
-            import anthropic
-            client = anthropic.Anthropic(api_key=api_key)
+            from core.llm_gateway import get_llm_gateway
             
             prompt = f"""Extract service information from this command:
 
@@ -795,14 +797,16 @@ Respond in JSON:
   "highlight": false
 }}"""
             
-            response = client.messages.create(
+            response_text = get_llm_gateway().complete(
+                prompt,
                 model="claude-sonnet-4-20250514",
                 max_tokens=200,
-                messages=[{"role": "user", "content": prompt}]
+                temperature=1.0,
+                api_key=api_key
             )
             
             import json
-            result_text = response.content[0].text.strip()
+            result_text = response_text.strip()
             if result_text.startswith('```'):
                 result_text = result_text.split('\n', 1)[1].rsplit('\n```', 1)[0]
             
@@ -919,8 +923,7 @@ Respond in JSON:
             return {'success': False, 'message': 'LLM parsing unavailable (no API key)'}
         
         try:
-            import anthropic
-            client = anthropic.Anthropic(api_key=api_key)
+            from core.llm_gateway import get_llm_gateway
             
             # Build prompt with available fields
             fields_list = ', '.join(sorted(set(self.FIELD_MAPPINGS.keys())))
@@ -938,15 +941,17 @@ Respond in JSON format:
 
 If you can't determine the field or value, respond with {{"error": "reason"}}."""
             
-            response = client.messages.create(
+            response_text = get_llm_gateway().complete(
+                prompt,
                 model="claude-sonnet-4-20250514",  # Using Sonnet 4.5 for cost efficiency
                 max_tokens=200,
-                messages=[{"role": "user", "content": prompt}]
+                temperature=1.0,
+                api_key=api_key
             )
             
             # Parse JSON response
             import json
-            result_text = response.content[0].text.strip()
+            result_text = response_text.strip()
             # Remove markdown code fences if present
             if result_text.startswith('```'):
                 result_text = result_text.split('\n', 1)[1].rsplit('\n```', 1)[0]
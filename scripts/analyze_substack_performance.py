@@ -11,13 +11,16 @@ from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
 import re
+import sys
 
-try:
-    from openai import OpenAI
-    from anthropic import Anthropic
-except ImportError:
-    OpenAI = None
-    Anthropic = None
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.llm_gateway import get_llm_gateway
+
+
+# Deep analysis model (same as workflow automation)
+ANALYSIS_MODEL = "claude-haiku-4-5-20251001"
 
 
 class SubstackAnalyzer:
@@ -33,16 +36,8 @@ class SubstackAnalyzer:
         self.openai_api_key = openai_api_key or os.getenv("OPENAI_API_KEY")
         self.anthropic_api_key = anthropic_api_key or os.getenv("ANTHROPIC_API_KEY")
         
-        # Initialize AI clients
-        if OpenAI and self.openai_api_key:
-            self.openai_client = OpenAI(api_key=self.openai_api_key)
-        else:
-            self.openai_client = None
-        
-        if Anthropic and self.anthropic_api_key:
-            self.anthropic_client = Anthropic(api_key=self.anthropic_api_key)
-        else:
-            self.anthropic_client = None
+        # AI calls go through the shared LLM gateway
+        self.gateway = get_llm_gateway()
     
     def load_articles(self) -> List[Dict]:
         """Load all articles from directory"""
@@ -272,7 +267,7 @@ class SubstackAnalyzer:
         num_to_analyze: int = 5
     ) -> Dict:
         """Analyze why top articles performed well"""
-        if not self.anthropic_client:
+        if not self.gateway.available(ANALYSIS_MODEL, self.anthropic_api_key):
             print("⚠️  Anthropic API key not set. Skipping deep analysis.")
             return {}
         
@@ -307,18 +302,16 @@ Be specific and actionable.
 """
         
         try:
-            # Use the same model as workflow automation
-            message = self.anthropic_client.messages.create(
-                model="claude-haiku-4-5-20251001",
+            analysis = self.gateway.complete(
+                prompt,
+                model=ANALYSIS_MODEL,
                 max_tokens=2000,
-                messages=[{
-                    "role": "user",
-                    "content": prompt
-                }]
+                temperature=1.0,
+                api_key=self.anthropic_api_key,
+                # Re-running the report on unchanged articles reuses the analysis
+                use_cache=True
             )
             
-            analysis = message.content[0].text
-            
             return {
                 "analysis": analysis,
                 "top_articles": top_articles[:num_to_analyze]
@@ -117,7 +117,7 @@ def create_humanizer_prompt():
     print("Step 3: Initializing analyzer...")
     analyzer = LLMVoiceAnalyzer()
     
-    if not analyzer.openai_client and not analyzer.anthropic_client:
+    if not analyzer.available():
         print("❌ No AI API keys found!")
         print("   Set OPENAI_API_KEY or ANTHROPIC_API_KEY")
         return
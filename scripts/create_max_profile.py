@@ -10,6 +10,7 @@ This script creates a comprehensive voice profile using:
 
 import sys
 import os
+import argparse
 from pathlib import Path
 import json
 from dotenv import load_dotenv
@@ -50,7 +51,7 @@ def load_articles_from_directory(directory: str) -> list:
     return articles
 
 
-def create_max_profile():
+def create_max_profile(workers: int = 1):
     """Create Max Bernstein's voice profile"""
     
     print("="*70)
@@ -81,11 +82,19 @@ def create_max_profile():
     # Extract just the content
     writing_samples = [article['content'] for article in articles]
     
+    # Step 1.5: Rule-based style metrics (sharded across worker processes)
+    print(f"Step 1.5: Analyzing style metrics ({workers} worker{'s' if workers != 1 else ''})...")
+    profiler = VoiceProfiler()
+    style_statistics = profiler.analyzer.collect_statistics(writing_samples, workers=workers)
+    style_profile = profiler.analyzer.profile_from_statistics(style_statistics, "Max Bernstein")
+    print(f"✓ Avg sentence length: {style_profile.sentence_structure.get('avg_sentence_length', 0)} words")
+    print()
+    
     # Step 2: Initialize analyzer
     print("Step 2: Initializing LLM analyzer...")
     analyzer = LLMVoiceAnalyzer()
     
-    if not analyzer.openai_client and not analyzer.anthropic_client:
+    if not analyzer.available():
         print("\n⚠️  No AI API keys found!")
         print("Set OPENAI_API_KEY or ANTHROPIC_API_KEY environment variable")
         return
@@ -118,7 +127,6 @@ def create_max_profile():
         
         # Step 4: Save profile
         print("Step 4: Saving profile...")
-        profiler = VoiceProfiler()
         
         # Save the LLM analysis
         profile_path = profiler._get_profile_path("Max Bernstein")
@@ -134,6 +142,8 @@ def create_max_profile():
                 }
             },
             "llm_analysis": voice_guide,
+            "style": style_profile.to_dict(),
+            "statistics": style_statistics.to_dict(),
             "articles_analyzed": [
                 {
                     "filename": a['filename'],
@@ -143,8 +153,7 @@ def create_max_profile():
             ]
         }
         
-        with open(profile_path, 'w') as f:
-            json.dump(profile_data, f, indent=2)
+        profiler.save_profile("Max Bernstein", profile_data)
         
         print(f"✓ Profile saved to: {profile_path}")
         print()
@@ -181,5 +190,14 @@ def create_max_profile():
 
 
 if __name__ == "__main__":
-    create_max_profile()
+    parser = argparse.ArgumentParser(description="Create Max Bernstein's voice profile")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for style analysis (default: all CPU cores)"
+    )
+    args = parser.parse_args()
+    
+    create_max_profile(workers=args.workers)
 
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Migrate Voice Profiles Between Storage Formats
+
+Converts every profile in a profiles directory to the compact sectioned .vcp
+format (or back to pretty JSON). Each converted file is read back and compared
+with the original before the source file is removed.
+
+Usage:
+    python3 scripts/migrate_profiles.py                 # JSON -> .vcp
+    python3 scripts/migrate_profiles.py --to json       # .vcp -> JSON
+    python3 scripts/migrate_profiles.py --keep-source --dry-run
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.profile_store import STORAGE_FORMATS, iter_profile_files, read_profile, write_profile
+from core.voice_profiler import VoiceProfiler
+
+
+def migrate_profiles(profiles_dir: str, target_format: str, keep_source: bool = False, dry_run: bool = False) -> int:
+    """
+    Convert all profiles in a directory to target_format
+
+    Returns:
+        Number of profiles that failed to migrate
+    """
+    target_suffix = STORAGE_FORMATS[target_format]
+    failures = 0
+    migrated = 0
+
+    for source_path in list(iter_profile_files(profiles_dir)):
+        if source_path.suffix == target_suffix:
+            continue
+
+        target_path = source_path.with_suffix(target_suffix)
+        try:
+            profile = read_profile(source_path)
+        except Exception as e:
+            print(f"❌ {source_path.name}: could not read ({e})")
+            failures += 1
+            continue
+
+        if dry_run:
+            print(f"→ {source_path.name} would become {target_path.name}")
+            continue
+
+        write_profile(target_path, profile)
+
+        # Verify the round trip before touching the source
+        if read_profile(target_path) != profile:
+            target_path.unlink()
+            print(f"❌ {source_path.name}: round trip mismatch, left unchanged")
+            failures += 1
+            continue
+
+        source_size = source_path.stat().st_size
+        if not keep_source:
+            source_path.unlink()
+
+        print(f"✓ {source_path.name} → {target_path.name} ({source_size:,} → {target_path.stat().st_size:,} bytes)")
+        migrated += 1
+
+    if migrated and not dry_run:
+        # Refresh the listing manifest and nearest-voice index
+        profiler = VoiceProfiler(profiles_dir=profiles_dir)
+        profiler.list_profiles()
+        profiler.index.sync()
+
+    print(f"\nMigrated {migrated} profile(s), {failures} failure(s)")
+    return failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Migrate voice profiles between storage formats")
+    parser.add_argument("--profiles-dir", default="./data/voices", help="Profiles directory (default: ./data/voices)")
+    parser.add_argument("--to", dest="target_format", choices=sorted(STORAGE_FORMATS), default="vcp",
+                        help="Target storage format (default: vcp)")
+    parser.add_argument("--keep-source", action="store_true", help="Keep the original files")
+    parser.add_argument("--dry-run", action="store_true", help="Only show what would be migrated")
+    args = parser.parse_args()
+
+    failures = migrate_profiles(args.profiles_dir, args.target_format, args.keep_source, args.dry_run)
+    if not args.dry_run and args.target_format == "vcp":
+        print("Set VOICECRAFT_PROFILE_FORMAT=vcp so new and updated profiles are saved in the compact format.")
+    sys.exit(1 if failures else 0)
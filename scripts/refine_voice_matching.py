@@ -155,8 +155,7 @@ def refine_profile():
             ]
         }
         
-        with open(profile_path, 'w') as f:
-            json.dump(profile_data, f, indent=2)
+        profiler.save_profile("Max Bernstein", profile_data)
         
         print(f"✓ Profile saved: {profile_path}")
         print()
@@ -104,7 +104,7 @@ def test_style_fusion():
     
     generator = ContentGenerator()
     
-    if not generator.openai_client and not generator.anthropic_client:
+    if not generator.available():
         print("❌ No API keys found!")
         return
     
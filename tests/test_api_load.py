@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Test that API workflows run off the event loop (stub LLM, no API keys)
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from api import server
+from api.load_test import run_load_test
+
+
+def test_health_stays_responsive_under_load():
+    report = run_load_test(requests=4, latency=0.1)
+    baseline, pooled = report["baseline"], report["pooled"]
+
+    assert baseline["errors"] == 0 and pooled["errors"] == 0
+    # Inline workflows hold the event loop; pooled ones overlap
+    assert pooled["health_max"] < 0.1 < baseline["health_max"]
+    assert pooled["wall_time"] < baseline["wall_time"] / 2
+
+
+def test_full_backlog_is_rejected():
+    workers, queue = server.WORKFLOW_WORKERS, server.WORKFLOW_QUEUE
+    server.WORKFLOW_WORKERS, server.WORKFLOW_QUEUE = 1, 0
+
+    async def saturate():
+        first = asyncio.ensure_future(server.run_workflow(time.sleep, 0.2))
+        await asyncio.sleep(0)
+        try:
+            await server.run_workflow(time.sleep, 0)
+            assert False, "the second workflow should be rejected"
+        except HTTPException as e:
+            assert e.status_code == 503
+        await first
+        return server.workflow_stats()
+
+    try:
+        stats = asyncio.run(saturate())
+    finally:
+        server.WORKFLOW_WORKERS, server.WORKFLOW_QUEUE = workers, queue
+    assert stats["running"] == 0 and stats["queued"] == 0
+
+
+def test_streams_share_the_workflow_pool():
+    workers, queue = server.WORKFLOW_WORKERS, server.WORKFLOW_QUEUE
+    server.WORKFLOW_WORKERS, server.WORKFLOW_QUEUE = 1, 0
+
+    def words():
+        for word in ("one", "two", "three"):
+            time.sleep(0.05)
+            yield word
+
+    async def saturate():
+        stream = server.stream_workflow(words)
+        try:
+            server.stream_workflow(words)
+            assert False, "a second stream should be rejected while the first runs"
+        except HTTPException as e:
+            assert e.status_code == 503
+        items = [item async for item in stream]
+        await asyncio.sleep(0.01)
+        return items, server.workflow_stats()
+
+    try:
+        items, stats = asyncio.run(saturate())
+    finally:
+        server.WORKFLOW_WORKERS, server.WORKFLOW_QUEUE = workers, queue
+    assert items == ["one", "two", "three"]
+    assert stats["running"] == 0 and stats["queued"] == 0
+
+
+def test_load_test_route_stays_out_of_the_api():
+    paths = {getattr(route, "path", None) for route in server.app.routes}
+    assert "/_load_test/inline" not in paths
+    assert "/health" in paths
+
+
+def test_verify_worker_count_is_bounded():
+    client = TestClient(server.app)
+    response = client.post("/api/v1/profiles/Anyone/verify", json={"contents": ["Draft."], "workers": 500})
+    assert response.status_code == 422
+
+
+def test_verify_tells_missing_profiles_from_missing_metrics():
+    from core.voice_profiler import VoiceProfiler
+
+    client = TestClient(server.app)
+    load_profile = VoiceProfiler.load_profile
+    try:
+        VoiceProfiler.load_profile = lambda self, name, sections=None: None
+        response = client.post("/api/v1/profiles/Nobody/verify", json={"contents": ["Draft."]})
+        assert response.status_code == 404
+
+        VoiceProfiler.load_profile = lambda self, name, sections=None: {"metadata": {"name": name}}
+        response = client.post("/api/v1/profiles/Unanalyzed/verify", json={"contents": ["Draft."]})
+        assert response.status_code == 422
+        assert "no style metrics" in response.json()["detail"]
+    finally:
+        VoiceProfiler.load_profile = load_profile
+
+
+if __name__ == "__main__":
+    test_health_stays_responsive_under_load()
+    test_full_backlog_is_rejected()
+    test_streams_share_the_workflow_pool()
+    test_load_test_route_stays_out_of_the_api()
+    test_verify_worker_count_is_bounded()
+    test_verify_tells_missing_profiles_from_missing_metrics()
+    print("✅ API load tests complete!")
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Test bulk content generation (fake items and the stub LLM, no API keys)
+"""
+
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi.testclient import TestClient
+
+from core.batch_runner import BatchRunner, parse_batch
+
+
+def test_parse_jsonl_and_csv():
+    jsonl = '"Why focus beats hustle"\n\n{"topic": "Pricing", "output_format": "twitter", "target_length": "300"}\n'
+    assert parse_batch(jsonl) == [
+        {"input_text": "Why focus beats hustle"},
+        {"input_text": "Pricing", "output_format": "twitter", "target_length": 300}
+    ]
+
+    csv_text = "input_text,output_format,auto_humanize,style_influences\nPricing,,no,Alex Hormozi:30\n"
+    assert parse_batch(csv_text, "csv") == [{
+        "input_text": "Pricing",
+        "auto_humanize": False,
+        "style_influences": [{"name": "Alex Hormozi", "weight": 30.0}]
+    }]
+
+    for bad in ('{"output_format": "faq"}', "not json"):
+        try:
+            parse_batch(bad)
+            assert False, f"{bad!r} should be rejected"
+        except ValueError:
+            pass
+
+
+def test_duplicates_run_once_and_failures_are_summarized():
+    calls = []
+    active = [0, 0]     # current, peak
+    lock = threading.Lock()
+
+    def fake_item(item):
+        with lock:
+            calls.append(item["input_text"])
+            active[0] += 1
+            active[1] = max(active)
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+        if item["input_text"].startswith("bad"):
+            raise RuntimeError("model unavailable")
+        return {"content": item["input_text"].upper()}
+
+    items = parse_batch("\n".join(json.dumps(topic) for topic in ["a", "b", "a", "bad 1", "c", "bad 2", "a"]))
+    events = list(BatchRunner(workers=2, run_item=fake_item).run(items))
+
+    results, summary = events[:-1], events[-1]
+    assert sorted(calls) == ["a", "b", "bad 1", "bad 2", "c"]
+    assert active[1] == 2
+    assert {result["input_text"]: result["indexes"] for result in results}["a"] == [0, 2, 6]
+    assert summary["event"] == "summary"
+    assert (summary["items"], summary["unique"], summary["duplicates"]) == (7, 5, 2)
+    assert (summary["succeeded"], summary["failed"]) == (3, 2)
+    assert summary["errors"] == [{"error": "model unavailable", "count": 2}]
+
+
+def test_api_batch_streams_ndjson():
+    from api import server
+    from api.load_test import stub_environment
+
+    with stub_environment(latency=0):
+        client = TestClient(server.app)
+        response = client.post(
+            "/api/v1/content/batch?profile_name=Load%20Test",
+            content="topic\nWhy focus beats hustle\nPricing for experts\nWhy focus beats hustle\n",
+            headers={"Content-Type": "text/csv"}
+        )
+        assert response.status_code == 200
+        events = [json.loads(line) for line in response.text.splitlines()]
+        assert [event["event"] for event in events] == ["result", "result", "summary"]
+        assert all(event["status"] == "succeeded" and event["content"] for event in events[:2])
+        assert events[-1]["duplicates"] == 1
+
+        assert client.post("/api/v1/content/batch", json={"items": []}).status_code == 400
+        assert server.workflow_stats()["running"] == server.workflow_stats()["queued"] == 0
+
+
+def test_api_batch_is_rejected_when_the_pool_is_full():
+    from api import server
+
+    workers, queue = server.WORKFLOW_WORKERS, server.WORKFLOW_QUEUE
+    server.WORKFLOW_WORKERS, server.WORKFLOW_QUEUE = 2, 0
+    server._reserve_workflow_slots(1)
+    try:
+        client = TestClient(server.app)
+        response = client.post("/api/v1/content/batch?workers=2", json={"items": ["One", "Two"]})
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "5"
+    finally:
+        server._release_workflow_slots(1)
+        server.WORKFLOW_WORKERS, server.WORKFLOW_QUEUE = workers, queue
+
+
+def test_abandoned_batch_frees_its_slots():
+    import asyncio
+    import gc
+    from starlette.requests import Request
+    from api import server
+
+    # Reserved slots: freed at once when idle, otherwise as their items finish
+    slots = server.ReservedSlots(2)
+    future = slots.submit(time.sleep, 0.2)
+    slots.close()
+    assert server._workflow_pending == 1
+    future.result()
+    time.sleep(0.05)    # Done callbacks run just after result() returns
+    assert server._workflow_pending == 0
+
+    # A batch response whose body never starts (the client left first)
+    async def receive():
+        return {"type": "http.request", "body": b'{"items": ["One", "Two"]}', "more_body": False}
+
+    async def abandon():
+        request = Request({
+            "type": "http", "method": "POST", "path": "/api/v1/content/batch",
+            "headers": [(b"content-type", b"application/json")], "query_string": b""
+        }, receive)
+        response = await server.create_content_batch(request, workers=2)
+        assert server._workflow_pending == 2
+        del response
+
+    asyncio.run(abandon())
+    gc.collect()
+    assert server._workflow_pending == 0
+
+
+if __name__ == "__main__":
+    test_parse_jsonl_and_csv()
+    test_duplicates_run_once_and_failures_are_summarized()
+    test_api_batch_streams_ndjson()
+    test_api_batch_is_rejected_when_the_pool_is_full()
+    test_abandoned_batch_frees_its_slots()
+    print("✅ Batch runner tests complete!")
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Test voice drift monitoring without requiring API keys
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+
+from core.drift_monitor import DRIFT_FEATURES, DriftMonitor
+from core.style_vectors import FEATURE_KEYS
+
+
+def make_vectors(count, shift_after=None, seed=0):
+    rng = np.random.default_rng(seed)
+    vectors = 10 + rng.normal(0, 1, (count, len(FEATURE_KEYS)))
+    if shift_after is not None:
+        vectors[shift_after:, 0] += 5
+    return vectors
+
+
+def test_running_statistics_match_full_history():
+    vectors = make_vectors(50)
+    vectors[3, 2] = np.nan  # Missing features are skipped, not counted
+
+    with tempfile.TemporaryDirectory() as tmp:
+        monitor = DriftMonitor(tmp)
+        for vector in vectors:
+            record = monitor.record("Voice", vector, match_score=75.0, source="generate", format="linkedin")
+        report = monitor.report("Voice")
+
+    assert (record["source"], record["format"]) == ("generate", "linkedin")
+    assert report["records"] == 50
+    assert not report["drifting"]
+    features = {feature["feature"]: feature for feature in report["features"]}
+    first = features[DRIFT_FEATURES[0]]
+    assert abs(first["mean"] - vectors[:, 0].mean()) < 1e-3
+    assert abs(first["std"] - vectors[:, 0].std(ddof=1)) < 1e-3
+    assert features[DRIFT_FEATURES[2]]["count"] == 49
+    assert features["voice_match_score"]["mean"] == 75.0
+
+
+def test_shift_is_flagged():
+    with tempfile.TemporaryDirectory() as tmp:
+        monitor = DriftMonitor(tmp)
+        for vector in make_vectors(60, shift_after=40):
+            monitor.record("Voice", vector)
+        report = monitor.report("Voice")
+
+    drifting = [feature["feature"] for feature in report["features"] if feature["drifting"]]
+    assert report["drifting"]
+    assert drifting == [DRIFT_FEATURES[0]]
+
+
+def test_statistics_rebuild_from_log():
+    """Lost or stale statistics are rebuilt from the append-only log"""
+    vectors = make_vectors(20)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        monitor = DriftMonitor(tmp)
+        for vector in vectors[:10]:
+            monitor.record("Voice", vector)
+        state_path = Path(tmp) / "voice.state.json"
+        stale_state = state_path.read_text()
+
+        for vector in vectors[10:]:
+            monitor.record("Voice", vector)
+        expected = monitor.report("Voice")
+
+        # Statistics written before the last ten appends
+        state_path.write_text(stale_state)
+        assert monitor.report("Voice") == expected
+
+        # Statistics lost entirely, plus a torn final line
+        state_path.unlink()
+        with open(Path(tmp) / "voice.jsonl", "a") as f:
+            f.write('{"timestamp": "2026')
+        assert monitor.report("Voice")["records"] == 20
+
+        monitor.record("Voice", vectors[0])
+        lines = (Path(tmp) / "voice.jsonl").read_text().splitlines()
+        assert json.loads(lines[-1])["values"][0] == vectors[0][0]
+        assert monitor.report("Voice")["records"] == 21
+
+
+if __name__ == "__main__":
+    test_running_statistics_match_full_history()
+    test_shift_is_flagged()
+    test_statistics_rebuild_from_log()
+    print("✅ Drift monitor tests complete!")
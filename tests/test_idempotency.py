@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Test Idempotency-Key replays and in-flight request coalescing (stub LLM, no API keys)
+"""
+
+import socket
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi.testclient import TestClient
+
+from core import idempotency, job_queue
+from core.idempotency import IdempotencyConflict, IdempotencyInProgress, IdempotencyStore, request_fingerprint
+from core.job_queue import JobQueue
+from core.llm_gateway import get_llm_gateway
+
+
+def stub_calls() -> int:
+    return get_llm_gateway().stats()["stub"]["calls"]
+
+
+def test_store_replays_within_ttl():
+    with tempfile.TemporaryDirectory() as tmp:
+        store = IdempotencyStore(Path(tmp) / "requests.sqlite", ttl=0.2)
+        first = request_fingerprint("content", {"input_text": "Pricing", "profile_name": "A"})
+        other = request_fingerprint("content", {"input_text": "Pricing", "profile_name": "B"})
+        assert first != other
+        assert first == request_fingerprint("content", {"profile_name": "A", "input_text": "Pricing"})
+
+        assert store.get("key-1", first) is None
+        store.put("key-1", first, 200, {"content": "draft"})
+        assert store.get("key-1", first) == {"status": 200, "response": {"content": "draft"}}
+        try:
+            store.get("key-1", other)
+            assert False, "a reused key with a different request should conflict"
+        except IdempotencyConflict:
+            pass
+
+        time.sleep(0.25)
+        assert store.get("key-1", first) is None
+
+
+def test_reservations_are_shared_by_processes():
+    with tempfile.TemporaryDirectory() as tmp:
+        # Two stores on one file stand in for two worker processes
+        worker_a = IdempotencyStore(Path(tmp) / "requests.sqlite")
+        worker_b = IdempotencyStore(Path(tmp) / "requests.sqlite")
+        fingerprint = request_fingerprint("content", {"input_text": "Pricing"})
+
+        assert worker_a.reserve("key-1", fingerprint) is None
+        try:
+            worker_b.reserve("key-1", fingerprint)
+            assert False, "the key is reserved by the other worker"
+        except IdempotencyInProgress:
+            pass
+        assert worker_b.stats()["in_progress"] == 1
+        worker_a.put("key-1", fingerprint, 200, {"content": "draft"})
+        assert worker_b.reserve("key-1", fingerprint) == {"status": 200, "response": {"content": "draft"}}
+
+        # A failed request releases its key; a vanished process's reservation is taken over
+        assert worker_a.reserve("key-2", fingerprint) is None
+        worker_a.release("key-2", fingerprint)
+        assert worker_b.reserve("key-2", fingerprint) is None
+        with worker_b._db:
+            worker_b._db.execute("UPDATE requests SET owner = ? WHERE key = 'key-2'", (f"{socket.gethostname()}:999999999",))
+        assert worker_a.reserve("key-2", fingerprint) is None
+
+
+def test_api_waits_for_a_key_reserved_elsewhere():
+    from api import server
+    from api.load_test import stub_environment
+
+    with stub_environment(latency=0) as tmp:
+        idempotency._idempotency_store = IdempotencyStore(tmp / "requests.sqlite")
+        other_worker = IdempotencyStore(tmp / "requests.sqlite")
+        wait = server.IDEMPOTENCY_WAIT
+        server.IDEMPOTENCY_WAIT = 0.3
+        try:
+            with TestClient(server.app) as client:
+                body = {"input_text": "Why focus beats hustle", "profile_name": "Load Test", "output_format": "linkedin"}
+                headers = {"Idempotency-Key": "slack-retry-3"}
+                payload = server.ContentRequest(**body).model_dump()
+                fingerprint = request_fingerprint("content", server._with_profile(payload))
+                assert other_worker.reserve("slack-retry-3", fingerprint) is None
+
+                calls = stub_calls()
+                busy = client.post("/api/v1/content", json=body, headers=headers)
+                assert busy.status_code == 409 and busy.headers["Retry-After"] == "5"
+
+                # The other worker finishes while this one waits: its response is replayed
+                finish = threading.Timer(0.1, other_worker.put, ("slack-retry-3", fingerprint, 200, {"content": "theirs"}))
+                finish.start()
+                replayed = client.post("/api/v1/content", json=body, headers=headers)
+                assert replayed.json() == {"content": "theirs"}
+                assert replayed.headers["Idempotent-Replayed"] == "true"
+                assert stub_calls() == calls
+        finally:
+            server.IDEMPOTENCY_WAIT = wait
+            idempotency._idempotency_store = None
+
+
+def test_store_waits_happen_off_the_event_loop():
+    import sqlite3
+    from api import server
+    from api.load_test import stub_environment
+
+    with stub_environment(latency=0) as tmp:
+        idempotency._idempotency_store = IdempotencyStore(tmp / "requests.sqlite")
+        try:
+            with TestClient(server.app) as client:
+                # Another worker process holds the store's write lock
+                other_worker = sqlite3.connect(str(tmp / "requests.sqlite"), isolation_level=None)
+                other_worker.execute("BEGIN IMMEDIATE")
+                body = {"input_text": "Why focus beats hustle", "profile_name": "Load Test"}
+                responses = []
+                waiting = threading.Thread(target=lambda: responses.append(
+                    client.post("/api/v1/content", json=body, headers={"Idempotency-Key": "locked-1"})
+                ))
+                waiting.start()
+                time.sleep(0.2)
+
+                start = time.perf_counter()
+                assert client.get("/").status_code == 200
+                assert time.perf_counter() - start < 0.5
+
+                other_worker.execute("COMMIT")
+                other_worker.close()
+                waiting.join()
+                assert responses[0].status_code == 200
+        finally:
+            idempotency._idempotency_store = None
+
+
+def test_api_coalesces_and_replays():
+    from api import server
+    from api.load_test import stub_environment
+
+    with stub_environment(latency=0.3) as tmp:
+        idempotency._idempotency_store = IdempotencyStore(tmp / "requests.sqlite")
+        try:
+            with TestClient(server.app) as client:
+                body = {"input_text": "Why focus beats hustle", "profile_name": "Load Test", "output_format": "linkedin"}
+
+                # Three identical requests at once: one workflow (generation + humanization)
+                calls = stub_calls()
+                responses = []
+                threads = [
+                    threading.Thread(target=lambda: responses.append(client.post("/api/v1/content", json=body)))
+                    for _ in range(3)
+                ]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+                assert [response.status_code for response in responses] == [200, 200, 200]
+                assert len({response.json()["content"] for response in responses}) == 1
+                assert stub_calls() - calls == 2
+                assert client.get("/health").json()["workflows"]["deduplication"]["coalesced"] == 2
+
+                # A retry with the same key is replayed without running again
+                headers = {"Idempotency-Key": "delivery-42"}
+                first = client.post("/api/v1/content", json=body, headers=headers)
+                calls = stub_calls()
+                again = client.post("/api/v1/content", json=body, headers=headers)
+                assert stub_calls() == calls
+                assert again.headers["Idempotent-Replayed"] == "true"
+                assert again.json() == first.json()
+
+                changed = client.post("/api/v1/content", json={**body, "output_format": "twitter"}, headers=headers)
+                assert changed.status_code == 422
+        finally:
+            idempotency._idempotency_store = None
+
+
+def test_job_resubmission_returns_the_same_job():
+    from api import server
+    from api.load_test import stub_environment
+
+    with stub_environment(latency=0) as tmp:
+        idempotency._idempotency_store = IdempotencyStore(tmp / "requests.sqlite")
+        job_queue._job_queue = JobQueue(tmp / "jobs.sqlite")
+        try:
+            with TestClient(server.app) as client:
+                body = {"input_text": "Pricing for experts", "profile_name": "Load Test"}
+                headers = {"Idempotency-Key": "zap-7"}
+                first = client.post("/api/v1/jobs", json=body, headers=headers)
+                again = client.post("/api/v1/jobs", json=body, headers=headers)
+                assert first.status_code == again.status_code == 202
+                assert first.json()["job_id"] == again.json()["job_id"]
+                assert len(job_queue._job_queue.list()) == 1
+                job_queue._job_queue.wait(first.json()["job_id"], timeout=30)
+        finally:
+            job_queue._job_queue.shutdown(wait=True)
+            job_queue._job_queue = None
+            idempotency._idempotency_store = None
+
+
+if __name__ == "__main__":
+    test_store_replays_within_ttl()
+    test_reservations_are_shared_by_processes()
+    test_api_waits_for_a_key_reserved_elsewhere()
+    test_store_waits_happen_off_the_event_loop()
+    test_api_coalesces_and_replays()
+    test_job_resubmission_returns_the_same_job()
+    print("✅ Idempotency tests complete!")
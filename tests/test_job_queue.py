@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Test background jobs: progress, callbacks, restarts and the API (stub LLM)
+"""
+
+import socket
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi.testclient import TestClient
+
+from core import job_queue
+from core.job_queue import JobQueue
+from core.workflow_runs import public_params
+
+
+def two_steps(params, report):
+    for step in ("draft", "polish"):
+        report(step, "running")
+        report(step, "complete")
+    if params.get("fail"):
+        raise RuntimeError("model unavailable")
+    return {"content": params["topic"].upper()}
+
+
+def make_queue(tmp, responses=(200,)):
+    queue = JobQueue(Path(tmp) / "jobs.sqlite", callback_backoff=0)
+    queue.register("example", two_steps)
+    queue.callbacks = []
+    codes = list(responses)
+
+    def post(url, payload):
+        queue.callbacks.append((url, payload))
+        return codes.pop(0) if len(codes) > 1 else codes[0]
+
+    queue._post = post
+    return queue
+
+
+def test_job_progress_and_callback():
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = make_queue(tmp)
+        queue.start()
+        job = queue.submit("example", {"topic": "focus"}, callback_url="https://example.com/hook")
+        job = queue.wait(job["id"], timeout=5)
+        queue.shutdown(wait=True)
+        job = queue.get(job["id"])
+
+        assert job["status"] == "succeeded"
+        assert job["result"] == {"content": "FOCUS"}
+        assert [(s["step"], s["status"]) for s in job["steps"]] == [("draft", "complete"), ("polish", "complete")]
+        assert job["callback_status"] == "delivered"
+        url, payload = queue.callbacks[0]
+        assert url == "https://example.com/hook" and payload["result"] == {"content": "FOCUS"}
+        assert "params" not in payload
+
+        try:
+            queue.submit("unknown", {})
+            assert False, "unknown job kinds must be rejected"
+        except ValueError:
+            pass
+
+
+def test_failed_job_callback_is_retried():
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = make_queue(tmp, responses=(503, 200))
+        queue.start()
+        job = queue.submit("example", {"topic": "focus", "fail": True}, callback_url="https://example.com/hook")
+        job = queue.wait(job["id"], timeout=5)
+        queue.shutdown(wait=True)
+        job = queue.get(job["id"])
+
+        assert job["status"] == "failed" and job["error"] == "model unavailable"
+        assert len(queue.callbacks) == 2
+        assert job["callback_status"] == "delivered"
+        assert queue.stats()["failed"] == 1
+
+
+def test_secrets_are_not_stored():
+    seen = []
+
+    def publish(params, report):
+        seen.append(params["publish_config"])
+        return {"published": True}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = JobQueue(Path(tmp) / "jobs.sqlite", redact=public_params)
+        queue.register("publish", publish)
+        queue.start()
+        config = {"destination": "github", "repo": "me/blog", "github_token": "ghp_secret"}
+        job = queue.submit("publish", {"input_text": "Focus", "publish_config": config})
+        queue.wait(job["id"], timeout=5)
+        queue.shutdown(wait=True)
+
+        assert seen == [config]
+        stored = queue._db.execute("SELECT params FROM jobs WHERE id = ?", (job["id"],)).fetchone()["params"]
+        assert "ghp_secret" not in stored and "me/blog" in stored
+        assert "params" not in queue.get(job["id"])
+
+
+def test_interrupted_jobs_are_requeued():
+    """A job left running by a dead process runs again on the next start"""
+    with tempfile.TemporaryDirectory() as tmp:
+        crashed = make_queue(tmp)
+        job = crashed.submit("example", {"topic": "focus"})
+        with crashed._db:
+            crashed._db.execute(
+                "UPDATE jobs SET status = 'running', attempts = 1, owner = ? WHERE id = ?",
+                (f"{socket.gethostname()}:999999999", job["id"])
+            )
+
+        restarted = make_queue(tmp)
+        assert restarted.start() == 1
+        job = restarted.wait(job["id"], timeout=5)
+        restarted.shutdown()
+
+        assert job["status"] == "succeeded"
+        assert job["attempts"] == 2
+
+
+def test_api_jobs_endpoints():
+    from api import server
+    from api.load_test import stub_environment
+
+    with stub_environment(latency=0) as tmp:
+        job_queue._job_queue = JobQueue(tmp / "jobs.sqlite")
+        try:
+            with TestClient(server.app) as client:
+                response = client.post("/api/v1/jobs", json={"input_text": "Why focus beats hustle", "profile_name": "Load Test"})
+                assert response.status_code == 202
+                job_id = response.json()["job_id"]
+
+                job = job_queue._job_queue.wait(job_id, timeout=30)
+                body = client.get(f"/api/v1/jobs/{job_id}").json()
+                assert body["job"]["status"] == "succeeded", job["error"]
+                assert body["job"]["result"]["content"]
+                steps = {s["step"]: s["status"] for s in body["job"]["steps"]}
+                assert steps["generation"] == "complete" and steps["humanization"] == "complete"
+
+                assert client.get("/api/v1/jobs").json()["counts"]["succeeded"] == 1
+                assert client.get("/api/v1/jobs/missing").status_code == 404
+        finally:
+            job_queue._job_queue = None
+
+
+def test_jobs_of_this_owner_token_are_recovered():
+    """A job recorded as running under this process's token, but not running here, is requeued"""
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = make_queue(tmp)
+        job = queue.submit("example", {"topic": "focus"})
+        with queue._db:
+            queue._db.execute(
+                "UPDATE jobs SET status = 'running', attempts = 1, owner = ? WHERE id = ?", (queue.owner, job["id"])
+            )
+
+        assert queue.start() == 1
+        job = queue.wait(job["id"], timeout=5)
+        queue.shutdown()
+        assert job["status"] == "succeeded"
+
+
+if __name__ == "__main__":
+    test_job_progress_and_callback()
+    test_failed_job_callback_is_retried()
+    test_secrets_are_not_stored()
+    test_interrupted_jobs_are_requeued()
+    test_jobs_of_this_owner_token_are_recovered()
+    test_api_jobs_endpoints()
+    print("✅ Job queue tests complete!")
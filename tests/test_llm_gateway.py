@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Test the LLM gateway offline (stub and fake providers, no API keys)
+"""
+
+import asyncio
+import gc
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.llm_cache import LLMCache, fingerprint
+from core.llm_gateway import LLMGateway, LLMProvider, StubProvider
+from core.content_generator import ContentGenerator, GenerationConfig
+
+
+class TransientError(Exception):
+    status_code = 503
+
+
+class FlakyProvider(LLMProvider):
+    """Fails a number of times, then tracks how many calls overlap"""
+
+    name = "flaky"
+
+    def __init__(self, failures=0, error=TransientError, delay=0.0):
+        self.failures = failures
+        self.error = error
+        self.delay = delay
+        self.calls = 0
+        self.active = 0
+        self.peak = 0
+
+    def matches(self, model):
+        return model.startswith("flaky")
+
+    def complete(self, request):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error("temporarily unavailable")
+        return f"ok:{request.prompt}"
+
+    async def acomplete(self, request):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            return self.complete(request)
+        finally:
+            self.active -= 1
+
+
+def test_routing_and_override():
+    gateway = LLMGateway()
+    assert gateway.resolve("claude-haiku-4-5-20251001").name == "anthropic"
+    assert gateway.resolve("gpt-4o").name == "openai"
+    assert gateway.resolve("o3-mini").name == "openai"
+    assert gateway.resolve("ft:gpt-4o-mini:acme::abc123").name == "openai"
+    assert gateway.resolve("chatgpt-4o-latest").name == "openai"
+    assert gateway.resolve("stub").name == "stub"
+
+    for model in ("llama-3", "mistral-7b-o1-tuned"):
+        try:
+            gateway.resolve(model)
+            assert False, f"{model} must be rejected"
+        except ValueError:
+            pass
+
+    assert gateway.resolve("gpt-4o", provider="stub").name == "stub"
+
+    # Claude keeps the prompt-only request it had before the gateway
+    generator = ContentGenerator()
+    assert generator._system_prompt("anthropic") is None
+    assert generator._system_prompt("openai")
+
+
+def test_stub_is_deterministic():
+    gateway = LLMGateway()
+    first = gateway.complete("Write about focus", model="stub")
+    assert first == gateway.complete("Write about focus", model="stub")
+    assert first != gateway.complete("Write about trust", model="stub")
+    assert asyncio.run(gateway.acomplete("Write about focus", model="stub")) == first
+
+
+def test_transient_errors_are_retried():
+    gateway = LLMGateway(retries=3)
+    provider = FlakyProvider(failures=2)
+    gateway.register(provider)
+
+    # Keep the test fast
+    gateway._backoff = lambda attempt: 0
+    assert gateway.complete("hi", model="flaky") == "ok:hi"
+    assert provider.calls == 3
+    assert gateway.stats()["flaky"]["retries"] == 2
+
+
+def test_permanent_errors_are_not_retried():
+    gateway = LLMGateway(retries=3)
+    provider = FlakyProvider(failures=5, error=ValueError)
+    gateway.register(provider)
+
+    try:
+        gateway.complete("hi", model="flaky")
+        assert False, "ValueError should propagate"
+    except ValueError:
+        pass
+    assert provider.calls == 1
+    assert gateway.stats()["flaky"]["failures"] == 1
+
+
+def test_async_concurrency_limit():
+    gateway = LLMGateway()
+    provider = FlakyProvider(delay=0.02)
+    gateway.register(provider, concurrency=3)
+
+    async def fan_out():
+        return await asyncio.gather(*(gateway.acomplete(str(i), model="flaky") for i in range(12)))
+
+    results = asyncio.run(fan_out())
+    assert results == [f"ok:{i}" for i in range(12)]
+    assert provider.peak == 3
+
+    # Semaphores belong to their event loop and go away with it
+    for _ in range(5):
+        asyncio.run(fan_out())
+    gc.collect()
+    assert len(gateway._async_semaphores) <= 1
+
+
+def test_async_calls_overlap():
+    gateway = LLMGateway()
+    gateway.register(StubProvider(latency=0.05))
+
+    async def fan_out():
+        return await asyncio.gather(*(gateway.acomplete(str(i), model="stub") for i in range(20)))
+
+    start = time.perf_counter()
+    asyncio.run(fan_out())
+    assert time.perf_counter() - start < 0.5
+
+
+def test_response_cache_policy():
+    """Deterministic requests are cached; sampled ones only when asked"""
+    with tempfile.TemporaryDirectory() as tmp:
+        gateway = LLMGateway(cache=LLMCache(Path(tmp) / "cache.sqlite"))
+        provider = FlakyProvider()
+        gateway.register(provider)
+
+        for _ in range(3):
+            assert gateway.complete("hi", model="flaky", temperature=0) == "ok:hi"
+        assert provider.calls == 1
+
+        gateway.complete("hi", model="flaky", temperature=0.7)
+        gateway.complete("hi", model="flaky", temperature=0.7)
+        assert provider.calls == 3
+
+        gateway.complete("hi", model="flaky", temperature=0.7, use_cache=True)
+        gateway.complete("hi", model="flaky", temperature=0.7, use_cache=True)
+        assert asyncio.run(gateway.acomplete("hi", model="flaky", temperature=0.7, use_cache=True)) == "ok:hi"
+        assert provider.calls == 4
+
+        gateway.complete("hi", model="flaky", temperature=0, use_cache=False)
+        assert provider.calls == 5
+
+        stats = gateway.cache.stats()
+        assert stats["hits"] == 4 and stats["entries"] == 2
+
+
+def test_cache_ttl_and_lru_eviction():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = LLMCache(Path(tmp) / "cache.sqlite", max_entries=2)
+        keys = [fingerprint("stub", prompt, temperature=0) for prompt in "abc"]
+
+        cache.put(keys[0], "A")
+        cache.put(keys[1], "B")
+        time.sleep(0.01)
+        assert cache.get(keys[0]) == "A"   # a is now most recently used
+        cache.put(keys[2], "C")
+        assert cache.get(keys[1]) is None  # b was evicted
+        assert cache.get(keys[0]) == "A" and cache.get(keys[2]) == "C"
+
+        cache.ttl = 0
+        time.sleep(0.01)
+        assert cache.get(keys[0]) is None
+        assert cache.stats()["evictions"] == 1
+
+
+class BrokenStreamProvider(FlakyProvider):
+    """Streams two chunks, then fails with a transient error"""
+
+    def stream(self, request):
+        self.calls += 1
+        yield "partial "
+        yield "text"
+        raise TransientError("connection dropped")
+
+
+def test_stream_matches_complete():
+    gateway = LLMGateway()
+    chunks = list(gateway.stream("Write about focus", model="stub"))
+    assert len(chunks) > 1
+    assert "".join(chunks) == gateway.complete("Write about focus", model="stub")
+
+
+def test_stream_is_not_retried_after_output():
+    gateway = LLMGateway(retries=3)
+    provider = BrokenStreamProvider()
+    gateway.register(provider)
+    gateway._backoff = lambda attempt: 0
+
+    received = []
+    try:
+        for chunk in gateway.stream("hi", model="flaky"):
+            received.append(chunk)
+        assert False, "the error should reach the caller"
+    except TransientError:
+        pass
+    assert received == ["partial ", "text"]
+    assert provider.calls == 1
+
+
+def test_rate_limit_paces_requests():
+    gateway = LLMGateway()
+    provider = FlakyProvider()
+    gateway.register(provider, rate_per_minute=600)   # one request per 0.1s
+
+    start = time.perf_counter()
+    for i in range(4):
+        gateway.complete(str(i), model="flaky")
+    elapsed = time.perf_counter() - start
+
+    assert 0.28 < elapsed < 0.6
+    stats = gateway.stats()["flaky"]
+    assert stats["throttled"] == 3 and stats["rate_per_minute"] == 600
+
+
+class FormatProvider(FlakyProvider):
+    """Echoes prompts, fails Twitter ones and tracks overlapping calls"""
+
+    def complete(self, request):
+        with self.guard:
+            self.calls += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            if "twitter" in request.prompt.lower():
+                raise ValueError("rejected")
+            return f"ok:{request.prompt[-40:]}"
+        finally:
+            with self.guard:
+                self.active -= 1
+
+
+def test_multi_format_fan_out():
+    """Formats run concurrently, match serial output and fail independently"""
+    import threading
+
+    provider = FormatProvider(delay=0.05)
+    provider.guard = threading.Lock()
+    generator = ContentGenerator(default_model="flaky")
+    generator.gateway = LLMGateway()
+    generator.gateway.register(provider)
+    voice = {"metadata": {"name": "Test Voice"}}
+
+    formats = ["article", "linkedin", "twitter", "email", "faq"]
+    results = generator.generate_multi_format("Why focus beats hustle", voice, formats, max_concurrency=2)
+
+    assert list(results) == formats
+    assert results["twitter"] == {"format": "twitter", "error": "Flaky generation failed: rejected"}
+    assert provider.peak == 2
+
+    serial = generator.generate("Why focus beats hustle", voice, config=GenerationConfig(format="linkedin"))
+    assert results["linkedin"]["content"] == serial["content"]
+    assert results["linkedin"]["metadata"] == serial["metadata"]
+
+
+def test_prompt_context_parts_are_computed_once_on_use():
+    generator = ContentGenerator(default_model="stub")
+    calls = []
+    extract_keywords = generator._extract_keywords_from_brief
+    generator._knowledge_context = lambda brief: calls.append("knowledge") or "Framework: focus"
+    generator._extract_keywords_from_brief = lambda brief: calls.append("keywords") or extract_keywords(brief)
+
+    brief = "Why focus beats hustle"
+    context = generator._prompt_context(brief, {"metadata": {"name": "Test Voice"}}, None)
+    assert calls == []      # Nothing computed up front (the ELITE prompt uses neither)
+
+    for fmt in ("article", "linkedin", "email"):
+        prompt = generator._create_prompt(context["blended_style"], brief, GenerationConfig(format=fmt), context)
+        assert "Framework: focus" in prompt
+    assert sorted(calls) == ["keywords", "knowledge"]
+
+
+if __name__ == "__main__":
+    test_routing_and_override()
+    test_stub_is_deterministic()
+    test_transient_errors_are_retried()
+    test_permanent_errors_are_not_retried()
+    test_async_concurrency_limit()
+    test_async_calls_overlap()
+    test_response_cache_policy()
+    test_cache_ttl_and_lru_eviction()
+    test_stream_matches_complete()
+    test_stream_is_not_retried_after_output()
+    test_rate_limit_paces_requests()
+    test_multi_format_fan_out()
+    test_prompt_context_parts_are_computed_once_on_use()
+    print("✅ LLM gateway tests complete!")
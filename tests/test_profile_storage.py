@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Test profile storage indexes without requiring API keys
+"""
+
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.atomic_io import atomic_write
+from core.profile_cache import ProfileCache
+from core.profile_manifest import ProfileManifest
+from core.profile_store import read_profile, vcp_sections
+from core.voice_profiler import ProfileVersionConflict, VoiceProfiler
+
+
+def write_profile(path, name, sample_count):
+    with open(path, 'w') as f:
+        json.dump({
+            "metadata": {"name": name, "tags": ["test"]},
+            "llm_analysis": {"samples_analyzed": sample_count, "notes": "x" * 1000}
+        }, f)
+
+
+def test_manifest_lists_and_self_heals():
+    """Listing reflects saves, deletes and files changed behind its back"""
+    with tempfile.TemporaryDirectory() as tmp:
+        profiler = VoiceProfiler(profiles_dir=tmp)
+        profiler.create_profile("Saved", ["One sentence here. Another one there."])
+        write_profile(Path(tmp) / "external.json", "External", 4)
+        (Path(tmp) / "broken.json").write_text("{")
+
+        names = {profile["name"] for profile in profiler.list_profiles()}
+        assert names == {"Saved", "External"}
+
+        # Edited outside VoiceProfiler: picked up by mtime/size
+        write_profile(Path(tmp) / "external.json", "External v2", 7)
+        assert profiler.delete_profile("Saved")
+        assert not profiler.delete_profile("Saved")
+
+        listed = VoiceProfiler(profiles_dir=tmp).list_profiles()
+        assert [(p["name"], p["sample_count"]) for p in listed] == [("External v2", 7)]
+
+        # A fresh manifest needs no profile reads when nothing changed
+        assert not ProfileManifest(tmp).sync()
+
+
+def test_profile_cache_invalidates_on_change():
+    """Cached profiles are private copies and reload when the file changes"""
+    cache = ProfileCache(max_entries=1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "voice.json"
+        other = Path(tmp) / "other.json"
+        write_profile(path, "Voice", 1)
+        write_profile(other, "Other", 1)
+
+        first = cache.get(path)
+        first["metadata"]["name"] = "Mutated"
+        assert cache.get(path)["metadata"]["name"] == "Voice"
+        assert cache.stats()["hits"] == 1
+
+        write_profile(path, "Voice v2", 2)
+        assert cache.get(path)["metadata"]["name"] == "Voice v2"
+
+        # Bounded: loading another profile evicts the least recently used
+        cache.get(other)
+        assert cache.stats()["entries"] == 1
+        assert cache.stats()["misses"] == 3
+
+        path.unlink()
+        assert cache.get(path) is None
+
+
+def test_compact_profiles_load_sections_lazily():
+    """Compact profiles round-trip and load single sections through VoiceProfiler"""
+    with tempfile.TemporaryDirectory() as tmp:
+        profiler = VoiceProfiler(profiles_dir=tmp, storage_format="vcp")
+        created = profiler.create_profile("Compact", ["One sentence here. Another one there!"] * 4)
+        created["llm_analysis"] = {"guide": "long free text " * 1000}
+        profiler.save_profile("Compact", created)
+
+        path = Path(tmp) / "compact.vcp"
+        assert "samples.excerpts" in vcp_sections(path)
+        assert read_profile(path) == created
+
+        partial = profiler.load_profile("Compact", sections=["metadata", "samples"])
+        assert set(partial) == {"metadata", "samples"}
+        assert "excerpts" not in partial["samples"]
+        assert profiler.verify_content("Compact", "One sentence here.")["match_score"] > 0
+
+        # Switching back to JSON replaces the compact file
+        VoiceProfiler(profiles_dir=tmp, storage_format="json").save_profile("Compact", created)
+        assert not path.exists()
+        assert VoiceProfiler(profiles_dir=tmp).load_profile("Compact") == created
+
+
+def append_sample(profiles_dir, index):
+    VoiceProfiler(profiles_dir=profiles_dir).update_profile(
+        "Shared", [f"Appended sample number {index}. It has two sentences."]
+    )
+
+
+def test_concurrent_appends_serialize():
+    """Appends from several processes are all kept, each bumping the version"""
+    with tempfile.TemporaryDirectory() as tmp:
+        profiler = VoiceProfiler(profiles_dir=tmp)
+        profiler.create_profile("Shared", ["The first sample. It is short."])
+
+        workers = [multiprocessing.Process(target=append_sample, args=(tmp, i)) for i in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        profile = VoiceProfiler(profiles_dir=tmp).load_profile("Shared")
+        assert profile["samples"]["count"] == 5
+        assert profile["metadata"]["version"] == "1.4"
+        assert [p["sample_count"] for p in VoiceProfiler(profiles_dir=tmp).list_profiles()] == [5]
+
+
+def test_stale_save_is_rejected():
+    """Saving changes based on an outdated version raises a conflict"""
+    with tempfile.TemporaryDirectory() as tmp:
+        profiler = VoiceProfiler(profiles_dir=tmp)
+        profiler.create_profile("Voice", ["A sample. Another sentence."])
+
+        first = profiler.load_profile("Voice")
+        second = profiler.load_profile("Voice")
+        profiler.save_profile("Voice", first, expected_version="1.0")
+
+        try:
+            profiler.save_profile("Voice", second, expected_version="1.0")
+        except ProfileVersionConflict:
+            return
+        raise AssertionError("Stale save was accepted")
+
+
+def test_atomic_write_keeps_permissions():
+    """Rewrites keep the file's mode; new files follow the umask like open()"""
+    with tempfile.TemporaryDirectory() as tmp:
+        umask = os.umask(0o022)
+        try:
+            created = Path(tmp) / "created.json"
+            atomic_write(created, b"{}")
+            assert os.stat(created).st_mode & 0o777 == 0o644
+
+            shared = Path(tmp) / "shared.json"
+            shared.write_text("{}")
+            os.chmod(shared, 0o664)
+            atomic_write(shared, b"{}")
+            assert os.stat(shared).st_mode & 0o777 == 0o664
+        finally:
+            os.umask(umask)
+
+
+if __name__ == "__main__":
+    test_manifest_lists_and_self_heals()
+    test_profile_cache_invalidates_on_change()
+    test_compact_profiles_load_sections_lazily()
+    test_concurrent_appends_serialize()
+    test_stale_save_is_rejected()
+    test_atomic_write_keeps_permissions()
+    print("✅ Profile storage tests complete!")
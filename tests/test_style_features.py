@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Test compiled style feature extraction without requiring API keys
+"""
+
+import re
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.style_features import DEFAULT_LEXICONS, FeatureExtractor, normalize_lexicons
+from core.style_tokenizer import tokenize
+from core.voice_profiler import VoiceProfiler
+
+SAMPLES_DIR = Path(__file__).parent.parent / "data" / "samples"
+
+
+def load_samples():
+    return [path.read_text(encoding="utf-8") for path in sorted(SAMPLES_DIR.glob("*.md"))]
+
+
+def test_counts_match_per_pattern_scans():
+    """Combined lookups give the same counts as one scan per lexicon and pattern"""
+    extractor = FeatureExtractor()
+    contrast_patterns = [r'\bnot\b.*\bbut\b', r'\binstead\b', r'\bhowever\b', r'\byet\b']
+
+    for sample in load_samples():
+        doc = tokenize(sample)
+        expected = {
+            category: sum(1 for word in doc.bare_words if word in words)
+            for category, words in DEFAULT_LEXICONS.items()
+        }
+        assert extractor.lexicon_counts(doc) == expected
+        assert extractor.contrast_count(doc) == sum(
+            len(re.findall(pattern, doc.lowered)) for pattern in contrast_patterns
+        )
+
+
+def test_custom_lexicons_extend_defaults():
+    """Profile lexicons add words on top of the built-in categories"""
+    doc = tokenize("Our pipeline is proven. Pipeline reviews happen today.")
+    base = FeatureExtractor().lexicon_counts(doc)
+    custom = FeatureExtractor({"power_words": ["Pipeline"]}).lexicon_counts(doc)
+
+    assert custom["power_words"] == base["power_words"] + 2
+    assert custom["urgency_words"] == base["urgency_words"]
+
+
+def test_unknown_lexicon_category_rejected():
+    try:
+        normalize_lexicons({"filler_words": ["um"]})
+    except ValueError:
+        return
+    raise AssertionError("Unknown lexicon category was accepted")
+
+
+def test_profile_keeps_lexicons_on_append():
+    """Lexicons are stored with the profile and reused when appending samples"""
+    samples = load_samples()
+    lexicons = {"power_words": ["sales", "process"]}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        profiler = VoiceProfiler(profiles_dir=tmp)
+        full = profiler.create_profile("Full", samples, lexicons=lexicons)
+
+        profiler.create_profile("Appended", samples[:6], lexicons=lexicons)
+        appended = profiler.update_profile("Appended", samples[6:], append=True)
+
+    assert appended["lexicons"] == {"power_words": ["process", "sales"]}
+    assert appended["statistics"]["lexicon_counts"] == full["statistics"]["lexicon_counts"]
+
+
+if __name__ == "__main__":
+    test_counts_match_per_pattern_scans()
+    test_custom_lexicons_extend_defaults()
+    test_unknown_lexicon_category_rejected()
+    test_profile_keeps_lexicons_on_append()
+    print("✅ Style feature tests complete!")
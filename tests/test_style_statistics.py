@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Test mergeable style statistics without requiring API keys
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.style_analyzer import StyleAnalyzer
+from core.style_statistics import StyleStatistics
+from core.voice_profiler import VoiceProfiler
+
+SAMPLES_DIR = Path(__file__).parent.parent / "data" / "samples"
+
+
+def load_samples():
+    return [path.read_text(encoding="utf-8") for path in sorted(SAMPLES_DIR.glob("*.md"))]
+
+
+def test_merged_statistics_match_full_analysis():
+    """Merging statistics of sample subsets gives the full-corpus profile"""
+    analyzer = StyleAnalyzer()
+    samples = load_samples()
+    full = analyzer.analyze_samples(samples, "Test").to_dict()
+
+    for split in (1, 4, len(samples) - 1):
+        statistics = analyzer.collect_statistics(samples[split:])
+        statistics.merge(analyzer.collect_statistics(samples[:split]))
+        merged = analyzer.profile_from_statistics(statistics, "Test").to_dict()
+        assert merged == full, f"Mismatch when splitting at {split}"
+
+
+def test_parallel_statistics_match_serial():
+    """Sharding samples across worker processes gives the serial result"""
+    analyzer = StyleAnalyzer()
+    samples = load_samples()
+    serial = analyzer.analyze_samples(samples, "Test")
+    parallel = analyzer.profile_from_statistics(
+        analyzer.collect_statistics(samples, workers=2, shard_size=3), "Test"
+    )
+    assert parallel == serial
+
+
+def test_statistics_round_trip():
+    """Statistics survive serialization to profile JSON"""
+    analyzer = StyleAnalyzer()
+    statistics = analyzer.collect_statistics(load_samples()[:3])
+    restored = StyleStatistics.from_dict(statistics.to_dict())
+    assert restored == statistics
+
+
+def test_update_profile_appends():
+    """Appending samples matches a profile created from all samples"""
+    samples = load_samples()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        profiler = VoiceProfiler(profiles_dir=tmp)
+        full = profiler.create_profile("Full", samples)
+
+        profiler.create_profile("Appended", samples[:6])
+        appended = profiler.update_profile("Appended", samples[6:], append=True)
+
+    full["style"]["name"] = appended["style"]["name"]
+    assert appended["style"] == full["style"]
+    assert appended["samples"]["count"] == len(samples)
+
+
+if __name__ == "__main__":
+    test_merged_statistics_match_full_analysis()
+    test_parallel_statistics_match_serial()
+    test_statistics_round_trip()
+    test_update_profile_appends()
+    print("✅ Style statistics tests complete!")
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Test vectorized style similarity without requiring API keys
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+
+from core.style_analyzer import StyleAnalyzer
+from core.profile_index import ProfileIndex
+from core.style_vectors import SECTION_NAMES, section_similarities, similarity_matrix, vectorize_style
+from core.voice_profiler import VoiceProfiler
+
+SAMPLES_DIR = Path(__file__).parent.parent / "data" / "samples"
+
+
+def dict_similarity(dict1, dict2):
+    """Reference key-by-key relative difference similarity"""
+    differences = []
+    for key in set(dict1) & set(dict2):
+        val1, val2 = dict1[key], dict2[key]
+        if val1 == 0 and val2 == 0:
+            differences.append(0)
+        elif val1 == 0 or val2 == 0:
+            differences.append(1)
+        else:
+            differences.append(abs(val1 - val2) / max(abs(val1), abs(val2)))
+    if not differences:
+        return 0.0
+    return 1 - min(sum(differences) / len(differences), 1)
+
+
+def load_styles():
+    analyzer = StyleAnalyzer()
+    paths = sorted(SAMPLES_DIR.glob("*.md"))
+    texts = [path.read_text(encoding="utf-8") for path in paths] + ["Short.", ""]
+    return [analyzer.analyze_samples([text], "Test").to_dict() for text in texts]
+
+
+def test_vectorized_matches_dict_comparison():
+    """Vectorized section scores equal the key-by-key comparison"""
+    styles = load_styles()
+    vectors = np.vstack([vectorize_style(style) for style in styles])
+    scores = section_similarities(vectors, vectors)
+
+    for i, style1 in enumerate(styles):
+        for j, style2 in enumerate(styles):
+            for k, section in enumerate(SECTION_NAMES):
+                expected = dict_similarity(style1[section], style2[section])
+                assert abs(scores[i, j, k] - expected) < 1e-12, (i, j, section)
+
+
+def test_similarity_matrix_is_symmetric():
+    vectors = np.vstack([vectorize_style(style) for style in load_styles()[:10]])
+    matrix = similarity_matrix(vectors)
+
+    assert matrix.shape == (10, 10)
+    assert np.allclose(matrix, matrix.T)
+    assert np.allclose(np.diag(matrix), 1.0)
+
+
+def test_nearest_voices_match_full_scan():
+    """Index lookups rank profiles like scoring every profile, and persist"""
+    texts = [path.read_text(encoding="utf-8") for path in sorted(SAMPLES_DIR.glob("*.md"))]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        profiler = VoiceProfiler(profiles_dir=tmp)
+        profiler.create_profile("A", texts[:4])
+        profiler.create_profile("B", texts[4:8])
+        profiler.create_profile("C", texts[8:])
+
+        scanned = profiler.compare_to_profiles(texts[0])
+        nearest = profiler.nearest_voices(texts[0], k=2)
+        assert [result["name"] for result in nearest] == [result["name"] for result in scanned[:2]]
+
+        reloaded = ProfileIndex(tmp)
+        assert not reloaded.sync()
+        assert "A" not in [result["name"] for result in profiler.nearest_to_profile("A", k=3)]
+
+
+def test_verify_batch_matches_single_verification():
+    """Batch scores equal one verify_content call per draft, serial or parallel"""
+    texts = [path.read_text(encoding="utf-8") for path in sorted(SAMPLES_DIR.glob("*.md"))]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        profiler = VoiceProfiler(profiles_dir=tmp)
+        profiler.create_profile("A", texts[:4])
+
+        drafts = texts[4:] + ["Short."]
+        expected = [profiler.verify_content("A", draft) for draft in drafts]
+
+        report = profiler.verify_batch("A", drafts)
+        assert report["results"] == expected
+        assert report["match_scores"] == [result["match_score"] for result in expected]
+        assert report["summary"]["count"] == len(drafts)
+
+        parallel = profiler.verify_batch("A", drafts * 3, workers=2)
+        assert parallel["results"] == expected * 3
+
+
+if __name__ == "__main__":
+    test_vectorized_matches_dict_comparison()
+    test_similarity_matrix_is_symmetric()
+    test_nearest_voices_match_full_scan()
+    test_verify_batch_matches_single_verification()
+    print("✅ Style vector tests complete!")
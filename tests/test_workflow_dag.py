@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Test the workflow step DAG and the post-generation timeline (stub LLM, no API keys)
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.workflow_dag import Step, StepSkipped, WorkflowDAG
+
+
+def sleeper(seconds, value=None):
+    def run(results):
+        time.sleep(seconds)
+        return value
+    return run
+
+
+def test_independent_steps_run_concurrently():
+    dag = WorkflowDAG([
+        Step("source", lambda results: "text"),
+        Step("a", sleeper(0.2, "a"), depends_on=("source",)),
+        Step("b", sleeper(0.2, "b"), depends_on=("source",)),
+        Step("c", lambda results: results["a"] + results["b"], depends_on=("a", "b")),
+    ])
+
+    start = time.perf_counter()
+    results, timeline = dag.run()
+    assert time.perf_counter() - start < 0.35
+    assert results["c"] == "ab"
+    assert [entry["step"] for entry in timeline] == ["source", "a", "b", "c"]
+    assert all(entry["status"] == "complete" and entry["started_at"] for entry in timeline)
+    assert timeline[1]["duration"] >= 0.2
+
+
+def test_timeouts_failures_and_skips():
+    def broken(results):
+        raise RuntimeError("boom")
+
+    def nothing_to_do(results):
+        raise StepSkipped("not configured")
+
+    dag = WorkflowDAG([
+        Step("slow", sleeper(2), timeout=0.1, optional=True),
+        Step("broken", broken, optional=True),
+        Step("after_broken", sleeper(0), depends_on=("broken",)),
+        Step("unconfigured", nothing_to_do, optional=True),
+        Step("after_unconfigured", sleeper(0, "ran"), depends_on=("unconfigured",)),
+    ])
+
+    start = time.perf_counter()
+    results, timeline = dag.run()
+    assert time.perf_counter() - start < 1
+    statuses = {entry["step"]: entry["status"] for entry in timeline}
+    assert statuses == {
+        "slow": "timeout",
+        "broken": "failed",
+        "after_broken": "skipped",
+        "unconfigured": "skipped",
+        "after_unconfigured": "complete"
+    }
+    assert results["after_unconfigured"] == "ran"
+
+    try:
+        WorkflowDAG([Step("required", broken)]).run()
+        assert False, "a failed required step should fail the run"
+    except RuntimeError as e:
+        assert str(e) == "boom"
+
+    try:
+        WorkflowDAG([Step("a", broken, depends_on=("b",)), Step("b", broken, depends_on=("a",))])
+        assert False, "cycles should be rejected"
+    except ValueError:
+        pass
+
+
+def test_timed_out_steps_are_told_to_stop():
+    acted = []
+    stopped = threading.Event()
+
+    def publish(results, cancelled):
+        time.sleep(0.2)
+        if cancelled.is_set():
+            stopped.set()
+            return None
+        acted.append("published")
+
+    dag = WorkflowDAG([Step("publish", publish, timeout=0.05, optional=True, cancellable=True)])
+    results, timeline = dag.run()
+    assert timeline[0]["status"] == "timeout" and "publish" not in results
+    assert stopped.wait(1) and acted == []
+
+
+def test_timed_out_workflow_step_is_not_checkpointed():
+    from api.load_test import stub_environment
+    from core.workflow_automation import ContentWorkflow
+    from core.workflow_dag import StepTimeout
+    from core.workflow_runs import get_run_journal
+
+    with stub_environment(latency=0):
+        workflow = ContentWorkflow("Load Test", step_timeouts={"humanization": 0.05})
+        humanize = workflow.humanizer.humanize
+        finished = threading.Event()
+
+        def slow(**kwargs):
+            time.sleep(0.2)
+            try:
+                return humanize(**kwargs)
+            finally:
+                finished.set()
+
+        workflow.humanizer.humanize = slow
+        try:
+            workflow.process_input("Why focus beats hustle", output_format="linkedin", run_id="slow-run")
+            assert False, "the humanization timeout should fail the run"
+        except StepTimeout:
+            pass
+
+        assert finished.wait(2)
+        time.sleep(0.05)
+        assert "humanization" not in get_run_journal().get("slow-run")["checkpoints"]
+
+
+def test_late_publish_does_not_change_the_result():
+    from api.load_test import stub_environment
+    from core.workflow_automation import ContentWorkflow
+
+    with stub_environment(latency=0):
+        workflow = ContentWorkflow("Load Test", step_timeouts={"publishing": 0.05})
+        published = threading.Event()
+
+        def slow_publish(**kwargs):
+            time.sleep(0.2)
+            published.set()
+            return {"success": True, "url": "https://example.com/late"}
+
+        workflow._publish = slow_publish
+        result = workflow.process_input(
+            "Why focus beats hustle", output_format="linkedin", auto_publish=True, publish_config={"destination": "file"}
+        )
+        assert published.wait(1)
+        time.sleep(0.05)
+        assert result["publish_result"]["success"] is False
+        assert "url" not in result["publish_result"]
+
+
+def test_workflow_timeline_has_every_step():
+    from api.load_test import stub_environment
+    from core.workflow_automation import ContentWorkflow
+
+    with stub_environment(latency=0.02) as tmp:
+        workflow = ContentWorkflow("Load Test")
+        result = workflow.process_input(
+            "Why focus beats hustle",
+            output_format="linkedin",
+            auto_publish=True,
+            publish_config={"destination": "file", "file_path": str(tmp / "published.md")}
+        )
+
+    steps = {entry["step"]: entry for entry in result["steps"]}
+    assert list(steps) == [
+        "input_processing", "generation", "humanization", "saving", "notion", "aitable", "publishing"
+    ]
+    assert steps["generation"]["duration"] >= 0.02
+    assert steps["humanization"]["result"] == result["final_content"]
+    assert steps["saving"]["status"] == "complete"
+    assert steps["notion"]["status"] == "skipped"
+    assert result["publish_result"]["success"]
+    assert Path(result["publish_result"]["file_path"]).name == "published.md"
+    assert all("duration" in entry for entry in result["steps"])
+
+
+if __name__ == "__main__":
+    test_independent_steps_run_concurrently()
+    test_timeouts_failures_and_skips()
+    test_timed_out_steps_are_told_to_stop()
+    test_timed_out_workflow_step_is_not_checkpointed()
+    test_late_publish_does_not_change_the_result()
+    test_workflow_timeline_has_every_step()
+    print("✅ Workflow DAG tests complete!")
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Test the per-profile workflow pool (no API keys, no real workflows)
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.humanizer import humanizer_prompt_path
+from core.workflow_pool import WorkflowPool
+
+
+class CountingFactory:
+    """Stands in for ContentWorkflow and counts builds per profile"""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.builds = []
+
+    def __call__(self, profile_name):
+        time.sleep(self.delay)
+        self.builds.append(profile_name)
+        return object()
+
+
+def in_scratch_dir(test):
+    """Run a test from an empty working directory (profiles and prompts are cwd-relative)"""
+    def run():
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            try:
+                test()
+            finally:
+                os.chdir(cwd)
+    run.__name__ = test.__name__
+    return run
+
+
+@in_scratch_dir
+def test_workflows_are_reused_and_built_once():
+    factory = CountingFactory(delay=0.05)
+    pool = WorkflowPool(factory=factory)
+
+    workflows = []
+    threads = [threading.Thread(target=lambda: workflows.append(pool.get("Voice"))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert factory.builds == ["Voice"]
+    assert all(workflow is workflows[0] for workflow in workflows)
+    assert pool.get("Voice") is workflows[0]
+    assert pool.stats()["hits"] == 8
+
+
+@in_scratch_dir
+def test_changed_files_rebuild_the_workflow():
+    factory = CountingFactory()
+    pool = WorkflowPool(factory=factory)
+    first = pool.get("Voice")
+
+    prompt_path = humanizer_prompt_path("Voice")
+    prompt_path.parent.mkdir(parents=True)
+    prompt_path.write_text("Rewrite naturally.")
+    second = pool.get("Voice")
+    assert second is not first
+    assert pool.get("Voice") is second
+
+    profile_path = pool.profiler._get_profile_path("Voice")
+    profile_path.write_text("{}")
+    assert pool.get("Voice") is not second
+    assert pool.stats()["invalidations"] == 2
+
+
+@in_scratch_dir
+def test_least_recently_used_profiles_are_dropped():
+    factory = CountingFactory()
+    pool = WorkflowPool(max_profiles=2, factory=factory)
+
+    pool.get("A")
+    pool.get("B")
+    pool.get("A")
+    pool.get("C")
+    assert pool.stats()["profiles"] == ["A", "C"]
+    pool.get("B")
+    assert factory.builds == ["A", "B", "C", "B"]
+
+
+if __name__ == "__main__":
+    test_workflows_are_reused_and_built_once()
+    test_changed_files_rebuild_the_workflow()
+    test_least_recently_used_profiles_are_dropped()
+    print("✅ Workflow pool tests complete!")
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Test checkpointed, resumable workflow runs (stub LLM, no API keys)
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from api.load_test import stub_environment
+from core.llm_gateway import get_llm_gateway
+from core.process_owner import owner_alive, owner_id
+from core.workflow_automation import ContentWorkflow
+from core.workflow_runs import get_run_journal, resume_run
+
+
+def stub_calls() -> int:
+    return get_llm_gateway().stats()["stub"]["calls"]
+
+
+def test_failed_humanization_resumes_without_regenerating():
+    with stub_environment(latency=0):
+        workflow = ContentWorkflow("Load Test")
+        humanize = workflow.humanizer.humanize
+
+        def unavailable(**kwargs):
+            raise RuntimeError("humanizer unavailable")
+
+        workflow.humanizer.humanize = unavailable
+        try:
+            workflow.process_input("Why focus beats hustle", output_format="linkedin", run_id="run-1")
+            assert False, "the humanization failure should surface"
+        except RuntimeError:
+            pass
+
+        run = get_run_journal().get("run-1")
+        assert run["status"] == "failed"
+        assert run["error"] == "humanizer unavailable"
+        assert run["steps"] == ["generation", "input_processing"]
+
+        workflow.humanizer.humanize = humanize
+        calls = stub_calls()
+        result = resume_run("run-1", workflow_factory=lambda profile_name: workflow)
+
+        assert stub_calls() - calls == 1     # humanization only
+        statuses = {step["step"]: step["status"] for step in result["steps"]}
+        assert statuses["input_processing"] == statuses["generation"] == "restored"
+        assert statuses["humanization"] == statuses["saving"] == "complete"
+        assert result["final_content"] and result["run_id"] == "run-1"
+        assert get_run_journal().get("run-1")["status"] == "complete"
+
+
+def test_completed_sinks_are_not_repeated():
+    with stub_environment(latency=0) as tmp:
+        workflow = ContentWorkflow("Load Test")
+        published = tmp / "published.md"
+        first = workflow.process_input(
+            "Pricing for experts",
+            output_format="linkedin",
+            auto_publish=True,
+            publish_config={"destination": "file", "file_path": str(published), "github_token": "secret"},
+            run_id="run-2"
+        )
+        published.unlink()
+
+        calls = stub_calls()
+        again = resume_run("run-2", workflow_factory=lambda profile_name: workflow)
+        assert stub_calls() == calls
+        assert not published.exists()
+        assert again["final_content"] == first["final_content"]
+        assert again["publish_result"] == first["publish_result"]
+        statuses = {step["step"]: step["status"] for step in again["steps"]}
+        assert statuses["generation"] == statuses["humanization"] == "restored"
+        assert statuses["saving"] == statuses["publishing"] == "restored"
+
+        meta = json.loads((tmp / "data" / "runs" / "run-2" / "run.json").read_text())
+        assert "github_token" not in meta["params"]["publish_config"]
+
+
+def test_runs_of_dead_processes_are_interrupted():
+    with stub_environment(latency=0) as tmp:
+        workflow = ContentWorkflow("Load Test")
+        workflow.process_input("Hiring your first salesperson", output_format="twitter", run_id="run-3")
+
+        meta_path = tmp / "data" / "runs" / "run-3" / "run.json"
+        meta = json.loads(meta_path.read_text())
+        host, pid, started = meta["owner"].split(":")
+        meta.update(status="running", owner=f"{host}:999999999:{started}")
+        meta_path.write_text(json.dumps(meta))
+
+        runs = get_run_journal().list()
+        assert [run["run_id"] for run in runs] == ["run-3"]
+        assert runs[0]["status"] == "interrupted"
+        assert get_run_journal().list(status="failed") == []
+
+
+def test_owner_tokens_tell_restarted_processes_apart():
+    host, pid, started = owner_id().split(":")
+    assert owner_alive(owner_id())
+    # Same host and pid but another start time: the process before a container restart
+    assert not owner_alive(f"{host}:{pid}:{started}0")
+    assert not owner_alive(f"{host}:999999999:{started}")
+    assert owner_alive(f"elsewhere.example:{pid}:{started}")
+    assert not owner_alive(None)
+
+
+if __name__ == "__main__":
+    test_failed_humanization_resumes_without_regenerating()
+    test_completed_sinks_are_not_repeated()
+    test_runs_of_dead_processes_are_interrupted()
+    test_owner_tokens_tell_restarted_processes_apart()
+    print("✅ Workflow run tests complete!")